@@ -4,13 +4,41 @@ class Config:
     # File upload configuration
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
     UPLOAD_FOLDER = 'uploads'
-    ALLOWED_EXTENSIONS = {'csv', 'txt'}
+    ALLOWED_EXTENSIONS = {'csv', 'txt', 'npy'}
     
     # Report generation
     REPORTS_FOLDER = 'reports'
     
     # Application settings
     HUNGARIAN_MAX_MATRIX_SIZE = 1000
+    # Matriks lebih besar dari ini diselesaikan dengan engine 'jv' oleh /api/solve
+    HUNGARIAN_CLASSIC_MAX_SIZE = 50
+    # Level trace default untuk /api/solve ('none', 'summary', atau 'full')
+    HUNGARIAN_API_TRACE = 'summary'
+    # Jumlah proses bidding untuk engine 'auction'
+    HUNGARIAN_AUCTION_WORKERS = int(os.environ.get('HUNGARIAN_AUCTION_WORKERS', os.cpu_count() or 1))
+    # Jumlah proses untuk menyelesaikan komponen terhubung input sparse secara paralel
+    HUNGARIAN_SPARSE_WORKERS = int(os.environ.get('HUNGARIAN_SPARSE_WORKERS', os.cpu_count() or 1))
+    # Thread pool dan jumlah job yang disimpan untuk /api/jobs
+    HUNGARIAN_JOB_WORKERS = int(os.environ.get('HUNGARIAN_JOB_WORKERS', 2))
+    HUNGARIAN_JOB_MAX = 100
+    # Jumlah langkah yang boleh menunggu di antrian stream SSE sebelum solver ditahan
+    HUNGARIAN_STREAM_QUEUE = 16
+    # Batas memori (byte) dan umur (detik) cache hasil bersama /api/solve dan /api/get_steps
+    HUNGARIAN_RESULT_CACHE_BYTES = int(os.environ.get('HUNGARIAN_RESULT_CACHE_BYTES', 64 * 1024 * 1024))
+    HUNGARIAN_RESULT_CACHE_TTL = 600
+    # Penyimpanan hasil di balik calculation_id: batas memori (byte), lalu entri lama dipindah ke disk
+    HUNGARIAN_STORE_BYTES = int(os.environ.get('HUNGARIAN_STORE_BYTES', 32 * 1024 * 1024))
+    # Induk direktori spill privat per proses (kosong berarti direktori temp sistem)
+    HUNGARIAN_STORE_DIR = os.environ.get('HUNGARIAN_STORE_DIR')
+    HUNGARIAN_STORE_MAX_SPILLED = 1000
+    # Batas memori (byte) cache PNG /api/heatmap
+    HUNGARIAN_HEATMAP_CACHE_BYTES = int(os.environ.get('HUNGARIAN_HEATMAP_CACHE_BYTES', 32 * 1024 * 1024))
+    # Batas k untuk /api/solve_k_best
+    HUNGARIAN_K_BEST_MAX = 100
+    # Time budget default (ms) untuk /api/solve dengan engine 'classic'/'jv'; kosong berarti tanpa batas
+    HUNGARIAN_API_TIME_BUDGET_MS = (float(os.environ['HUNGARIAN_API_TIME_BUDGET_MS'])
+                                    if os.environ.get('HUNGARIAN_API_TIME_BUDGET_MS') else None)
 
 class DevelopmentConfig(Config):
     DEBUG = True
@@ -1,6 +1,34 @@
 import numpy as np
 import copy
-from typing import List, Tuple, Optional, Dict, Any
+import heapq
+import json
+import time
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Tuple, Optional, Dict, Any, Callable
+
+# Engine yang tersedia untuk HungarianMethod.solve
+ENGINES = ('classic', 'jv', 'auction')
+
+# Level trace langkah: tanpa langkah, ringkasan tanpa matriks, atau matriks lengkap
+TRACE_LEVELS = ('none', 'summary', 'full')
+
+# Tipe data matriks kerja: 'auto' memilih integer jika semua biaya bulat
+DTYPES = ('auto', 'float64', 'float32', 'int64', 'int32')
+
+# Objektif: jumlah biaya (min-sum) atau biaya assignment terburuk (bottleneck, min-max)
+OBJECTIVES = ('sum', 'bottleneck')
+
+# Jumlah maksimum pesan error per jenis kesalahan validasi; sisanya diringkas
+MAX_VALIDATION_ERRORS = 10
+
+# Jumlah maksimum putaran perbaikan 2-opt pada mode approximate
+APPROX_MAX_ROUNDS = 5
+
+# Kunci langkah trace 'full' yang tidak ada pada trace 'summary' (lihat _log_step)
+STEP_DELTA_KEYS = frozenset({'op', 'matrix', 'value', 'rows', 'cols', 'row_offsets',
+                             'col_offsets', 'row_cover', 'col_cover'})
 
 class HungarianMethod:
     """
@@ -17,41 +45,182 @@ class HungarianMethod:
         self.is_maximization = False
         self.dummy_rows = 0
         self.dummy_cols = 0
+        self.original_shape = None
+        self.trace = 'full'
+        self.duals = None
+        self.zero_tol = 0
+        self.objective = 'sum'
+        self.bottleneck_value = None
+        self.input_overwritten = False
+        self.max_val = None
+        self.deadline = None
+        self.timed_out = False
+        self.dual_bound = None
+        # Progress solve yang sedang berjalan (dibaca thread lain, lihat JobManager)
+        self.progress = {'iterations': 0, 'covered_lines': None}
+        self.on_step = None
         
-    def solve(self, matrix: List[List[float]], maximize: bool = False) -> Dict[str, Any]:
+    def solve(self, matrix: List[List[float]], maximize: bool = False,
+              engine: str = 'classic', trace: str = 'full',
+              workers: int = 1, warm_start: Optional[Dict[str, Any]] = None,
+              certificate: bool = False, dtype: str = 'float64',
+              objective: str = 'sum', overwrite_input: bool = False,
+              time_budget_ms: Optional[float] = None,
+              approximate: bool = False,
+              on_step: Optional[Callable[[Dict[str, Any]], None]] = None) -> 'AssignmentResult':
         """
         Menyelesaikan assignment problem menggunakan Hungarian Method.
         
         Args:
-            matrix: Matriks biaya (list of lists)
+            matrix: Matriks biaya (list of lists atau ndarray, termasuk np.memmap /
+                .npy yang dibuka read-only dengan mmap), atau SparseCostMatrix /
+                matriks scipy.sparse yang hanya berisi pasangan yang diizinkan
             maximize: True untuk maksimisasi, False untuk minimisasi
+            engine: 'classic' untuk metode garis penutup langkah demi langkah,
+                'jv' untuk shortest augmenting path O(n³) dengan potensial dual
+                (disarankan untuk matriks besar), atau 'auction' untuk auction
+                algorithm dengan epsilon-scaling (optimal untuk biaya integer)
+            trace: 'none' tanpa langkah, 'summary' hanya deskripsi, nilai minimum
+                uncovered dan jumlah garis, atau 'full' dengan matriks setiap langkah
+            workers: Jumlah proses untuk fase bidding engine 'auction', dan untuk
+                menyelesaikan komponen terhubung input sparse secara paralel
+            warm_start: Hasil solve sebelumnya (atau dictionary dengan 'duals' berisi
+                'u' dan 'v', serta 'assignment' opsional). Potensial dual dan pasangan
+                yang masih tight dipakai ulang sehingga hanya baris yang berubah yang
+                perlu di-augment. Selalu memakai engine 'jv'
+            certificate: True untuk menyertakan potensial dual ('duals') pada
+                semua engine sebagai sertifikat optimalitas yang dapat diperiksa
+                dengan verify(); engine 'jv' selalu menyertakannya
+            dtype: Tipe data matriks kerja. 'int32'/'int64' memakai aritmetika
+                integer eksak, 'float32' menghemat memori dengan uji nol yang
+                memakai toleransi, 'auto' memilih integer terkecil yang aman
+                jika semua biaya bulat
+            objective: 'sum' untuk total biaya, atau 'bottleneck' untuk
+                meminimalkan biaya assignment terburuk (memaksimalkan yang
+                terkecil jika maximize) lewat binary search threshold dan
+                Hopcroft-Karp; engine diabaikan dan tidak mendukung warm_start
+                maupun certificate
+            overwrite_input: True untuk memakai ndarray input langsung sebagai
+                matriks kerja tanpa salinan (isinya diubah dan original_matrix
+                pada hasil bernilai None). Hanya berlaku jika input writeable,
+                C-contiguous, dan sudah ber-dtype kerja; selain itu tetap disalin
+                sekali
+            time_budget_ms: Batas waktu solve (anytime) untuk engine 'classic'
+                dan 'jv'. Jika habis, assignment parsial saat itu dilengkapi
+                secara greedy sehingga hasil tetap feasible (timed_out True).
+                Hasil menyertakan dual_bound (batas bawah biaya, atau batas atas
+                untuk maksimisasi) dan optimality_gap terhadap total_cost
+            approximate: True untuk solusi mendekati optimal tanpa solve O(n³)
+                (greedy regret lalu perbaikan 2-opt terbatas) untuk matriks
+                sangat besar; engine diabaikan. dual_bound berasal dari reduksi
+                minimum baris dan kolom sehingga optimality_gap membatasi
+                selisih terhadap optimum
+            on_step: Callback yang menerima setiap langkah (bentuk JSON, delta
+                seperti pada steps) segera setelah dibuat. Langkah tidak disimpan
+                sehingga steps pada hasil kosong; untuk streaming trace
             
         Returns:
-            Dictionary berisi hasil dan langkah-langkah
+            AssignmentResult berisi hasil dan langkah-langkah (dapat diakses
+            seperti dictionary; gunakan to_dict(fields) untuk JSON)
         """
-        self.original_matrix = copy.deepcopy(matrix)
+        if engine not in ENGINES:
+            raise ValueError(f"Engine tidak dikenal: {engine}. Pilihan: {', '.join(ENGINES)}")
+        if trace not in TRACE_LEVELS:
+            raise ValueError(f"Level trace tidak dikenal: {trace}. Pilihan: {', '.join(TRACE_LEVELS)}")
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype tidak dikenal: {dtype}. Pilihan: {', '.join(DTYPES)}")
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Objektif tidak dikenal: {objective}. Pilihan: {', '.join(OBJECTIVES)}")
+        sparse = isinstance(matrix, SparseCostMatrix) or hasattr(matrix, 'tocsr')
+        check_solve_options(engine, objective, warm_start=warm_start, certificate=certificate,
+                            time_budget_ms=time_budget_ms, approximate=approximate, sparse=sparse)
+        if warm_start is not None:
+            engine = 'jv'
+            
         self.is_maximization = maximize
+        self.trace = trace
         self.steps = []
+        self.on_step = on_step
+        self.dummy_rows = 0
+        self.dummy_cols = 0
+        self.duals = None
+        self.objective = objective
+        self.bottleneck_value = None
+        self.input_overwritten = False
+        self.max_val = None
+        self.deadline = None if time_budget_ms is None else time.perf_counter() + time_budget_ms / 1000
+        self.timed_out = False
+        self.dual_bound = None
+        self.progress = {'iterations': 0, 'covered_lines': None}
         
-        # Validasi input
-        if not self._validate_input(matrix):
-            raise ValueError("Input matrix tidak valid")
+        if sparse:
+            return self._solve_sparse(SparseCostMatrix.from_any(matrix), certificate, workers)
+            
+        # Validasi input sekaligus konversi list ke array (sekali saja)
+        array, errors = validate_matrix(matrix)
+        if errors:
+            raise ValueError("Input matrix tidak valid: " + "; ".join(errors))
+            
+        if isinstance(matrix, np.ndarray):
+            # Array (termasuk memmap) tidak disalin: view read-only, biaya asli
+            # dibaca langsung saat menghitung total
+            self.original_matrix = matrix.view()
+            self.original_matrix.flags.writeable = False
+        else:
+            self.original_matrix = copy.deepcopy(matrix)
             
-        # Konversi ke numpy array
-        self.cost_matrix = np.array(matrix, dtype=float)
+        # Konversi ke numpy array (satu salinan kerja, atau input itu sendiri)
+        # Array hasil konversi list sudah milik solver sehingga boleh dipakai langsung
+        self.cost_matrix = _as_cost_array(array, dtype, overwrite_input or array is not matrix)
+        if self.cost_matrix is matrix:
+            self.input_overwritten = True
+            self.original_matrix = None
+        self.original_shape = self.cost_matrix.shape
+        self.zero_tol = _zero_tolerance(self.cost_matrix)
         
         # Log langkah awal
-        self._log_step("Input Matrix", self.cost_matrix.copy())
+        self._log_step("Input Matrix", 'matrix', {'matrix': self.cost_matrix})
         
         # Jika maksimisasi, konversi ke minimisasi
         if maximize:
-            max_val = np.max(self.cost_matrix)
-            self.cost_matrix = max_val - self.cost_matrix
-            self._log_step("Konversi Maksimisasi ke Minimisasi", self.cost_matrix.copy())
+            self.max_val = np.max(self.cost_matrix)
+            np.subtract(self.max_val, self.cost_matrix, out=self.cost_matrix)
+            self._log_step("Konversi Maksimisasi ke Minimisasi", 'negate', {'value': self.max_val})
             
+        if objective == 'bottleneck':
+            # Sisi yang lebih kecil menjadi baris (view transpose, tanpa salinan)
+            transposed = self.cost_matrix.shape[0] > self.cost_matrix.shape[1]
+            cost = self.cost_matrix.T if transposed else self.cost_matrix
+            self._solve_bottleneck(_sorted_rows(cost), transposed)
+            self._calculate_total_cost()
+            return self._prepare_result()
+            
+        if approximate:
+            transposed = self.cost_matrix.shape[0] > self.cost_matrix.shape[1]
+            cost = self.cost_matrix.T if transposed else self.cost_matrix
+            self._solve_approximate(cost, transposed)
+            self._calculate_total_cost()
+            return self._prepare_result()
+            
+        if engine == 'jv':
+            # Matriks tidak seimbang diselesaikan langsung tanpa dummy rows/columns
+            self._solve_shortest_path(warm_start)
+            self._calculate_total_cost()
+            return self._prepare_result()
+        
         # Buat matriks seimbang jika perlu
         self._balance_matrix()
         
+        if engine == 'auction':
+            self._solve_auction(workers, certificate)
+            self._calculate_total_cost()
+            return self._prepare_result()
+            
+        if certificate or self.input_overwritten or self.deadline is not None:
+            # Lacak total pengurangan setiap baris/kolom: matriks = c - u - v
+            size = self.cost_matrix.shape[0]
+            self.duals = (np.zeros(size), np.zeros(size))
+        
         # Langkah 1: Reduksi baris
         self._reduce_rows()
         
@@ -68,42 +237,37 @@ class HungarianMethod:
                 self.assignment = assignment
                 break
                 
+            if self._budget_exhausted():
+                self.assignment = self._complete_greedy(assignment)
+                break
+                
             # Langkah 4: Cari minimum covering lines
             lines = self._find_minimum_lines(assignment)
+            self.progress['iterations'] += 1
+            self.progress['covered_lines'] = int(np.sum(lines['rows']) + np.sum(lines['cols']))
             
             # Langkah 5: Update matriks
-            self._update_matrix(lines)
+            if not self._update_matrix(lines):
+                # Assignment greedy belum maksimum: lengkapi dengan augmenting path
+                assignment = self._augment_assignment(assignment)
+                if len(assignment) == min(self.cost_matrix.shape):
+                    self.assignment = assignment
+                    break
+                self._update_matrix(self._find_minimum_lines(assignment))
+                
+        if self.deadline is not None:
+            # Matriks kerja sudah tereduksi: batas dari dual dan minimum setiap baris
+            self.dual_bound = _dual_bound(self.cost_matrix, *self.duals, reduced=True)
+        if certificate or self.input_overwritten:
+            self.duals = _strip_dummy_duals(*self.duals, self.dummy_rows, self.dummy_cols)
             
         # Hitung total biaya
-        self._calculate_total_cost()
+        self._calculate_total_cost(reduced=True)
+        if not certificate:
+            self.duals = None
         
         return self._prepare_result()
         
-    def _validate_input(self, matrix: List[List[float]]) -> bool:
-        """
-        Validasi input matrix.
-        """
-        if not matrix or not matrix[0]:
-            return False
-            
-        rows = len(matrix)
-        cols = len(matrix[0])
-        
-        # Cek konsistensi kolom
-        for row in matrix:
-            if len(row) != cols:
-                return False
-                
-        # Cek apakah semua elemen adalah angka
-        try:
-            for row in matrix:
-                for val in row:
-                    float(val)
-        except (ValueError, TypeError):
-            return False
-            
-        return True
-        
     def _balance_matrix(self):
         """
         Membuat matriks seimbang dengan menambah dummy rows/columns.
@@ -116,189 +280,446 @@ class HungarianMethod:
         if rows < cols:
             # Tambah dummy rows
             self.dummy_rows = cols - rows
-            dummy = np.zeros((self.dummy_rows, cols))
+            dummy = np.zeros((self.dummy_rows, cols), dtype=self.cost_matrix.dtype)
             self.cost_matrix = np.vstack([self.cost_matrix, dummy])
-            self._log_step(f"Menambah {self.dummy_rows} dummy rows", self.cost_matrix.copy())
+            self._log_step(f"Menambah {self.dummy_rows} dummy rows", 'pad',
+                           {'rows': self.dummy_rows, 'cols': 0})
             
         elif cols < rows:
             # Tambah dummy columns
             self.dummy_cols = rows - cols
-            dummy = np.zeros((rows, self.dummy_cols))
+            dummy = np.zeros((rows, self.dummy_cols), dtype=self.cost_matrix.dtype)
             self.cost_matrix = np.hstack([self.cost_matrix, dummy])
-            self._log_step(f"Menambah {self.dummy_cols} dummy columns", self.cost_matrix.copy())
+            self._log_step(f"Menambah {self.dummy_cols} dummy columns", 'pad',
+                           {'rows': 0, 'cols': self.dummy_cols})
             
     def _reduce_rows(self):
         """
         Langkah 1: Reduksi baris - kurangi setiap baris dengan nilai minimum baris tersebut.
         """
-        for i in range(self.cost_matrix.shape[0]):
-            min_val = np.min(self.cost_matrix[i, :])
-            if min_val > 0:
-                self.cost_matrix[i, :] -= min_val
+        # Minimum negatif juga dikurangkan agar matriks tereduksi >= 0 dan dual feasible
+        row_offsets = np.min(self.cost_matrix, axis=1)
+        self.cost_matrix -= row_offsets[:, None]
+        if self.duals is not None:
+            self.duals[0][:] += row_offsets
                 
-        self._log_step("Reduksi Baris", self.cost_matrix.copy())
+        self._log_step("Reduksi Baris", 'offsets', {'row_offsets': row_offsets})
         
     def _reduce_columns(self):
         """
         Langkah 2: Reduksi kolom - kurangi setiap kolom dengan nilai minimum kolom tersebut.
         """
-        for j in range(self.cost_matrix.shape[1]):
-            min_val = np.min(self.cost_matrix[:, j])
-            if min_val > 0:
-                self.cost_matrix[:, j] -= min_val
+        col_offsets = np.min(self.cost_matrix, axis=0)
+        self.cost_matrix -= col_offsets[None, :]
+        if self.duals is not None:
+            self.duals[1][:] += col_offsets
                 
-        self._log_step("Reduksi Kolom", self.cost_matrix.copy())
+        self._log_step("Reduksi Kolom", 'offsets', {'col_offsets': col_offsets})
+        
+    def _zero_mask(self) -> np.ndarray:
+        """
+        Mask elemen nol; untuk dtype float nilai dalam toleransi dianggap nol.
+        """
+        if self.zero_tol == 0:
+            return self.cost_matrix == 0
+        return np.abs(self.cost_matrix) <= self.zero_tol
         
     def _find_assignment(self) -> List[Tuple[int, int]]:
         """
         Langkah 3: Cari assignment menggunakan nol dalam matriks.
         """
         assignment = []
-        matrix_copy = self.cost_matrix.copy()
+        zeros = self._zero_mask()
+        zero_counts = np.sum(zeros, axis=1)
+        no_zero = zeros.shape[1] + 1
         
         # Cari nol dan buat assignment
         while True:
-            # Cari baris dengan nol paling sedikit
-            zero_counts = []
-            for i in range(matrix_copy.shape[0]):
-                zeros_in_row = np.sum(matrix_copy[i, :] == 0)
-                if zeros_in_row > 0:
-                    zero_counts.append((zeros_in_row, i))
-                    
-            if not zero_counts:
-                break
-                
-            # Pilih baris dengan nol paling sedikit
-            zero_counts.sort()
-            _, row = zero_counts[0]
-            
-            # Cari kolom dengan nol di baris ini
-            zero_cols = np.where(matrix_copy[row, :] == 0)[0]
-            if len(zero_cols) == 0:
+            # Pilih baris dengan nol paling sedikit (indeks terkecil jika seri)
+            row = int(np.argmin(np.where(zero_counts > 0, zero_counts, no_zero)))
+            if zero_counts[row] == 0:
                 break
                 
-            col = int(zero_cols[0])  # Konversi numpy int64 ke Python int
-            assignment.append((int(row), col))  # Pastikan row juga Python int
+            # Kolom nol pertama di baris ini
+            col = int(np.argmax(zeros[row]))
+            assignment.append((row, col))
             
             # Hapus baris dan kolom yang sudah diassign
-            matrix_copy[row, :] = float('inf')
-            matrix_copy[:, col] = float('inf')
+            zero_counts -= zeros[:, col]
+            zeros[:, col] = False
+            zeros[row, :] = False
+            zero_counts[row] = 0
             
         return assignment
         
-    def _find_minimum_lines(self, assignment: List[Tuple[int, int]]) -> Dict[str, List[int]]:
+    def _augment_assignment(self, assignment: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Perbesar assignment dengan augmenting path pada nol hingga maksimum.
+        
+        Assignment greedy dari _find_assignment tidak selalu maksimum; jika
+        garis penutupnya sudah menutup seluruh matriks, iterasi biasa akan macet.
+        """
+        zeros = self._zero_mask()
+        n = zeros.shape[0]
+        col4row = np.full(n, -1, dtype=np.intp)
+        row4col = np.full(n, -1, dtype=np.intp)
+        for row, col in assignment:
+            col4row[row] = col
+            row4col[col] = row
+            
+        for root in np.where(col4row < 0)[0]:
+            # BFS alternating path dari baris bebas
+            parent = np.full(n, -1, dtype=np.intp)
+            visited_cols = np.zeros(n, dtype=bool)
+            frontier = [root]
+            sink = -1
+            while frontier and sink < 0:
+                next_frontier = []
+                for row in frontier:
+                    new_cols = np.where(zeros[row] & ~visited_cols)[0]
+                    visited_cols[new_cols] = True
+                    parent[new_cols] = row
+                    free = new_cols[row4col[new_cols] < 0]
+                    if len(free):
+                        sink = free[0]
+                        break
+                    next_frontier.extend(row4col[new_cols])
+                frontier = next_frontier
+                
+            col = sink
+            while col >= 0:
+                row = parent[col]
+                next_col = col4row[row]
+                col4row[row] = col
+                row4col[col] = row
+                col = next_col
+                
+        return [(int(row), int(col)) for row, col in enumerate(col4row) if col >= 0]
+        
+    def _find_minimum_lines(self, assignment: List[Tuple[int, int]]) -> Dict[str, np.ndarray]:
         """
         Langkah 4: Cari minimum number of lines untuk cover semua nol.
+        
+        Returns:
+            Mask boolean baris dan kolom yang tertutup garis
         """
         n = self.cost_matrix.shape[0]
+        zeros = self._zero_mask()
         
-        # Buat graf bipartit
-        unassigned_rows = set(range(n))
-        assigned_cols = set()
-        
+        # Baris pemilik assignment untuk setiap kolom
+        row4col = np.full(n, -1, dtype=np.intp)
+        marked_rows = np.ones(n, dtype=bool)
         for row, col in assignment:
-            unassigned_rows.discard(row)
-            assigned_cols.add(col)
-            
-        # Marking algorithm
-        marked_rows = set(unassigned_rows)
-        marked_cols = set()
-        
-        changed = True
-        while changed:
-            changed = False
+            row4col[col] = row
+            marked_rows[row] = False
             
+        # Marking algorithm: mulai dari baris tanpa assignment
+        marked_cols = np.zeros(n, dtype=bool)
+        while True:
             # Mark columns yang memiliki nol di marked rows
-            for row in marked_rows:
-                for col in range(n):
-                    if self.cost_matrix[row, col] == 0 and col not in marked_cols:
-                        marked_cols.add(col)
-                        changed = True
-                        
+            new_cols = np.any(zeros[marked_rows], axis=0) & ~marked_cols
+            if not new_cols.any():
+                break
+            marked_cols |= new_cols
+            
             # Mark rows yang memiliki assignment di marked columns
-            for row, col in assignment:
-                if col in marked_cols and row not in marked_rows:
-                    marked_rows.add(row)
-                    changed = True
-                    
+            owners = row4col[new_cols]
+            marked_rows[owners[owners >= 0]] = True
+            
         # Lines: unmarked rows + marked columns
-        covering_rows = [i for i in range(n) if i not in marked_rows]
-        covering_cols = list(marked_cols)
-        
-        return {'rows': covering_rows, 'cols': covering_cols}
+        return {'rows': ~marked_rows, 'cols': marked_cols}
         
-    def _update_matrix(self, lines: Dict[str, List[int]]):
+    def _update_matrix(self, lines: Dict[str, np.ndarray]) -> bool:
         """
         Langkah 5: Update matriks dengan mengurangi nilai minimum dari uncovered elements.
+        
+        Returns:
+            False jika semua elemen sudah tertutup garis (matriks tidak berubah)
         """
-        n = self.cost_matrix.shape[0]
+        uncovered = np.ix_(~lines['rows'], ~lines['cols'])
+        intersection = np.ix_(lines['rows'], lines['cols'])
         
-        # Cari uncovered elements
-        uncovered_elements = []
-        for i in range(n):
-            for j in range(n):
-                if i not in lines['rows'] and j not in lines['cols']:
-                    uncovered_elements.append(self.cost_matrix[i, j])
-                    
-        if not uncovered_elements:
-            return
+        uncovered_elements = self.cost_matrix[uncovered]
+        if uncovered_elements.size == 0:
+            return False
             
-        min_uncovered = min(uncovered_elements)
-        
-        # Update matriks
-        for i in range(n):
-            for j in range(n):
-                if i not in lines['rows'] and j not in lines['cols']:
-                    # Uncovered: kurangi dengan minimum
-                    self.cost_matrix[i, j] -= min_uncovered
-                elif i in lines['rows'] and j in lines['cols']:
-                    # Intersection: tambah dengan minimum
-                    self.cost_matrix[i, j] += min_uncovered
+        min_uncovered = np.min(uncovered_elements)
+        
+        # Uncovered: kurangi dengan minimum, intersection: tambah dengan minimum
+        self.cost_matrix[uncovered] -= min_uncovered
+        self.cost_matrix[intersection] += min_uncovered
+        if self.duals is not None:
+            self.duals[0][~lines['rows']] += min_uncovered
+            self.duals[1][lines['cols']] -= min_uncovered
                     
-        self._log_step(f"Update Matrix (min uncovered: {min_uncovered})", self.cost_matrix.copy())
+        self._log_step(f"Update Matrix (min uncovered: {min_uncovered})", 'update',
+                       {'row_cover': lines['rows'], 'col_cover': lines['cols']},
+                       min_uncovered=min_uncovered,
+                       covered_rows=int(np.sum(lines['rows'])),
+                       covered_cols=int(np.sum(lines['cols'])))
+        return True
         
-    def _calculate_total_cost(self):
+    def _budget_exhausted(self) -> bool:
         """
-        Hitung total biaya dari assignment yang ditemukan.
+        True jika time budget solve (time_budget_ms) sudah habis.
+        """
+        return self.deadline is not None and time.perf_counter() > self.deadline
+        
+    def _complete_greedy(self, assignment: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Lengkapi assignment nol parsial secara greedy pada matriks tereduksi.
+        """
+        col4row = np.full(self.cost_matrix.shape[0], -1, dtype=np.intp)
+        for row, col in assignment:
+            col4row[row] = col
+        col4row = _greedy_complete(self.cost_matrix, col4row)
+        self.timed_out = True
+        self._log_step(f"Time budget habis: {len(assignment)} pasangan nol dilengkapi secara greedy", None, {})
+        return [(i, int(j)) for i, j in enumerate(col4row)]
+        
+    def _solve_shortest_path(self, warm_start: Optional[Dict[str, Any]] = None):
+        """
+        Selesaikan matriks dengan shortest augmenting path (Jonker-Volgenant).
+        
+        Matriks persegi panjang diselesaikan langsung pada bentuk aslinya: sisi
+        yang lebih kecil (baris, atau kolom lewat view transpose) di-assign
+        seluruhnya, sehingga memori tetap rows x cols.
+        """
+        rows, cols = self.cost_matrix.shape
+        transposed = rows > cols
+        
+        init = None
+        if warm_start is not None:
+            prior_u, prior_v, prior_col4row = _parse_warm_start(warm_start, rows, cols)
+            if transposed:
+                prior_row4col = np.full(cols, -1, dtype=np.intp)
+                assigned = prior_col4row >= 0
+                prior_row4col[prior_col4row[assigned]] = np.flatnonzero(assigned)
+                init = (prior_row4col, prior_u)
+            else:
+                init = (prior_col4row, prior_v)
+            
+        cost = self.cost_matrix.T if transposed else self.cost_matrix
+        col4row, u, v = _shortest_augmenting_path(cost, init, self.deadline, self.progress)
+        if self.deadline is not None:
+            self.dual_bound = _dual_bound(cost, u, v)
+            if np.any(col4row < 0):
+                # Time budget habis: baris yang belum di-augment dilengkapi greedy
+                self.timed_out = True
+                col4row = _greedy_complete(cost, col4row, v)
+                self._log_step("Time budget habis: assignment dilengkapi secara greedy", None, {})
+        if transposed:
+            self.assignment = sorted((int(i), j) for j, i in enumerate(col4row))
+            u, v = v, u
+        else:
+            self.assignment = [(i, int(j)) for i, j in enumerate(col4row)]
+        self.duals = (u, v)
+        
+        # Matriks tereduksi c[i, j] - u[i] - v[j] bernilai nol pada assignment optimal
+        self._log_step("Shortest Augmenting Path (Jonker-Volgenant)", 'offsets',
+                       {'row_offsets': u, 'col_offsets': v})
+        
+    def _solve_auction(self, workers: int, certificate: bool = False):
+        """
+        Selesaikan matriks seimbang dengan auction algorithm (epsilon-scaling).
+        
+        Harga auction hanya epsilon-optimal; untuk sertifikat, assignment dan
+        harga dilanjutkan sebagai warm start jv sehingga dual menjadi tepat.
+        """
+        col4row, u, v, phases = _auction(self.cost_matrix, workers)
+        
+        # Harga objek menjadi potensial dual; matriks tereduksi <= epsilon pada assignment
+        self._log_step(f"Auction Algorithm ({phases} fase epsilon-scaling)", 'offsets',
+                       {'row_offsets': u, 'col_offsets': v})
+                       
+        if certificate:
+            col4row, u, v = _shortest_augmenting_path(self.cost_matrix, (col4row, v))
+            self.duals = _strip_dummy_duals(u, v, self.dummy_rows, self.dummy_cols)
+        self.assignment = [(i, int(j)) for i, j in enumerate(col4row)]
+        
+    def _solve_bottleneck(self, sorted_rows: Tuple[np.ndarray, np.ndarray, np.ndarray, int],
+                          transposed: bool):
+        """
+        Selesaikan assignment bottleneck pada baris yang sudah diurutkan per biaya.
+        
+        sorted_rows berasal dari _sorted_rows pada sisi yang lebih kecil (baris
+        <= kolom); transposed menandai bahwa sisi tersebut adalah kolom asli.
+        """
+        col4row, checks = _bottleneck_matching(*sorted_rows)
+        if transposed:
+            self.assignment = sorted((int(i), j) for j, i in enumerate(col4row))
+        else:
+            self.assignment = [(i, int(j)) for i, j in enumerate(col4row)]
+        self._log_step(f"Bottleneck Assignment (binary search threshold, {checks} uji matching)", None, {})
+        
+    def _solve_approximate(self, cost: np.ndarray, transposed: bool):
+        """
+        Selesaikan secara aproksimasi pada sisi yang lebih kecil (baris <= kolom).
+        
+        Batas bawah reduksi baris/kolom disimpan sebagai dual_bound sehingga
+        hasil melaporkan seberapa jauh total biaya dari optimum.
+        """
+        col4row, self.dual_bound, moves = _approximate_assignment(cost)
+        if transposed:
+            self.assignment = sorted((int(i), j) for j, i in enumerate(col4row))
+        else:
+            self.assignment = [(i, int(j)) for i, j in enumerate(col4row)]
+        self._log_step(f"Approximate Assignment (greedy regret, {moves} perbaikan 2-opt)", None, {})
+        
+    def _solve_sparse(self, sparse: 'SparseCostMatrix', certificate: bool = False,
+                      workers: int = 1) -> 'AssignmentResult':
         """
-        original = np.array(self.original_matrix)
+        Selesaikan input sparse hanya dengan edge yang diizinkan.
         
+        Waktu dan memori sebanding dengan jumlah edge, bukan n². Konversi
+        maksimisasi hanya dilakukan pada edge yang ada. Jika graf edge terpecah
+        menjadi beberapa komponen terhubung, setiap komponen diselesaikan
+        terpisah (komponen besar paralel pada process pool jika workers > 1).
+        """
+        self.original_matrix = sparse
+        self.original_shape = sparse.shape
+        self._log_step(f"Input Sparse Matrix ({sparse.shape[0]}x{sparse.shape[1]}, {sparse.nnz} edge)",
+                       None, {})
+                       
+        costs = sparse.data
+        if self.is_maximization:
+            costs = np.max(costs) - costs
+            self._log_step("Konversi Maksimisasi ke Minimisasi (hanya edge yang diizinkan)", None, {})
+            
+        work = SparseCostMatrix(sparse.indptr, sparse.indices, costs, sparse.shape)
+        transposed = work.shape[0] > work.shape[1]
+        if transposed:
+            work = work.transpose()
+            
+        if self.objective == 'bottleneck':
+            self._solve_bottleneck(_sorted_rows(work), transposed)
+            pairs = np.array(self.assignment, dtype=np.intp).reshape(-1, 2)
+            assigned = sparse.lookup(pairs[:, 0], pairs[:, 1])
+            self.total_cost = float(np.sum(assigned))
+            self.bottleneck_value = float(np.min(assigned) if self.is_maximization else np.max(assigned))
+            return self._prepare_result()
+            
+        row_label, col_label = _bipartite_components(work)
+        components = int(row_label.max()) + 1 if len(row_label) else 0
+        if components > 1:
+            self._log_step(f"Dekomposisi: {components} komponen terhubung", None, {})
+            col4row, u, v = _solve_sparse_components(work, row_label, col_label, workers)
+        else:
+            col4row, u, v = _sparse_shortest_augmenting_path(work)
+        rows = np.arange(len(col4row))
+        if transposed:
+            rows, col4row = col4row, rows
+            u, v = v, u
+        if certificate:
+            self.duals = (u, v)
+        order = np.argsort(rows)
+        self.assignment = [(int(rows[k]), int(col4row[k])) for k in order]
+        self._log_step("Sparse Shortest Augmenting Path", None, {})
+        
+        self.total_cost = float(np.sum(sparse.lookup(rows, col4row)))
+        return self._prepare_result()
+        
+    def _calculate_total_cost(self, reduced: bool = False):
+        """
+        Hitung total biaya dari assignment yang ditemukan.
+        
+        Biaya asli diambil dengan fancy indexing, sehingga input memmap hanya
+        membaca elemen yang di-assign. Jika input dipakai sebagai matriks kerja
+        (overwrite_input), biaya asli dipulihkan dari matriks kerja, ditambah
+        dual u + v jika matriks sudah direduksi (reduced), lalu konversi
+        maksimisasi dibalik.
+        """
         # Jika ada dummy rows/cols, sesuaikan assignment
-        valid_assignment = []
-        for row, col in self.assignment:
-            if (row < len(self.original_matrix) and 
-                col < len(self.original_matrix[0])):
-                valid_assignment.append((row, col))
-                
-        self.assignment = valid_assignment
+        rows, cols = self.original_shape
+        self.assignment = [(row, col) for row, col in self.assignment
+                           if row < rows and col < cols]
         
         # Hitung total cost
-        self.total_cost = 0
-        for row, col in self.assignment:
-            self.total_cost += original[row, col]
+        pairs = np.array(self.assignment, dtype=np.intp).reshape(-1, 2)
+        if self.input_overwritten:
+            assigned = self.cost_matrix[pairs[:, 0], pairs[:, 1]].astype(float)
+            if reduced:
+                assigned += self.duals[0][pairs[:, 0]] + self.duals[1][pairs[:, 1]]
+            if self.is_maximization:
+                assigned = self.max_val - assigned
+        else:
+            original = self.original_matrix
+            if not isinstance(original, np.ndarray):
+                original = np.array(original, dtype=float)
+            assigned = original[pairs[:, 0], pairs[:, 1]]
+        self.total_cost = np.sum(assigned, dtype=float)
+        if self.objective == 'bottleneck':
+            self.bottleneck_value = float(np.min(assigned) if self.is_maximization else np.max(assigned))
             
-    def _log_step(self, description: str, matrix: np.ndarray):
+    def _log_step(self, description: str, op: str, delta: Dict[str, Any], **details):
         """
-        Log langkah-langkah algoritma.
+        Log langkah-langkah algoritma sesuai level trace.
+        
+        Pada level 'full' langkah disimpan sebagai delta terhadap langkah
+        sebelumnya (lihat apply_step): snapshot matriks hanya untuk 'matrix',
+        selebihnya offset baris/kolom, cover mask, atau nilai skalar. Detail
+        skalar (misalnya min_uncovered dan jumlah garis) disimpan pada level
+        'summary' dan 'full'. Jika on_step diberikan, langkah langsung
+        dikonversi ke JSON dan dikirim ke callback tanpa disimpan.
         """
-        self.steps.append({
-            'description': description,
-            'matrix': matrix.copy()
-        })
+        if self.trace == 'none':
+            return
+            
+        step = {'description': description}
+        step.update(details)
+        if self.trace == 'full' and op is not None:
+            step['op'] = op
+            for key, value in delta.items():
+                # Konversi JSON pada streaming sudah menyalin array
+                copy_value = isinstance(value, np.ndarray) and self.on_step is None
+                step[key] = value.copy() if copy_value else value
+        if self.on_step is not None:
+            self.on_step(_steps_to_json([step])[0])
+            return
+        self.steps.append(step)
         
-    def _prepare_result(self) -> Dict[str, Any]:
+    def get_step_matrix(self, index: int) -> Optional[np.ndarray]:
+        """
+        Bangun ulang matriks pada langkah ke-index dari trace delta.
+        """
+        if not 0 <= index < len(self.steps):
+            raise IndexError(f"Langkah {index} tidak ada")
+            
+        matrix = None
+        for step in self.steps[:index + 1]:
+            matrix = apply_step(matrix, step)
+        return matrix
+        
+    def _prepare_result(self) -> 'AssignmentResult':
         """
         Siapkan hasil akhir.
+        
+        Hanya array permutasi dan skalar yang dibuat di sini; langkah, dual, dan
+        daftar pasangan dikonversi ke bentuk JSON saat diakses.
         """
-        # Konversi numpy types ke Python native types untuk JSON serialization
-        return {
-            'assignment': self.assignment,
-            'total_cost': float(self.total_cost),  # Konversi ke Python float
-            'steps': self._convert_steps_to_json_serializable(),
-            'original_matrix': self.original_matrix,
-            'is_maximization': self.is_maximization,
-            'optimal_value': float(self.total_cost)  # Konversi ke Python float
-        }
+        col4row = np.full(self.original_shape[0], -1, dtype=np.intp)
+        pairs = np.array(self.assignment, dtype=np.intp).reshape(-1, 2)
+        col4row[pairs[:, 0]] = pairs[:, 1]
+        return AssignmentResult(
+            col4row, float(self.total_cost),
+            is_maximization=self.is_maximization,
+            objective=self.objective,
+            bottleneck_value=self.bottleneck_value,
+            timed_out=self.timed_out,
+            dual_bound=self._original_dual_bound(),
+            steps=self.steps,
+            original=self.original_matrix,
+            duals=self.duals)
+        
+    def _original_dual_bound(self) -> Optional[float]:
+        """
+        Batas dual pada ruang biaya asli (batas atas untuk maksimisasi).
+        """
+        if self.dual_bound is None:
+            return None
+        if self.is_maximization:
+            return float(min(self.original_shape) * self.max_val - self.dual_bound)
+        return float(self.dual_bound)
         
     def get_assignment_matrix(self) -> np.ndarray:
         """
@@ -307,8 +728,7 @@ class HungarianMethod:
         if not self.assignment:
             return None
             
-        rows = len(self.original_matrix)
-        cols = len(self.original_matrix[0])
+        rows, cols = self.original_shape
         assignment_matrix = np.zeros((rows, cols))
         
         for row, col in self.assignment:
@@ -321,11 +741,1685 @@ class HungarianMethod:
         """
         Konversi steps yang mengandung numpy arrays ke format yang bisa di-serialize ke JSON.
         """
-        json_steps = []
-        for step in self.steps:
-            json_step = {
-                'description': step['description'],
-                'matrix': step['matrix'].tolist() if isinstance(step['matrix'], np.ndarray) else step['matrix']
-            }
-            json_steps.append(json_step)
-        return json_steps
\ No newline at end of file
+        return _steps_to_json(self.steps)
+
+
+class AssignmentResult(Mapping):
+    """
+    Hasil solve yang ringkas dengan konversi JSON yang malas.
+    
+    Assignment disimpan sebagai array permutasi col4row (kolom untuk setiap
+    baris asli, -1 jika baris tidak di-assign) bersama total biaya dan skalar
+    lain. Daftar pasangan, langkah, matriks asli, dan dual baru dikonversi saat
+    diakses, sehingga pemanggil yang hanya membutuhkan biaya tidak membayar
+    konversinya. Akses gaya dictionary (result['total_cost']) tetap didukung
+    dan to_dict(fields) hanya mengkonversi field yang diminta.
+    """
+    
+    __slots__ = ('col4row', 'total_cost', 'is_maximization', 'objective', 'bottleneck_value',
+                 'timed_out', 'dual_bound', '_steps', '_original', '_duals')
+    
+    # Field yang tersedia lewat result[field] dan to_dict()
+    FIELDS = ('assignment', 'total_cost', 'steps', 'original_matrix', 'is_maximization',
+              'optimal_value', 'objective', 'bottleneck_value', 'timed_out', 'dual_bound',
+              'optimality_gap', 'duals')
+    
+    def __init__(self, col4row: np.ndarray, total_cost: float, is_maximization: bool = False,
+                 objective: str = 'sum', bottleneck_value: Optional[float] = None,
+                 timed_out: bool = False, dual_bound: Optional[float] = None,
+                 steps: Optional[List[Dict[str, Any]]] = None, original=None,
+                 duals: Optional[Tuple[np.ndarray, np.ndarray]] = None):
+        self.col4row = col4row
+        self.total_cost = total_cost
+        self.is_maximization = is_maximization
+        self.objective = objective
+        # Biaya assignment terburuk (terkecil untuk maksimisasi) pada objektif bottleneck
+        self.bottleneck_value = bottleneck_value
+        # Solve anytime/approximate: batas dual pada skala biaya asli
+        self.timed_out = timed_out
+        self.dual_bound = dual_bound
+        self._steps = steps if steps is not None else []
+        self._original = original
+        self._duals = duals
+        
+    @property
+    def assignment(self) -> List[Tuple[int, int]]:
+        """
+        Daftar pasangan (row, col) terurut menurut baris.
+        """
+        return [(row, col) for row, col in enumerate(self.col4row.tolist()) if col >= 0]
+        
+    @property
+    def steps(self) -> List[Dict[str, Any]]:
+        return _steps_to_json(self._steps)
+        
+    @property
+    def num_steps(self) -> int:
+        return len(self._steps)
+        
+    def step(self, index: int) -> Dict[str, Any]:
+        """
+        Satu langkah (bentuk JSON) beserta matriks lengkapnya pada trace 'full'.
+        
+        Hanya delta sampai langkah index yang diterapkan dan hanya matriks
+        langkah itu yang dikonversi, tanpa membangun ulang seluruh trace.
+        """
+        if not 0 <= index < len(self._steps):
+            raise IndexError(f"Langkah {index} tidak ada")
+        matrix = None
+        for step in self._steps[:index + 1]:
+            matrix = apply_step(matrix, step)
+        step = _steps_to_json([self._steps[index]])[0]
+        if matrix is not None and 'op' in step:
+            step['matrix'] = matrix.tolist()
+        return step
+        
+    @property
+    def original_matrix(self):
+        if isinstance(self._original, SparseCostMatrix):
+            return self._original.to_dict()
+        return self._original
+        
+    @property
+    def optimal_value(self) -> float:
+        return self.total_cost
+        
+    @property
+    def optimality_gap(self) -> Optional[float]:
+        if self.dual_bound is None:
+            return None
+        return max(0.0, abs(self.total_cost - self.dual_bound))
+        
+    @property
+    def duals(self) -> Optional[Dict[str, List[float]]]:
+        """
+        Potensial dual (ruang minimisasi) untuk warm start solve berikutnya.
+        """
+        if self._duals is None:
+            return None
+        return {'u': self._duals[0].tolist(), 'v': self._duals[1].tolist()}
+        
+    @property
+    def nbytes(self) -> int:
+        """
+        Perkiraan memori array yang dipegang hasil ini (assignment, matriks
+        asli, dual, dan delta langkah), misalnya untuk batas cache.
+        """
+        arrays = [self.col4row]
+        if isinstance(self._original, np.ndarray):
+            arrays.append(self._original)
+        if self._duals is not None:
+            arrays.extend(self._duals)
+        arrays.extend(value for step in self._steps for value in step.values()
+                      if isinstance(value, np.ndarray))
+        return sum(array.nbytes for array in arrays)
+        
+    def __getitem__(self, key: str):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+        
+    def __contains__(self, key) -> bool:
+        # Tanpa memanggil __getitem__ sehingga field tidak dikonversi
+        return key in self.FIELDS
+        
+    def __iter__(self):
+        return iter(self.FIELDS)
+        
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+        
+    def to_dict(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Bentuk JSON untuk field yang diminta (semua field jika None).
+        """
+        fields = self.FIELDS if fields is None else fields
+        unknown = [field for field in fields if field not in self.FIELDS]
+        if unknown:
+            raise ValueError(f"Field hasil tidak dikenal: {', '.join(unknown)}. "
+                             f"Pilihan: {', '.join(self.FIELDS)}")
+        return {field: getattr(self, field) for field in fields}
+        
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Bentuk data biasa (array dan metadata JSON) untuk np.savez tanpa pickle.
+        
+        Matriks asli tidak disertakan; berikan kembali lewat from_arrays.
+        """
+        meta = {
+            'total_cost': self.total_cost,
+            'is_maximization': bool(self.is_maximization),
+            'objective': self.objective,
+            'bottleneck_value': None if self.bottleneck_value is None else float(self.bottleneck_value),
+            'timed_out': bool(self.timed_out),
+            'dual_bound': None if self.dual_bound is None else float(self.dual_bound),
+            'steps': self.steps
+        }
+        arrays = {'col4row': self.col4row, 'meta': np.array(json.dumps(meta))}
+        if self._duals is not None:
+            arrays['u'], arrays['v'] = self._duals
+        return arrays
+        
+    @classmethod
+    def from_arrays(cls, arrays, original=None) -> 'AssignmentResult':
+        """
+        Bangun ulang hasil dari to_arrays (misalnya np.load(..., allow_pickle=False)).
+        """
+        meta = json.loads(str(arrays['meta']))
+        duals = (arrays['u'], arrays['v']) if 'u' in arrays else None
+        return cls(np.asarray(arrays['col4row']), meta['total_cost'],
+                   is_maximization=meta['is_maximization'], objective=meta['objective'],
+                   bottleneck_value=meta['bottleneck_value'], timed_out=meta['timed_out'],
+                   dual_bound=meta['dual_bound'], steps=meta['steps'], original=original,
+                   duals=duals)
+
+
+class SparseCostMatrix:
+    """
+    Matriks biaya sparse dalam format CSR.
+    
+    Hanya pasangan (baris, kolom) yang diizinkan disimpan; pasangan lain
+    dianggap terlarang dan tidak pernah dipakai dalam assignment.
+    """
+    
+    def __init__(self, indptr, indices, data, shape: Tuple[int, int]):
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.data = np.asarray(data, dtype=float)
+        self.shape = (int(shape[0]), int(shape[1]))
+        
+        rows, cols = self.shape
+        if rows <= 0 or cols <= 0:
+            raise ValueError("Ukuran matriks sparse tidak valid")
+        if len(self.indptr) != rows + 1 or self.indptr[0] != 0 or np.any(np.diff(self.indptr) < 0):
+            raise ValueError("indptr CSR tidak valid")
+        if len(self.indices) != self.indptr[-1] or len(self.data) != len(self.indices):
+            raise ValueError("Panjang indices/data CSR tidak sesuai dengan indptr")
+        if len(self.indices) and (self.indices.min() < 0 or self.indices.max() >= cols):
+            raise ValueError("Indeks kolom di luar ukuran matriks")
+        if not np.all(np.isfinite(self.data)):
+            raise ValueError("Biaya edge harus berupa angka berhingga")
+            
+    @classmethod
+    def from_edges(cls, edges, shape: Optional[Tuple[int, int]] = None) -> 'SparseCostMatrix':
+        """
+        Buat dari daftar edge (baris, kolom, biaya). Edge ganda memakai biaya terkecil.
+        """
+        edges = np.asarray(edges, dtype=float).reshape(-1, 3)
+        rows = edges[:, 0].astype(np.intp)
+        cols = edges[:, 1].astype(np.intp)
+        costs = edges[:, 2]
+        if np.any(rows != edges[:, 0]) or np.any(cols != edges[:, 1]):
+            raise ValueError("Indeks baris/kolom edge harus bilangan bulat")
+        if shape is None:
+            shape = (int(rows.max()) + 1 if len(rows) else 0,
+                     int(cols.max()) + 1 if len(cols) else 0)
+        if len(rows) and (rows.min() < 0 or rows.max() >= shape[0]):
+            raise ValueError("Indeks baris di luar ukuran matriks")
+            
+        # Urutkan per baris lalu kolom; untuk edge ganda ambil biaya terkecil
+        order = np.lexsort((costs, cols, rows))
+        rows, cols, costs = rows[order], cols[order], costs[order]
+        keep = np.ones(len(rows), dtype=bool)
+        keep[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        rows, cols, costs = rows[keep], cols[keep], costs[keep]
+        
+        indptr = np.zeros(shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(indptr, cols, costs, shape)
+        
+    @classmethod
+    def from_csr(cls, indptr, indices, data, shape: Tuple[int, int]) -> 'SparseCostMatrix':
+        """
+        Buat dari array CSR (indptr, indices, data).
+        """
+        indptr = np.asarray(indptr, dtype=np.intp)
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        return cls.from_edges(np.column_stack([rows, indices, data]), shape)
+        
+    @classmethod
+    def from_any(cls, matrix) -> 'SparseCostMatrix':
+        """
+        Terima SparseCostMatrix atau matriks scipy.sparse (apa pun yang punya tocsr()).
+        """
+        if isinstance(matrix, cls):
+            return matrix
+        csr = matrix.tocsr()
+        return cls.from_csr(csr.indptr, csr.indices, csr.data, csr.shape)
+        
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+        
+    def row_indices(self) -> np.ndarray:
+        """
+        Indeks baris untuk setiap edge.
+        """
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        
+    def transpose(self) -> 'SparseCostMatrix':
+        """
+        Matriks transpose (baris menjadi kolom).
+        """
+        edges = np.column_stack([self.indices, self.row_indices(), self.data])
+        return SparseCostMatrix.from_edges(edges, (self.shape[1], self.shape[0]))
+        
+    def lookup(self, rows, cols) -> np.ndarray:
+        """
+        Ambil biaya pasangan (rows[k], cols[k]); pasangan terlarang bernilai inf.
+        
+        Kolom dalam setiap baris CSR terurut sehingga kunci row * cols + col
+        terurut global; semua pasangan dicari sekaligus dengan searchsorted.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        result = np.full(len(rows), np.inf)
+        if len(self.indices) == 0 or len(rows) == 0:
+            return result
+        keys = self.row_indices().astype(np.int64) * self.shape[1] + self.indices
+        query = rows * self.shape[1] + cols
+        pos = np.minimum(np.searchsorted(keys, query), len(keys) - 1)
+        found = keys[pos] == query
+        result[found] = self.data[pos[found]]
+        return result
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Bentuk JSON: ukuran dan daftar edge [baris, kolom, biaya].
+        """
+        return {
+            'shape': list(self.shape),
+            'edges': [[int(r), int(c), float(d)]
+                      for r, c, d in zip(self.row_indices(), self.indices, self.data)]
+        }
+
+
+def _cover_mask(cover, size: int) -> np.ndarray:
+    """
+    Cover mask boolean dari mask atau daftar indeks (bentuk JSON).
+    """
+    cover = np.asarray(cover)
+    if cover.dtype == bool and cover.shape == (size,):
+        return cover
+    mask = np.zeros(size, dtype=bool)
+    mask[cover.astype(np.intp)] = True
+    return mask
+
+
+def apply_step(matrix: Optional[np.ndarray], step: Dict[str, Any]) -> Optional[np.ndarray]:
+    """
+    Terapkan satu langkah trace delta pada matriks langkah sebelumnya.
+    
+    Operasi yang dikenal:
+        'matrix': snapshot penuh ('matrix')
+        'negate': konversi maksimisasi, value - matrix ('value')
+        'pad': tambah dummy rows/columns bernilai nol ('rows', 'cols')
+        'offsets': kurangi offset per baris/kolom ('row_offsets', 'col_offsets')
+        'update': kurangi min_uncovered dari elemen tidak tertutup dan tambahkan
+            pada perpotongan garis ('min_uncovered', 'row_cover', 'col_cover')
+    Langkah tanpa 'op' (level 'summary') tidak mengubah matriks.
+    """
+    op = step.get('op')
+    if op == 'matrix':
+        return np.array(step['matrix'])
+    if op is None or matrix is None:
+        return matrix
+        
+    if op == 'negate':
+        return step['value'] - matrix
+    if op == 'pad':
+        rows, cols = matrix.shape
+        if step['rows']:
+            matrix = np.vstack([matrix, np.zeros((step['rows'], cols))])
+        if step['cols']:
+            matrix = np.hstack([matrix, np.zeros((rows, step['cols']))])
+        return matrix
+    if op == 'offsets':
+        if step.get('row_offsets') is not None:
+            matrix = matrix - np.asarray(step['row_offsets'])[:, None]
+        if step.get('col_offsets') is not None:
+            matrix = matrix - np.asarray(step['col_offsets'])[None, :]
+        return matrix
+    if op == 'update':
+        rows = _cover_mask(step['row_cover'], matrix.shape[0])
+        cols = _cover_mask(step['col_cover'], matrix.shape[1])
+        matrix = matrix.copy()
+        matrix[np.ix_(~rows, ~cols)] -= step['min_uncovered']
+        matrix[np.ix_(rows, cols)] += step['min_uncovered']
+        return matrix
+    raise ValueError(f"Operasi langkah tidak dikenal: {op}")
+
+
+def _steps_to_json(steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Konversi langkah yang berisi numpy array ke bentuk JSON.
+    
+    Bentuk delta tetap dipertahankan; cover mask disimpan sebagai daftar indeks.
+    Gunakan expand_steps untuk mendapatkan matriks setiap langkah.
+    """
+    json_steps = []
+    for step in steps:
+        json_step = {}
+        for key, value in step.items():
+            if isinstance(value, np.ndarray):
+                value = np.flatnonzero(value).tolist() if value.dtype == bool else value.tolist()
+            elif isinstance(value, np.generic):
+                value = value.item()
+            json_step[key] = value
+        json_steps.append(json_step)
+    return json_steps
+
+
+def summarize_steps(steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Turunkan trace 'full' menjadi bentuk trace 'summary' (tanpa op dan delta).
+    """
+    return [{key: value for key, value in step.items() if key not in STEP_DELTA_KEYS}
+            for step in steps]
+
+
+def expand_steps(steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Ubah trace delta (hasil solve) menjadi langkah dengan matriks lengkap.
+    """
+    expanded = []
+    matrix = None
+    for step in steps:
+        matrix = apply_step(matrix, step)
+        expanded_step = dict(step)
+        if matrix is not None and 'op' in step:
+            expanded_step['matrix'] = matrix.tolist()
+        expanded.append(expanded_step)
+    return expanded
+
+
+def check_solve_options(engine: str = 'classic', objective: str = 'sum',
+                        warm_start: Optional[Dict[str, Any]] = None, certificate: bool = False,
+                        time_budget_ms: Optional[float] = None, approximate: bool = False,
+                        sparse: bool = False, shape: Optional[Tuple[int, int]] = None):
+    """
+    Periksa kombinasi opsi solve() yang tidak didukung.
+    
+    Dipakai oleh solve() dan oleh API sebelum solve dijalankan sehingga
+    aturannya hanya ditulis sekali. Jika shape diberikan, ukuran dual
+    warm_start juga diperiksa terhadap matriks.
+    
+    Raises:
+        ValueError: Jika kombinasi opsi tidak didukung
+    """
+    if warm_start is not None:
+        if engine == 'auction':
+            raise ValueError("warm_start hanya didukung oleh engine 'jv'")
+        if not isinstance(warm_start, Mapping):
+            raise ValueError("warm_start harus berupa dictionary hasil solve sebelumnya")
+        if shape is not None:
+            _parse_warm_start(warm_start, *shape)
+    if objective == 'bottleneck' and (warm_start is not None or certificate):
+        raise ValueError("Objektif 'bottleneck' tidak mendukung warm_start maupun certificate")
+    if time_budget_ms is not None:
+        if not time_budget_ms > 0:
+            raise ValueError("time_budget_ms harus bilangan positif")
+        if engine == 'auction' or objective == 'bottleneck':
+            raise ValueError("time_budget_ms hanya didukung engine 'classic' dan 'jv' dengan objektif 'sum'")
+    if approximate and (warm_start is not None or certificate or time_budget_ms is not None
+                        or objective == 'bottleneck'):
+        raise ValueError("approximate tidak mendukung warm_start, certificate, time_budget_ms, "
+                         "maupun objektif 'bottleneck'")
+    if sparse and (time_budget_ms is not None or approximate):
+        raise ValueError("time_budget_ms dan approximate tidak didukung untuk input sparse")
+
+
+def validate_matrix(matrix, max_errors: int = MAX_VALIDATION_ERRORS) -> Tuple[Optional[np.ndarray], List[str]]:
+    """
+    Validasi dan konversi matriks biaya dalam satu pass.
+
+    List of lists dikonversi ke ndarray sekali; baris ragged, nilai non-numerik,
+    dan nilai tidak berhingga dideteksi secara vektor. Pesan per baris/sel
+    dibatasi max_errors per jenis kesalahan ditambah satu ringkasan sisanya.
+    ndarray (termasuk memmap) dikembalikan apa adanya tanpa salinan.
+
+    Returns:
+        Tuple (array, errors); array bernilai None jika errors tidak kosong
+    """
+    if isinstance(matrix, np.ndarray):
+        if matrix.ndim != 2 or matrix.size == 0 or matrix.dtype.kind not in 'iuf':
+            return None, ["Matriks harus berupa array numerik 2 dimensi yang tidak kosong"]
+        # Diperiksa per blok baris agar memmap tidak dimuat seluruhnya
+        if matrix.dtype.kind == 'f':
+            bad = [np.argwhere(~np.isfinite(matrix[block])) + (block.start, 0)
+                   for block in _row_blocks(matrix.shape)]
+            bad = np.concatenate(bad)
+            if len(bad):
+                return None, _cell_errors(matrix, bad, "bukan angka berhingga", max_errors)
+        return matrix, []
+
+    if not isinstance(matrix, (list, tuple)) or not matrix:
+        return None, ["Matriks kosong"]
+    if not all(isinstance(row, (list, tuple, np.ndarray)) for row in matrix):
+        return None, ["Setiap baris matriks harus berupa list"]
+    lengths = np.fromiter(map(len, matrix), dtype=np.intp, count=len(matrix))
+    cols = int(lengths[0])
+    if cols == 0:
+        return None, ["Matriks kosong"]
+    ragged = np.flatnonzero(lengths != cols)
+    if len(ragged):
+        errors = [f"Baris {i + 1} memiliki {lengths[i]} kolom, seharusnya {cols}"
+                  for i in ragged[:max_errors]]
+        return None, errors + _remaining(len(ragged), max_errors, "baris")
+
+    try:
+        array = np.asarray(matrix)
+        if array.dtype.kind in 'bUSO':
+            # Boolean, string angka, atau campuran tipe: dikonversi sekali ke float
+            array = array.astype(float)
+        elif array.dtype.kind not in 'iuf':
+            array = None
+    except (ValueError, TypeError):
+        array = None
+    if array is None or array.ndim != 2:
+        # Hanya pada input yang gagal: cari sel yang tidak dapat dikonversi
+        bad = np.array([(i, j) for i, row in enumerate(matrix)
+                        for j, val in enumerate(row) if not _is_scalar_number(val)],
+                       dtype=np.intp).reshape(-1, 2)
+        if not len(bad):
+            return None, ["Semua elemen matriks harus berupa angka"]
+        return None, _cell_errors(matrix, bad, "bukan angka", max_errors)
+
+    if array.dtype.kind == 'f':
+        bad = np.argwhere(~np.isfinite(array))
+        if len(bad):
+            return None, _cell_errors(matrix, bad, "bukan angka berhingga", max_errors)
+    return array, []
+
+
+def _is_scalar_number(value) -> bool:
+    """
+    True jika value adalah skalar yang dapat dikonversi ke float.
+    """
+    try:
+        float(value)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def _cell_errors(matrix, cells: np.ndarray, reason: str, max_errors: int) -> List[str]:
+    """
+    Pesan error untuk max_errors sel pertama dan ringkasan sisanya.
+    """
+    errors = [f"Nilai di baris {i + 1}, kolom {j + 1} {reason}: {matrix[i][j]}"
+              for i, j in cells[:max_errors].tolist()]
+    return errors + _remaining(len(cells), max_errors, "nilai")
+
+
+def _remaining(count: int, max_errors: int, noun: str) -> List[str]:
+    """
+    Ringkasan kesalahan yang tidak ditampilkan satu per satu.
+    """
+    if count <= max_errors:
+        return []
+    return [f"... dan {count - max_errors} {noun} tidak valid lainnya ({count} total)"]
+
+
+def resolve_dtype(array: np.ndarray, dtype: str) -> str:
+    """
+    dtype kerja konkret untuk matriks biaya numerik ('auto' dipilihkan).
+    
+    dtype integer hanya diterima jika semua biaya bulat dan cukup kecil
+    sehingga reduksi dan update (dibatasi (n + 1) * max|c|) tidak overflow.
+    
+    Raises:
+        ValueError: Jika biaya tidak dapat dinyatakan dengan dtype integer
+    """
+    if dtype == 'auto' or dtype.startswith('int'):
+        # Diperiksa per blok baris tanpa temporary seukuran matriks; dtype float
+        # tidak memerlukan pass ini
+        integral = array.dtype.kind in 'iu' or all(
+            np.all(array[block] == np.trunc(array[block])) for block in _row_blocks(array.shape))
+        bound = _max_abs(array) * (max(array.shape) + 1)
+        if dtype == 'auto':
+            if not integral:
+                dtype = 'float64'
+            else:
+                dtype = 'int32' if bound <= np.iinfo(np.int32).max else 'int64'
+                
+    if dtype.startswith('int'):
+        if not integral:
+            raise ValueError(f"Matrix berisi nilai pecahan; tidak dapat memakai dtype {dtype}")
+        if bound > np.iinfo(dtype).max:
+            raise ValueError(f"Nilai biaya terlalu besar untuk dtype {dtype}; gunakan int64 atau float64")
+    return dtype
+
+
+def _as_cost_array(matrix, dtype: str, overwrite_input: bool = False) -> np.ndarray:
+    """
+    Salin matriks biaya ke array kerja dengan dtype yang diminta.
+    
+    dtype divalidasi dan dipilih oleh resolve_dtype. Dengan overwrite_input,
+    ndarray writeable dan C-contiguous yang sudah ber-dtype tersebut
+    dikembalikan apa adanya.
+    """
+    array = np.asarray(matrix)
+    # List of lists sudah menjadi array baru; ndarray milik pemanggil
+    owned = not isinstance(matrix, np.ndarray)
+    if array.dtype.kind not in 'iuf':
+        array = array.astype(float)
+        owned = True
+        
+    dtype = resolve_dtype(array, dtype)
+    if owned:
+        return array.astype(dtype, copy=False)
+    if (overwrite_input and matrix.dtype == dtype
+            and matrix.flags.writeable and matrix.flags.c_contiguous):
+        return matrix
+    # Satu salinan kerja di RAM (juga untuk input memmap)
+    return np.array(array, dtype=dtype)
+
+
+def _zero_tolerance(cost: np.ndarray) -> float:
+    """
+    Toleransi uji nol: 0 untuk integer, beberapa ulp dari biaya terbesar untuk float.
+    """
+    if cost.dtype.kind in 'iu':
+        return 0
+    return 16 * float(np.finfo(cost.dtype).eps) * max(1.0, _max_abs(cost))
+
+
+def _max_abs(array: np.ndarray) -> float:
+    """
+    Nilai absolut terbesar tanpa membuat salinan np.abs(array).
+    """
+    return max(abs(float(np.max(array))), abs(float(np.min(array))))
+
+
+def _row_blocks(shape: Tuple[int, int], block_elements: int = 1 << 20):
+    """
+    Slice blok baris berisi sekitar block_elements elemen.
+    """
+    rows, cols = shape
+    step = max(1, block_elements // max(cols, 1))
+    for start in range(0, rows, step):
+        yield slice(start, min(start + step, rows))
+
+
+def _dual_bound(cost: np.ndarray, u: np.ndarray, v: np.ndarray, reduced: bool = False) -> float:
+    """
+    Batas bawah biaya assignment minimum dari dual feasible (u, v).
+    
+    Setiap assignment bernilai sum(u) + sum(v) ditambah biaya tereduksinya,
+    sehingga minimum setiap baris c - u - v ikut ditambahkan (berlaku untuk
+    baris <= kolom dengan v <= 0). Dengan reduced=True, cost sudah berupa
+    matriks tereduksi.
+    """
+    bound = float(np.sum(u) + np.sum(v))
+    for block in _row_blocks(cost.shape):
+        rows = cost[block] if reduced else cost[block] - u[block, None] - v[None, :]
+        bound += float(np.sum(np.min(rows, axis=1)))
+    return bound
+
+
+def _greedy_complete(cost: np.ndarray, col4row: np.ndarray,
+                     v: Optional[np.ndarray] = None,
+                     order: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Lengkapi assignment parsial: setiap baris bebas (berurutan sesuai order,
+    atau indeks) mengambil kolom bebas dengan biaya (tereduksi terhadap v,
+    jika diberikan) terkecil.
+    """
+    col4row = col4row.copy()
+    free_cols = np.ones(cost.shape[1], dtype=bool)
+    free_cols[col4row[col4row >= 0]] = False
+    for i in np.flatnonzero(col4row < 0) if order is None else order:
+        row = cost[i] if v is None else cost[i] - v
+        j = int(np.argmin(np.where(free_cols, row, np.inf)))
+        col4row[i] = j
+        free_cols[j] = False
+    return col4row
+
+
+def _approximate_assignment(cost: np.ndarray,
+                            max_rounds: int = APPROX_MAX_ROUNDS) -> Tuple[np.ndarray, float, int]:
+    """
+    Assignment mendekati optimal untuk matriks n x m (n <= m) dalam O(nm) per putaran.
+    
+    Greedy berbasis regret (selisih biaya terkecil kedua dan terkecil setiap
+    baris): setiap kolom yang menjadi argmin beberapa baris diberikan sekaligus
+    ke baris dengan regret terbesar, lalu baris sisanya memilih kolom bebas
+    termurah mulai dari regret terbesar. Hasilnya diperbaiki dengan paling
+    banyak max_rounds putaran 2-opt: tukar kolom dua baris, atau pindah ke
+    kolom bebas jika n < m.
+    
+    Returns:
+        Tuple (col4row, lower_bound, moves): lower_bound adalah jumlah minimum
+        baris ditambah minimum kolom matriks tereduksi baris (hanya baris jika
+        n < m), sehingga lower_bound <= biaya optimum
+    """
+    n, m = cost.shape
+    best = np.empty(n, dtype=np.intp)
+    row_min = np.empty(n)
+    regret = np.full(n, np.inf)
+    for block in _row_blocks(cost.shape):
+        rows = cost[block]
+        best[block] = np.argmin(rows, axis=1)
+        row_min[block] = rows[np.arange(len(rows)), best[block]]
+        if m > 1:
+            regret[block] = np.partition(rows, 1, axis=1)[:, 1] - row_min[block]
+            
+    # Dual feasible u = minimum baris, v = minimum kolom setelah reduksi baris
+    lower_bound = float(np.sum(row_min))
+    if n == m:
+        col_min = np.full(m, np.inf)
+        for block in _row_blocks(cost.shape):
+            np.minimum(col_min, np.min(cost[block] - row_min[block, None], axis=0), out=col_min)
+        lower_bound += float(np.sum(col_min))
+        
+    # Kolom argmin diberikan ke peminat dengan regret terbesar
+    col4row = np.full(n, -1, dtype=np.intp)
+    order = np.lexsort((-regret, best))
+    cols, first = np.unique(best[order], return_index=True)
+    col4row[order[first]] = cols
+    free_rows = np.flatnonzero(col4row < 0)
+    col4row = _greedy_complete(cost, col4row,
+                               order=free_rows[np.argsort(-regret[free_rows], kind='stable')])
+    
+    rows = np.arange(n)
+    moves = 0
+    for _ in range(max_rounds):
+        assigned = cost[rows, col4row].astype(float)
+        # Tukar kolom baris i dan k: c[i, k'] + c[k, i'] - c[i, i'] - c[k, k']
+        partner = np.empty(n, dtype=np.intp)
+        gain = np.empty(n)
+        for block in _row_blocks((n, n)):
+            swapped = (cost[block][:, col4row] + cost[:, col4row[block]].T
+                       - assigned[block, None] - assigned[None, :])
+            partner[block] = np.argmin(swapped, axis=1)
+            gain[block] = swapped[np.arange(len(swapped)), partner[block]]
+            
+        # Pindah ke kolom bebas termurah (hanya jika n < m)
+        free_cols = np.ones(m, dtype=bool)
+        free_cols[col4row] = False
+        target = np.full(n, -1, dtype=np.intp)
+        if n < m:
+            free_idx = np.flatnonzero(free_cols)
+            for block in _row_blocks((n, len(free_idx))):
+                moved = cost[block][:, free_idx] - assigned[block, None]
+                k = np.argmin(moved, axis=1)
+                better = moved[np.arange(len(moved)), k] < gain[block]
+                target[block] = np.where(better, free_idx[k], -1)
+                gain[block] = np.where(better, moved[np.arange(len(moved)), k], gain[block])
+                
+        # Terapkan perbaikan terbesar lebih dulu; baris yang sudah berubah dilewati
+        touched = np.zeros(n, dtype=bool)
+        applied = 0
+        for i in np.argsort(gain, kind='stable'):
+            if gain[i] >= 0:
+                break
+            if touched[i]:
+                continue
+            j = target[i]
+            if j >= 0:
+                if not free_cols[j]:
+                    continue
+                free_cols[col4row[i]] = True
+                free_cols[j] = False
+                col4row[i] = j
+            else:
+                k = partner[i]
+                if touched[k]:
+                    continue
+                col4row[i], col4row[k] = col4row[k], col4row[i]
+                touched[k] = True
+            touched[i] = True
+            applied += 1
+        moves += applied
+        if not applied:
+            break
+            
+    return col4row, lower_bound, moves
+
+
+def _strip_dummy_duals(u: np.ndarray, v: np.ndarray, dummy_rows: int,
+                       dummy_cols: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Buang dual dummy rows/columns dari matriks seimbang.
+    
+    Semua dummy row memiliki dual yang sama (biaya dummy nol), sehingga
+    menggesernya ke dual kolom memberikan dual masalah persegi panjang dengan
+    v <= 0 dan v = 0 pada kolom yang tidak di-assign (simetris untuk dummy columns).
+    """
+    if dummy_rows:
+        shift = np.max(u[-dummy_rows:])
+        return u[:-dummy_rows] - shift, v + shift
+    if dummy_cols:
+        shift = np.max(v[-dummy_cols:])
+        return u + shift, v[:-dummy_cols] - shift
+    return u, v
+
+
+def verify(matrix, assignment: List[Tuple[int, int]], duals: Dict[str, Any],
+           maximize: bool = False, tol: float = 1e-9) -> Dict[str, Any]:
+    """
+    Periksa sertifikat optimalitas assignment dalam satu pass O(n²) tanpa solve ulang.
+    
+    Dual berada di ruang minimisasi yang sama dengan solve(): untuk maksimisasi
+    biaya dikonversi menjadi max(c) - c. Yang diperiksa: assignment valid,
+    feasibility dual (c - u - v >= 0), complementary slackness (nol pada
+    assignment, dual sisi yang lebih besar <= 0 dan nol jika tidak di-assign),
+    dan objektif primal sama dengan objektif dual.
+    
+    Args:
+        matrix: Matriks biaya (list of lists / ndarray), atau SparseCostMatrix /
+            matriks scipy.sparse (hanya edge yang diperiksa)
+        assignment: Daftar pasangan (row, col)
+        duals: Dictionary dengan 'u' (baris) dan 'v' (kolom)
+        maximize: True jika assignment berasal dari maksimisasi
+        tol: Toleransi relatif terhadap nilai biaya absolut terbesar
+        
+    Returns:
+        Dictionary berisi is_optimal, errors, total_cost, dual_bound (objektif dual
+        dalam skala biaya asli) dan max_violation
+    """
+    sparse = None
+    if isinstance(matrix, SparseCostMatrix) or hasattr(matrix, 'tocsr'):
+        sparse = SparseCostMatrix.from_any(matrix)
+        rows, cols = sparse.shape
+        costs = sparse.data
+    else:
+        costs = np.asarray(matrix, dtype=float)
+        if costs.ndim != 2:
+            raise ValueError("Matrix harus 2 dimensi")
+        rows, cols = costs.shape
+        
+    u = np.asarray(duals['u'], dtype=float)
+    v = np.asarray(duals['v'], dtype=float)
+    if u.shape != (rows,) or v.shape != (cols,):
+        raise ValueError(f"Ukuran dual ({u.size}, {v.size}) tidak sesuai dengan matriks {rows}x{cols}")
+        
+    errors = []
+    pairs = np.asarray(assignment, dtype=np.intp).reshape(-1, 2)
+    if len(pairs) and (pairs.min() < 0 or pairs[:, 0].max() >= rows or pairs[:, 1].max() >= cols):
+        raise ValueError("Assignment berada di luar ukuran matriks")
+    if len(pairs) != min(rows, cols):
+        errors.append(f"Assignment berisi {len(pairs)} pasangan, seharusnya {min(rows, cols)}")
+    if len(np.unique(pairs[:, 0])) != len(pairs) or len(np.unique(pairs[:, 1])) != len(pairs):
+        errors.append("Assignment memakai baris atau kolom yang sama lebih dari sekali")
+        
+    # Biaya di ruang minimisasi
+    finite = np.isfinite(costs)
+    scale = max(1.0, float(np.max(np.abs(costs[finite]), initial=0.0)))
+    # Sama dengan konversi maksimisasi pada solve(): max(c), bukan max(c, 0)
+    max_val = float(np.max(costs[finite])) if np.any(finite) else 0.0
+    if maximize:
+        costs = max_val - costs
+    tol = tol * scale
+    
+    if sparse is None:
+        assigned_costs = costs[pairs[:, 0], pairs[:, 1]]
+        reduced = costs - u[:, None] - v[None, :]
+    else:
+        work = SparseCostMatrix(sparse.indptr, sparse.indices, costs, sparse.shape)
+        assigned_costs = work.lookup(pairs[:, 0], pairs[:, 1])
+        reduced = costs - u[sparse.row_indices()] - v[sparse.indices]
+    if not np.all(np.isfinite(assigned_costs)):
+        errors.append("Assignment memakai pasangan terlarang")
+        
+    violation = max(0.0, -float(np.min(reduced, initial=0.0)))
+    if violation > tol:
+        errors.append(f"Dual tidak feasible: c - u - v minimum {-violation}")
+        
+    slack = assigned_costs - u[pairs[:, 0]] - v[pairs[:, 1]]
+    if len(slack) and np.max(np.abs(slack)) > tol:
+        errors.append(f"Complementary slackness dilanggar: selisih maksimum {np.max(np.abs(slack))}")
+        
+    # Dual sisi yang lebih besar harus <= 0 dan nol pada baris/kolom yang tidak di-assign
+    if rows != cols:
+        side, assigned = (v, pairs[:, 1]) if rows < cols else (u, pairs[:, 0])
+        free = np.ones(len(side), dtype=bool)
+        free[assigned] = False
+        if np.max(side, initial=0.0) > tol or np.any(np.abs(side[free]) > tol):
+            errors.append("Dual sisi yang lebih besar harus <= 0 dan nol jika tidak di-assign")
+            
+    primal = float(np.sum(assigned_costs))
+    dual_objective = float(np.sum(u) + np.sum(v))
+    if not abs(primal - dual_objective) <= tol * max(1, len(pairs)):
+        errors.append(f"Objektif primal {primal} tidak sama dengan objektif dual {dual_objective}")
+        
+    original_costs = sparse.lookup(pairs[:, 0], pairs[:, 1]) if sparse is not None else \
+        np.asarray(matrix, dtype=float)[pairs[:, 0], pairs[:, 1]]
+    return {
+        'is_optimal': not errors,
+        'errors': errors,
+        'total_cost': float(np.sum(original_costs)),
+        'dual_bound': len(pairs) * max_val - dual_objective if maximize else dual_objective,
+        'max_violation': violation
+    }
+
+
+def _parse_warm_start(warm_start: Dict[str, Any], rows: int,
+                      cols: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Validasi warm start dan ubah menjadi array (u, v, col4row).
+    """
+    duals = warm_start.get('duals')
+    if not isinstance(duals, Mapping) or duals.get('u') is None or duals.get('v') is None:
+        raise ValueError("warm_start harus berisi 'duals' dengan 'u' dan 'v'")
+        
+    u = np.asarray(duals['u'], dtype=float)
+    v = np.asarray(duals['v'], dtype=float)
+    if u.shape != (rows,) or v.shape != (cols,):
+        raise ValueError(f"Ukuran dual warm_start ({u.size}, {v.size}) tidak sesuai "
+                         f"dengan matriks {rows}x{cols}")
+    if not (np.all(np.isfinite(u)) and np.all(np.isfinite(v))):
+        raise ValueError("Dual warm_start harus berupa bilangan berhingga")
+        
+    col4row = np.full(rows, -1, dtype=np.intp)
+    pairs = np.asarray(warm_start.get('assignment') or [], dtype=np.intp).reshape(-1, 2)
+    if len(pairs):
+        if (pairs.min() < 0 or pairs[:, 0].max() >= rows or pairs[:, 1].max() >= cols):
+            raise ValueError("Assignment warm_start berada di luar ukuran matriks")
+        col4row[pairs[:, 0]] = pairs[:, 1]
+    return u, v, col4row
+
+
+def _warm_start_duals(cost: np.ndarray, col4row: np.ndarray,
+                      v: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bangun ulang dual feasible dari potensial kolom sebelumnya.
+    
+    u dihitung ulang sebagai min_j(c[i, j] - v[j]) sehingga semua biaya
+    tereduksi tidak negatif untuk biaya baru; hanya pasangan lama yang masih
+    tight (dan tidak berebut kolom) yang dipertahankan. Untuk n < m, kolom
+    yang tidak di-assign harus memiliki v = 0, sehingga proses diulang hingga
+    stabil (pasangan hanya bisa berkurang).
+    
+    Returns:
+        Tuple (col4row, u, v) yang siap dilanjutkan oleh Dijkstra
+    """
+    n, m = cost.shape
+    rows = np.arange(n)
+    col4row = col4row.copy()
+    v = v.copy()
+    if n < m:
+        np.minimum(v, 0.0, out=v)
+    # Pasangan terlarang (biaya inf, lihat solve_k_best) tidak ikut menentukan toleransi
+    tol = 1e-12 * max(1.0, float(np.max(np.abs(cost), where=np.isfinite(cost), initial=0.0)))
+    
+    while True:
+        u = np.min(cost - v[None, :], axis=1)
+        assigned = col4row >= 0
+        reduced = cost[rows[assigned], col4row[assigned]] - u[assigned] - v[col4row[assigned]]
+        keep = np.zeros(n, dtype=bool)
+        keep[np.flatnonzero(assigned)[reduced <= tol]] = True
+        
+        # Kolom yang diklaim beberapa baris hanya diberikan ke baris pertama
+        kept_rows = np.flatnonzero(keep)
+        _, first = np.unique(col4row[kept_rows], return_index=True)
+        keep[:] = False
+        keep[kept_rows[first]] = True
+        col4row[~keep] = -1
+        
+        if n == m:
+            break
+        free_cols = np.ones(m, dtype=bool)
+        free_cols[col4row[keep]] = False
+        if not np.any(v[free_cols] != 0):
+            break
+        v[free_cols] = 0.0
+        
+    # Pasangan yang dipertahankan dibuat tepat nol
+    u[keep] = cost[rows[keep], col4row[keep]] - v[col4row[keep]]
+    return col4row, u, v
+
+
+def _shortest_augmenting_path(cost: np.ndarray,
+                              init: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                              deadline: Optional[float] = None,
+                              progress: Optional[Dict[str, Any]] = None
+                              ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shortest augmenting path (Jonker-Volgenant) untuk matriks n x m dengan n <= m, O(n²m).
+    
+    Setiap baris bebas di-augment lewat Dijkstra pada biaya tereduksi
+    c[i, j] - u[i] - v[j] >= 0, lalu potensial dual u (baris) dan v (kolom)
+    diperbarui sehingga edge pada assignment tetap bernilai nol. Untuk n < m
+    v tetap <= 0 dan bernilai nol pada kolom yang tidak di-assign.
+    
+    Args:
+        cost: Matriks biaya n x m
+        init: Warm start opsional (col4row, v) dari solve sebelumnya; hanya
+            baris yang pasangannya tidak lagi tight yang di-augment
+        deadline: Waktu time.perf_counter() untuk berhenti augmentasi; baris
+            yang belum di-augment bernilai -1 dan dual tetap feasible
+        progress: Dictionary opsional; 'iterations' dinaikkan setiap augmentasi
+    
+    Returns:
+        Tuple (col4row, u, v): kolom untuk setiap baris dan potensial dual
+    """
+    n, m = cost.shape
+    col4row = np.full(n, -1, dtype=np.intp)
+    row4col = np.full(m, -1, dtype=np.intp)
+    
+    if init is not None:
+        col4row, u, v = _warm_start_duals(cost, *init)
+        assigned = col4row >= 0
+        row4col[col4row[assigned]] = np.flatnonzero(assigned)
+    else:
+        if n == m:
+            # Inisialisasi dual dari reduksi kolom lalu baris (per blok baris)
+            v = np.min(cost, axis=0).astype(float)
+            u = np.empty(n)
+            tight_cols = np.empty(n, dtype=np.intp)
+            for block in _row_blocks(cost.shape):
+                reduced = cost[block] - v[None, :]
+                u[block] = np.min(reduced, axis=1)
+                tight_cols[block] = np.argmin(reduced - u[block, None], axis=1)
+        else:
+            # Kolom yang tidak ter-assign harus memiliki v = 0
+            v = np.zeros(m)
+            u = np.min(cost, axis=1).astype(float)
+            tight_cols = np.argmin(cost, axis=1)
+        
+        # Assignment awal: baris pertama yang tight pada suatu kolom mendapatkannya
+        cols, first_rows = np.unique(tight_cols, return_index=True)
+        col4row[first_rows] = cols
+        row4col[cols] = first_rows
+    
+    for cur_row in np.where(col4row < 0)[0]:
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        if progress is not None:
+            progress['iterations'] += 1
+        shortest = np.full(m, np.inf)
+        path = np.full(m, -1, dtype=np.intp)
+        visited_rows = np.zeros(n, dtype=bool)
+        visited_cols = np.zeros(m, dtype=bool)
+        
+        i = cur_row
+        min_val = 0.0
+        sink = -1
+        while sink < 0:
+            visited_rows[i] = True
+            remaining = ~visited_cols
+            reduced = min_val + cost[i] - u[i] - v
+            better = remaining & (reduced < shortest)
+            shortest[better] = reduced[better]
+            path[better] = i
+            
+            candidates = np.where(remaining, shortest, np.inf)
+            j = int(np.argmin(candidates))
+            if not np.isfinite(candidates[j]):
+                raise ValueError("Assignment tidak feasible")
+            min_val = candidates[j]
+            visited_cols[j] = True
+            if row4col[j] < 0:
+                sink = j
+            else:
+                i = row4col[j]
+                
+        # Update potensial dual
+        u[cur_row] += min_val
+        others = visited_rows.copy()
+        others[cur_row] = False
+        u[others] += min_val - shortest[col4row[others]]
+        v[visited_cols] -= min_val - shortest[visited_cols]
+        
+        # Augmentasi sepanjang path
+        j = sink
+        while True:
+            i = path[j]
+            row4col[j] = i
+            col4row[i], j = j, col4row[i]
+            if i == cur_row:
+                break
+                
+    return col4row, u, v
+
+
+def solve_batch(costs: np.ndarray, maximize: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Selesaikan banyak assignment problem persegi berukuran sama sekaligus.
+    
+    Reduksi baris/kolom dan shortest augmenting path dijalankan serentak untuk
+    seluruh batch dengan operasi array, sehingga overhead per matriks kecil.
+    
+    Args:
+        costs: Array biaya berbentuk [B, n, n]
+        maximize: True untuk maksimisasi, False untuk minimisasi
+        
+    Returns:
+        Tuple (assignments, total_costs): permutasi kolom per baris [B, n]
+        dan total biaya [B]
+    """
+    costs = np.asarray(costs, dtype=float)
+    if costs.ndim != 3 or costs.shape[1] != costs.shape[2] or costs.shape[1] == 0:
+        raise ValueError("costs harus berbentuk [B, n, n] dengan n > 0")
+    if not np.all(np.isfinite(costs)):
+        raise ValueError("costs mengandung nilai yang tidak valid")
+        
+    batch, n, _ = costs.shape
+    cost = costs.max(axis=(1, 2), keepdims=True) - costs if maximize else costs
+    batch_index = np.arange(batch)
+    
+    # Reduksi baris lalu kolom sebagai potensial dual awal
+    u = cost.min(axis=2)
+    v = (cost - u[:, :, None]).min(axis=1)
+    col4row = np.full((batch, n), -1, dtype=np.intp)
+    row4col = np.full((batch, n), -1, dtype=np.intp)
+    
+    for cur_row in range(n):
+        shortest = np.full((batch, n), np.inf)
+        path = np.full((batch, n), -1, dtype=np.intp)
+        visited_rows = np.zeros((batch, n), dtype=bool)
+        visited_cols = np.zeros((batch, n), dtype=bool)
+        row = np.full(batch, cur_row, dtype=np.intp)
+        min_val = np.zeros(batch)
+        sink = np.full(batch, -1, dtype=np.intp)
+        
+        # Dijkstra serentak; matriks yang sudah menemukan kolom bebas berhenti
+        active = batch_index
+        while len(active):
+            r = row[active]
+            visited_rows[active, r] = True
+            remaining = ~visited_cols[active]
+            reduced = (min_val[active, None] + cost[active, r, :]
+                       - u[active, r][:, None] - v[active])
+            current = shortest[active]
+            better = remaining & (reduced < current)
+            shortest[active] = np.where(better, reduced, current)
+            path[active] = np.where(better, r[:, None], path[active])
+            
+            candidates = np.where(remaining, shortest[active], np.inf)
+            col = np.argmin(candidates, axis=1)
+            min_val[active] = candidates[np.arange(len(active)), col]
+            visited_cols[active, col] = True
+            
+            owner = row4col[active, col]
+            done = owner < 0
+            sink[active[done]] = col[done]
+            row[active[~done]] = owner[~done]
+            active = active[~done]
+            
+        # Update potensial dual
+        others = visited_rows.copy()
+        others[:, cur_row] = False
+        matched = np.take_along_axis(shortest, np.maximum(col4row, 0), axis=1)
+        u += np.where(others, min_val[:, None] - matched, 0)
+        u[:, cur_row] += min_val
+        v -= np.where(visited_cols, min_val[:, None] - shortest, 0)
+        
+        # Augmentasi sepanjang path masing-masing matriks
+        col = sink.copy()
+        active = batch_index
+        while len(active):
+            c = col[active]
+            r = path[active, c]
+            row4col[active, c] = r
+            col[active] = col4row[active, r]
+            col4row[active, r] = c
+            active = active[r != cur_row]
+            
+    total_costs = costs[batch_index[:, None], np.arange(n)[None, :], col4row].sum(axis=1)
+    return col4row, total_costs
+
+
+def solve_k_best(matrix, k: int, maximize: bool = False) -> List[Dict[str, Any]]:
+    """
+    Cari k assignment terbaik dengan partisi Murty.
+
+    Setiap solusi yang diambil dari priority queue dipecah menjadi subproblem
+    anak: anak ke-t melarang pasangan ke-t dan memaksa pasangan sebelumnya.
+    Dual induk tetap feasible untuk anak (biaya hanya naik menjadi inf), dan
+    assignment induk tetap tight kecuali pada baris yang dilarang, sehingga
+    setiap anak cukup satu augmentasi jv alih-alih solve penuh.
+
+    Args:
+        matrix: Matriks biaya (list of lists / ndarray), boleh tidak seimbang
+        k: Jumlah assignment yang dicari
+        maximize: True untuk maksimisasi, False untuk minimisasi
+
+    Returns:
+        Daftar maksimal k dictionary berisi rank, assignment, dan total_cost,
+        terurut dari yang terbaik (kurang dari k jika assignment tidak cukup)
+    """
+    if k < 1:
+        raise ValueError("k harus bilangan bulat positif")
+    original = np.asarray(matrix, dtype=float)
+    if original.ndim != 2 or original.size == 0 or not np.all(np.isfinite(original)):
+        raise ValueError("Input matrix tidak valid")
+
+    # Ruang minimisasi dengan baris <= kolom
+    cost = np.max(original) - original if maximize else original
+    transposed = cost.shape[0] > cost.shape[1]
+    cost = np.ascontiguousarray(cost.T if transposed else cost)
+    n = cost.shape[0]
+    rows = np.arange(n)
+
+    col4row, _, v = _shortest_augmenting_path(cost)
+    # Node: (biaya, urutan, col4row, v, pasangan dipaksa, pasangan dilarang)
+    queue = [(float(np.sum(cost[rows, col4row])), 0, col4row, v, (), ())]
+    pushed = 1
+    results = []
+
+    while queue and len(results) < k:
+        _, _, col4row, v, forced, forbidden = heapq.heappop(queue)
+        pairs = [(int(j), i) for i, j in enumerate(col4row)] if transposed else \
+            [(i, int(j)) for i, j in enumerate(col4row)]
+        pairs.sort()
+        results.append({
+            'rank': len(results) + 1,
+            'assignment': pairs,
+            'total_cost': float(np.sum(original[tuple(np.array(pairs).T)]))
+        })
+        if len(results) == k:
+            break
+
+        forced_rows = {i for i, _ in forced}
+        free_rows = [i for i in range(n) if i not in forced_rows]
+        for t, row in enumerate(free_rows):
+            child_forced = forced + tuple((i, int(col4row[i])) for i in free_rows[:t])
+            child_forbidden = forbidden + ((row, int(col4row[row])),)
+            child_cost = _murty_subproblem(cost, child_forced, child_forbidden)
+            if not np.any(np.isfinite(child_cost[row])):
+                continue
+
+            init = col4row.copy()
+            init[row] = -1
+            try:
+                child_col4row, _, child_v = _shortest_augmenting_path(child_cost, (init, v))
+            except ValueError:
+                # Tidak ada assignment yang memenuhi batasan subproblem
+                continue
+            total = float(np.sum(cost[rows, child_col4row]))
+            heapq.heappush(queue, (total, pushed, child_col4row, child_v, child_forced, child_forbidden))
+            pushed += 1
+
+    return results
+
+
+def _murty_subproblem(cost: np.ndarray, forced: Tuple[Tuple[int, int], ...],
+                      forbidden: Tuple[Tuple[int, int], ...]) -> np.ndarray:
+    """
+    Salin matriks biaya dengan pasangan dilarang dan dipaksa diberi biaya inf.
+
+    Pasangan (i, j) dipaksa dengan melarang semua pasangan lain di baris i
+    dan kolom j.
+    """
+    cost = cost.astype(float)
+    for i, j in forced:
+        kept = cost[i, j]
+        cost[i, :] = np.inf
+        cost[:, j] = np.inf
+        cost[i, j] = kept
+    for i, j in forbidden:
+        cost[i, j] = np.inf
+    return cost
+
+
+def _sparse_shortest_augmenting_path(sparse: SparseCostMatrix) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shortest augmenting path pada matriks sparse dengan baris <= kolom.
+    
+    Dijkstra memakai heap dan hanya menelusuri edge yang diizinkan, sehingga
+    setiap augmentasi O(E log n) dan memori O(n + E).
+    
+    Returns:
+        Tuple (col4row, u, v)
+        
+    Raises:
+        ValueError: jika tidak ada matching yang meng-assign semua baris
+    """
+    n_rows, n_cols = sparse.shape
+    indptr, indices, data = sparse.indptr, sparse.indices, sparse.data
+    degree = np.diff(indptr)
+    if np.any(degree == 0):
+        row = int(np.argmin(degree))
+        raise ValueError(f"Tidak ada perfect matching: baris {row + 1} tidak memiliki pasangan yang diizinkan")
+        
+    # Dual awal: u = minimum biaya per baris, v = 0 (v <= 0 tetap terjaga)
+    u = np.minimum.reduceat(data, indptr[:-1])
+    v = np.zeros(n_cols)
+    col4row = np.full(n_rows, -1, dtype=np.intp)
+    row4col = np.full(n_cols, -1, dtype=np.intp)
+    
+    # Assignment awal: baris pertama yang tight pada suatu kolom mendapatkannya
+    edge_rows = np.repeat(np.arange(n_rows), degree)
+    tight = np.flatnonzero(data == u[edge_rows])
+    tight_rows, first = np.unique(edge_rows[tight], return_index=True)
+    cols, first_rows = np.unique(indices[tight[first]], return_index=True)
+    col4row[tight_rows[first_rows]] = cols
+    row4col[cols] = tight_rows[first_rows]
+            
+    shortest = np.full(n_cols, np.inf)
+    path = np.full(n_cols, -1, dtype=np.intp)
+    scanned = np.zeros(n_cols, dtype=bool)
+    
+    for cur_row in np.where(col4row < 0)[0]:
+        heap = []
+        touched = []
+        visited_rows = [cur_row]
+        row, min_val, sink = cur_row, 0.0, -1
+        while True:
+            # Relaksasi edge dari baris yang baru dicapai
+            start, end = indptr[row], indptr[row + 1]
+            cols = indices[start:end]
+            reduced = min_val + data[start:end] - u[row] - v[cols]
+            better = ~scanned[cols] & (reduced < shortest[cols])
+            cols, reduced = cols[better], reduced[better]
+            touched.extend(cols[np.isinf(shortest[cols])].tolist())
+            shortest[cols] = reduced
+            path[cols] = row
+            for item in zip(reduced.tolist(), cols.tolist()):
+                heapq.heappush(heap, item)
+                
+            # Kolom terdekat yang belum dipindai
+            while heap and scanned[heap[0][1]]:
+                heapq.heappop(heap)
+            if not heap:
+                raise ValueError(f"Tidak ada perfect matching: baris {cur_row + 1} tidak dapat di-assign")
+            min_val, col = heapq.heappop(heap)
+            scanned[col] = True
+            if row4col[col] < 0:
+                sink = col
+                break
+            row = row4col[col]
+            visited_rows.append(row)
+            
+        # Update potensial dual
+        touched = np.array(touched, dtype=np.intp)
+        done = touched[scanned[touched]]
+        others = np.array(visited_rows[1:], dtype=np.intp)
+        u[cur_row] += min_val
+        u[others] += min_val - shortest[col4row[others]]
+        v[done] -= min_val - shortest[done]
+        
+        # Augmentasi sepanjang path
+        col = sink
+        while True:
+            row = path[col]
+            row4col[col] = row
+            col4row[row], col = col, col4row[row]
+            if row == cur_row:
+                break
+                
+        shortest[touched] = np.inf
+        scanned[touched] = False
+        
+    return col4row, u, v
+
+
+def _bipartite_components(sparse: SparseCostMatrix) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Label komponen terhubung graf bipartit edge yang diizinkan.
+    
+    Setiap akar dikaitkan ke label terkecil tetangganya lalu pointer jumping
+    meratakan pohon label, semuanya vektor atas seluruh edge. Label diberi
+    nomor ulang 0..k-1 terurut menurut baris/kolom terkecil; komponen berisi
+    baris mendapat label lebih dulu.
+    
+    Returns:
+        Tuple (row_label, col_label)
+    """
+    n, m = sparse.shape
+    heads, tails = sparse.row_indices(), sparse.indices + n
+    label = np.arange(n + m)
+    while True:
+        low = np.minimum(label[heads], label[tails])
+        hooked = label.copy()
+        np.minimum.at(hooked, label[heads], low)
+        np.minimum.at(hooked, label[tails], low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, label):
+            break
+        label = hooked
+    _, label = np.unique(label, return_inverse=True)
+    return label[:n], label[n:]
+
+
+def _solve_sparse_components(sparse: SparseCostMatrix, row_label: np.ndarray,
+                             col_label: np.ndarray, workers: int = 1
+                             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Selesaikan setiap komponen terhubung sebagai submatriks sparse lalu gabungkan.
+    
+    Tidak ada edge antar komponen, sehingga gabungan dual setiap komponen tetap
+    feasible (kolom tanpa edge mendapat v = 0). Komponen dengan paling sedikit
+    DECOMPOSE_MIN_EDGES_PER_TASK edge dikirim ke process pool jika workers > 1.
+    
+    Returns:
+        Tuple (col4row, u, v) dalam indeks asli
+    """
+    n, m = sparse.shape
+    components = int(row_label.max()) + 1
+    # Kolom tanpa edge membentuk komponen sendiri dengan label >= components
+    labels = max(components, int(col_label.max()) + 1)
+    row_order = np.argsort(row_label, kind='stable')
+    col_order = np.argsort(col_label, kind='stable')
+    row_start = np.searchsorted(row_label[row_order], np.arange(components + 1))
+    col_start = np.searchsorted(col_label[col_order], np.arange(labels + 1))
+    
+    # Indeks lokal baris/kolom di dalam komponennya
+    local_row = np.empty(n, dtype=np.intp)
+    local_row[row_order] = np.arange(n) - row_start[row_label[row_order]]
+    local_col = np.empty(m, dtype=np.intp)
+    local_col[col_order] = np.arange(m) - col_start[col_label[col_order]]
+    
+    # Edge dikelompokkan per komponen; urutan baris lalu kolom tetap terjaga
+    edge_rows = sparse.row_indices()
+    edge_order = np.argsort(row_label[edge_rows], kind='stable')
+    edge_start = np.searchsorted(row_label[edge_rows[edge_order]], np.arange(components + 1))
+    
+    tasks = []
+    for c in range(components):
+        rows = row_order[row_start[c]:row_start[c + 1]]
+        cols = col_order[col_start[c]:col_start[c + 1]]
+        if len(rows) > len(cols):
+            raise ValueError(f"Tidak ada perfect matching: {len(rows)} baris (mulai baris {rows[0] + 1}) "
+                             f"hanya terhubung ke {len(cols)} kolom")
+        edges = edge_order[edge_start[c]:edge_start[c + 1]]
+        indptr = np.zeros(len(rows) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(local_row[edge_rows[edges]], minlength=len(rows)), out=indptr[1:])
+        tasks.append((rows, cols, (indptr, local_col[sparse.indices[edges]], sparse.data[edges],
+                                   (len(rows), len(cols)))))
+        
+    col4row = np.full(n, -1, dtype=np.intp)
+    u = np.zeros(n)
+    v = np.zeros(m)
+    large = [c for c, task in enumerate(tasks) if task[2][0][-1] >= DECOMPOSE_MIN_EDGES_PER_TASK]
+    pool = None
+    if workers > 1 and len(large) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(large)))
+    try:
+        futures = {}
+        if pool is not None:
+            futures = {c: pool.submit(_solve_sparse_component, *tasks[c][2]) for c in large}
+        # Komponen kecil diselesaikan di sini selagi komponen besar berjalan di pool
+        for c, (rows, cols, csr) in enumerate(tasks):
+            local_cols, local_u, local_v = futures[c].result() if c in futures else \
+                _solve_sparse_component(*csr)
+            if n < m and len(rows) == len(cols):
+                # Komponen persegi: geser dual agar v <= 0 seperti pada masalah n < m
+                shift = np.max(local_v)
+                local_u, local_v = local_u + shift, local_v - shift
+            col4row[rows] = cols[local_cols]
+            u[rows] = local_u
+            v[cols] = local_v
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return col4row, u, v
+
+
+def _solve_sparse_component(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray,
+                            shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Shortest augmenting path untuk satu komponen (dipanggil juga di process pool).
+    """
+    return _sparse_shortest_augmenting_path(SparseCostMatrix(indptr, indices, data, shape))
+
+
+def _sorted_rows(cost) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Susun matriks (dense atau SparseCostMatrix) sebagai CSR dengan entri setiap
+    baris terurut menurut biaya.
+    
+    Untuk threshold t, tetangga baris i adalah prefix entri dengan biaya <= t.
+    
+    Returns:
+        Tuple (indptr, indices, data, n_cols)
+    """
+    if isinstance(cost, SparseCostMatrix):
+        order = np.lexsort((cost.data, cost.row_indices()))
+        return cost.indptr, cost.indices[order], cost.data[order], cost.shape[1]
+        
+    n, m = cost.shape
+    order = np.argsort(cost, axis=1, kind='stable')
+    data = np.take_along_axis(cost, order, axis=1).ravel()
+    return np.arange(0, n * m + 1, m, dtype=np.intp), order.ravel(), data, m
+
+
+def _bottleneck_matching(indptr: np.ndarray, indices: np.ndarray, data: np.ndarray,
+                         n_cols: int) -> Tuple[np.ndarray, int]:
+    """
+    Assignment bottleneck (min-max) untuk baris <= kolom.
+    
+    Binary search pada biaya berbeda yang terurut; setiap threshold diuji dengan
+    Hopcroft-Karp pada graf biaya <= threshold, O(E sqrt(n) log E) total.
+    Matching dari threshold yang gagal tetap valid untuk threshold yang lebih
+    besar sehingga dipakai sebagai awal uji berikutnya.
+    
+    Returns:
+        Tuple (col4row, jumlah uji matching)
+        
+    Raises:
+        ValueError: jika tidak ada matching yang meng-assign semua baris
+    """
+    n_rows = len(indptr) - 1
+    degree = np.diff(indptr)
+    if np.any(degree == 0):
+        row = int(np.argmin(degree))
+        raise ValueError(f"Tidak ada perfect matching: baris {row + 1} tidak memiliki pasangan yang diizinkan")
+        
+    # Setiap baris (dan setiap kolom jika persegi) harus di-assign
+    lower = np.max(data[indptr[:-1]])
+    if n_rows == n_cols:
+        col_min = np.full(n_cols, np.inf)
+        np.minimum.at(col_min, indices, data)
+        lower = max(lower, np.max(col_min))
+    values = np.unique(data[data >= lower])
+    
+    starts = indptr[:-1]
+    adjacency = indices.tolist()
+    base = (np.full(n_rows, -1, dtype=np.intp), np.full(n_cols, -1, dtype=np.intp))
+    best = None
+    checks = 0
+    lo, hi = 0, len(values) - 1
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        allowed = np.concatenate(([0], np.cumsum(data <= values[mid])))
+        ends = starts + allowed[indptr[1:]] - allowed[starts]
+        col4row, row4col = base[0].copy(), base[1].copy()
+        size = _hopcroft_karp(starts.tolist(), ends.tolist(), adjacency, col4row, row4col)
+        checks += 1
+        if size == n_rows:
+            best = col4row
+            hi = mid - 1
+        else:
+            base = (col4row, row4col)
+            lo = mid + 1
+            
+    if best is None:
+        raise ValueError("Tidak ada perfect matching pada pasangan yang diizinkan")
+    return best, checks
+
+
+def _hopcroft_karp(starts: List[int], ends: List[int], adjacency: List[int],
+                   col4row: np.ndarray, row4col: np.ndarray) -> int:
+    """
+    Perbesar matching (col4row, row4col) secara in-place hingga maksimum (Hopcroft-Karp).
+    
+    Tetangga baris i adalah adjacency[starts[i]:ends[i]]. Setiap fase BFS
+    membentuk lapisan dari baris bebas, lalu DFS iteratif mencari augmenting
+    path terpendek yang saling lepas.
+    
+    Returns:
+        Ukuran matching
+    """
+    n_rows = len(starts)
+    match_col = col4row.tolist()
+    match_row = row4col.tolist()
+    
+    while True:
+        dist = [-1] * n_rows
+        queue = [i for i in range(n_rows) if match_col[i] < 0]
+        for i in queue:
+            dist[i] = 0
+        found = False
+        for i in queue:
+            for p in range(starts[i], ends[i]):
+                r = match_row[adjacency[p]]
+                if r < 0:
+                    found = True
+                elif dist[r] < 0:
+                    dist[r] = dist[i] + 1
+                    queue.append(r)
+        if not found:
+            break
+            
+        pointer = list(starts)
+        for root in range(n_rows):
+            if match_col[root] >= 0 or dist[root] != 0:
+                continue
+            stack = [root]
+            while stack:
+                i = stack[-1]
+                r = -2
+                while pointer[i] < ends[i]:
+                    r = match_row[adjacency[pointer[i]]]
+                    pointer[i] += 1
+                    if r < 0 or dist[r] == dist[i] + 1:
+                        break
+                    r = -2
+                if r == -2:
+                    # Jalan buntu: baris tidak dikunjungi lagi pada fase ini
+                    dist[i] = -1
+                    stack.pop()
+                elif r >= 0:
+                    stack.append(r)
+                else:
+                    # Kolom bebas: augmentasi sepanjang kolom terakhir setiap baris di stack
+                    for row in stack:
+                        col = adjacency[pointer[row] - 1]
+                        match_col[row] = col
+                        match_row[col] = row
+                    break
+                    
+    col4row[:] = match_col
+    row4col[:] = match_row
+    return n_rows - match_col.count(-1)
+
+
+# Matriks benefit bersama untuk proses bidding auction (diisi oleh initializer pool)
+_AUCTION_SHARED = {}
+
+# Minimal jumlah bidder per proses agar bidding paralel sepadan dengan overhead IPC
+AUCTION_MIN_BIDDERS_PER_WORKER = 256
+
+# Komponen sparse dengan edge lebih sedikit dari ini diselesaikan di proses utama
+DECOMPOSE_MIN_EDGES_PER_TASK = 20000
+
+
+def _attach_auction_benefit(name: str, shape: Tuple[int, int], dtype: str):
+    """
+    Initializer pool: buka shared memory berisi matriks benefit.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    _AUCTION_SHARED['shm'] = shm
+    _AUCTION_SHARED['benefit'] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _auction_bids(benefit: np.ndarray, persons: np.ndarray, prices: np.ndarray,
+                  eps: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bid setiap person: objek terbaik dan harga baru (selisih dua nilai terbaik + eps).
+    """
+    values = benefit[persons] - prices
+    index = np.arange(len(persons))
+    best = np.argmax(values, axis=1)
+    best_value = values[index, best]
+    values[index, best] = -np.inf
+    second_value = np.max(values, axis=1)
+    return best, prices[best] + (best_value - second_value) + eps
+
+
+def _auction_bids_shared(persons: np.ndarray, prices: np.ndarray, eps: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bid di proses worker memakai matriks benefit dari shared memory.
+    """
+    return _auction_bids(_AUCTION_SHARED['benefit'], persons, prices, eps)
+
+
+def _auction(cost: np.ndarray, workers: int = 1,
+             theta: float = 5.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Auction algorithm (Bertsekas) dengan epsilon-scaling dan bidding Jacobi.
+    
+    Semua person yang belum ter-assign melakukan bid serentak terhadap harga
+    saat ini; setiap objek jatuh ke bid tertinggi. Untuk biaya integer, biaya
+    dikalikan n + 1 dan fase terakhir memakai epsilon = 1 sehingga hasilnya
+    optimal; biaya pecahan dijamin dalam n * epsilon dari optimum. Jika
+    workers > 1, bidder dibagi ke process pool yang membaca matriks benefit
+    dari shared memory.
+    
+    Returns:
+        Tuple (col4row, u, v, phases) dengan u, v potensial dual dalam skala biaya asli
+    """
+    n = cost.shape[0]
+    if n == 1:
+        return np.zeros(1, dtype=np.intp), cost[0].astype(float), np.zeros(1), 1
+        
+    span = float(np.max(cost) - np.min(cost))
+    if np.all(cost == np.round(cost)):
+        scale, eps_final = n + 1.0, 1.0
+    else:
+        scale, eps_final = 1.0, max(span, 1.0) * 1e-9
+    benefit = -cost * scale
+    prices = np.zeros(n)
+    eps = max(span * scale / theta, eps_final)
+    
+    pool = shm = None
+    if workers > 1 and n >= 2 * AUCTION_MIN_BIDDERS_PER_WORKER:
+        shm = shared_memory.SharedMemory(create=True, size=benefit.nbytes)
+        np.ndarray(benefit.shape, dtype=benefit.dtype, buffer=shm.buf)[:] = benefit
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_attach_auction_benefit,
+                                   initargs=(shm.name, benefit.shape, benefit.dtype.str))
+        
+    try:
+        phases = 0
+        while True:
+            phases += 1
+            owner = np.full(n, -1, dtype=np.intp)
+            col4row = np.full(n, -1, dtype=np.intp)
+            unassigned = np.arange(n)
+            while len(unassigned):
+                chunks = 1
+                if pool is not None:
+                    chunks = min(workers, len(unassigned) // AUCTION_MIN_BIDDERS_PER_WORKER)
+                if chunks > 1:
+                    parts = np.array_split(unassigned, chunks)
+                    bids = list(pool.map(_auction_bids_shared, parts,
+                                         [prices] * chunks, [eps] * chunks))
+                    objects = np.concatenate([b[0] for b in bids])
+                    amounts = np.concatenate([b[1] for b in bids])
+                else:
+                    objects, amounts = _auction_bids(benefit, unassigned, prices, eps)
+                    
+                # Bid tertinggi untuk setiap objek menang
+                order = np.lexsort((-amounts, objects))
+                first = np.ones(len(order), dtype=bool)
+                first[1:] = objects[order][1:] != objects[order][:-1]
+                winning = order[first]
+                won = objects[winning]
+                
+                previous = owner[won]
+                col4row[previous[previous >= 0]] = -1
+                owner[won] = unassigned[winning]
+                col4row[unassigned[winning]] = won
+                prices[won] = amounts[winning]
+                unassigned = np.flatnonzero(col4row < 0)
+                
+            if eps <= eps_final:
+                break
+            eps = max(eps / theta, eps_final)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            shm.close()
+            shm.unlink()
+            
+    # Dual untuk minimisasi: u[i] + v[j] <= c[i, j]
+    profit = np.max(benefit - prices[None, :], axis=1)
+    return col4row, -profit / scale, -prices / scale, phases
@@ -4,14 +4,16 @@ import json
 import time
 import traceback
 import sys
+import queue
+import threading
 from datetime import datetime
 import pandas as pd
 import numpy as np
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for, session
+from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for, session, Response
 from werkzeug.utils import secure_filename
 import flask
-from .hungarian import HungarianMethod
-from .utils import DataProcessor, Visualizer, FileManager
+from .hungarian import HungarianMethod, SparseCostMatrix, AssignmentResult, ENGINES, TRACE_LEVELS, DTYPES, OBJECTIVES, check_solve_options, resolve_dtype, verify, solve_k_best, summarize_steps
+from .utils import DataProcessor, Visualizer, FileManager, JobManager, JobQueueFull, ResultCache, CalculationStore
 import tempfile
 import uuid
 from collections import defaultdict
@@ -39,6 +41,21 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
 # No database extensions needed
 
+# Solve asinkron untuk matriks besar (/api/jobs)
+jobs = JobManager(app.config['HUNGARIAN_JOB_WORKERS'], app.config['HUNGARIAN_JOB_MAX'])
+
+# Hasil solve bersama /api/solve dan /api/get_steps, dialamati oleh isi matriks
+results_cache = ResultCache(app.config['HUNGARIAN_RESULT_CACHE_BYTES'],
+                            app.config['HUNGARIAN_RESULT_CACHE_TTL'])
+
+# Hasil perhitungan dense di balik calculation_id (entri lama dipindah ke disk)
+calculations = CalculationStore(app.config['HUNGARIAN_STORE_BYTES'],
+                                app.config['HUNGARIAN_STORE_DIR'],
+                                app.config['HUNGARIAN_STORE_MAX_SPILLED'])
+
+# PNG heatmap per matriks dan assignment (/api/heatmap)
+heatmap_cache = ResultCache(app.config['HUNGARIAN_HEATMAP_CACHE_BYTES'], ttl=None)
+
 # Add custom Jinja2 filter
 @app.template_filter('from_json')
 def from_json_filter(value):
@@ -107,65 +124,317 @@ def dashboard():
 def calculator():
     return render_template('calculator.html')
 
+def valid_result_fields(fields):
+    """True jika fields kosong atau daftar field AssignmentResult"""
+    return fields is None or (isinstance(fields, list) and set(fields) <= set(AssignmentResult.FIELDS))
+
+def parse_solve_request(data):
+    """
+    Validasi body /api/solve dan /api/jobs untuk matriks dense.
+    
+    Returns:
+        Tuple (problem, None) berisi matriks, array hasil validasi, dan opsi
+        solve, atau (None, respons error 400)
+    """
+    matrix = data.get('matrix')
+    engine = data.get('engine')
+    trace = data.get('trace', app.config['HUNGARIAN_API_TRACE'])
+    warm_start = data.get('warm_start')
+    # Biaya bulat diselesaikan dengan integer eksak (int32 jika aman)
+    dtype = data.get('dtype', 'auto')
+    objective = data.get('objective', 'sum')
+    if objective not in OBJECTIVES:
+        return None, (jsonify({'error': f'Objektif tidak dikenal: {objective}'}), 400)
+    # Solusi mendekati optimal dengan batas kualitas untuk matriks sangat besar
+    approximate = bool(data.get('approximate', False))
+    # Field 'result' yang dikonversi ke JSON (semua jika tidak diisi)
+    fields = data.get('fields')
+    if not valid_result_fields(fields):
+        return None, (jsonify({'error': f"fields harus berupa daftar dari: {', '.join(AssignmentResult.FIELDS)}"}), 400)
+    
+    if not matrix:
+        return None, (jsonify({'error': 'Matrix tidak boleh kosong'}), 400)
+    
+    # Validasi matrix; array hasil konversi langsung dipakai solver
+    array, validation = DataProcessor.prepare_matrix(matrix)
+    if not validation['is_valid']:
+        return None, (jsonify({'error': validation['errors']}), 400)
+    
+    # Engine classic untuk matriks kecil (langkah-langkah pembelajaran),
+    # shortest augmenting path untuk matriks besar
+    if engine is None and warm_start is not None:
+        engine = 'jv'
+    if engine is None:
+        size = max(validation['info']['rows'], validation['info']['cols'])
+        engine = 'classic' if size <= app.config['HUNGARIAN_CLASSIC_MAX_SIZE'] else 'jv'
+    if engine not in ENGINES:
+        return None, (jsonify({'error': f'Engine tidak dikenal: {engine}'}), 400)
+    if warm_start is not None and engine != 'jv':
+        return None, (jsonify({'error': "warm_start hanya didukung oleh engine 'jv'"}), 400)
+    if trace not in TRACE_LEVELS:
+        return None, (jsonify({'error': f'Level trace tidak dikenal: {trace}'}), 400)
+    if dtype not in DTYPES:
+        return None, (jsonify({'error': f'dtype tidak dikenal: {dtype}'}), 400)
+    # Solve anytime: hasil terbaik saat budget habis beserta batas dual
+    time_budget_ms = data.get('time_budget_ms')
+    if time_budget_ms is None and engine != 'auction' and objective == 'sum' and not approximate:
+        time_budget_ms = app.config['HUNGARIAN_API_TIME_BUDGET_MS']
+    if time_budget_ms is not None and (isinstance(time_budget_ms, bool)
+                                       or not isinstance(time_budget_ms, (int, float))
+                                       or time_budget_ms <= 0):
+        return None, (jsonify({'error': 'time_budget_ms harus bilangan positif'}), 400)
+    certificate = bool(data.get('certificate', False))
+    # Kombinasi opsi yang ditolak solve() dilaporkan sebagai 400, bukan 500
+    try:
+        check_solve_options(engine, objective, warm_start=warm_start, certificate=certificate,
+                            time_budget_ms=time_budget_ms, approximate=approximate,
+                            shape=(validation['info']['rows'], validation['info']['cols']))
+        if dtype.startswith('int'):
+            # Biaya pecahan/terlalu besar ditolak sekarang, bukan di worker /api/jobs
+            resolve_dtype(array, dtype)
+    except ValueError as e:
+        return None, (jsonify({'error': str(e)}), 400)
+    
+    return {
+        'matrix': matrix,
+        'array': array,
+        'validation': validation,
+        'fields': fields,
+        'options': {
+            'maximize': data.get('maximize', False),
+            'engine': engine,
+            'trace': trace,
+            'workers': app.config['HUNGARIAN_AUCTION_WORKERS'] if engine == 'auction' else 1,
+            'warm_start': warm_start,
+            'certificate': certificate,
+            'dtype': dtype,
+            'objective': objective,
+            'time_budget_ms': time_budget_ms,
+            'approximate': approximate
+        }
+    }, None
+
+def solve_cached(hungarian, array, maximize):
+    """
+    Solve engine classic dengan trace 'full' lewat cache hasil.
+    
+    Dipakai /api/solve (opsi default) dan /api/get_steps sehingga matriks yang
+    sama hanya diselesaikan sekali dan langkahnya dipakai ulang.
+    
+    Returns:
+        Tuple (AssignmentResult, True jika diambil dari cache)
+    """
+    key = ResultCache.key(array, maximize)
+    result = results_cache.get(key)
+    if result is not None:
+        return result, True
+    result = hungarian.solve(array, maximize, engine='classic', trace='full', dtype='auto')
+    results_cache.put(key, result, result.nbytes)
+    return result, False
+
+def is_cacheable(options):
+    """Opsi solve yang hasilnya sama dengan solve_cached (selain level trace)"""
+    return (options['engine'] == 'classic' and options['objective'] == 'sum'
+            and options['dtype'] == 'auto' and options['warm_start'] is None
+            and not options['certificate'] and not options['approximate']
+            and options['time_budget_ms'] is None)
+
+def run_solve_request(hungarian, problem):
+    """
+    Jalankan solve untuk request yang sudah divalidasi (parse_solve_request).
+    
+    Returns:
+        Tuple (AssignmentResult, payload JSON tanpa heatmap)
+    """
+    matrix, array = problem['matrix'], problem['array']
+    options = problem['options']
+    cached = False
+    start_time = time.time()
+    if is_cacheable(options):
+        result, cached = solve_cached(hungarian, array, bool(options['maximize']))
+    else:
+        result = hungarian.solve(array, **options)
+    execution_time = time.time() - start_time
+    
+    # Log calculation (no database storage)
+    log_activity('calculation_performed', f'Matrix size: {len(matrix)}x{len(matrix[0])}, Total cost: {result["total_cost"]}')
+    calculation_id = calculations.add(array, options['maximize'], result)
+    
+    # Format assignment untuk frontend
+    rows = np.flatnonzero(result.col4row >= 0)
+    cols = result.col4row[rows]
+    formatted_assignment = [
+        {'worker': row, 'task': col, 'cost': cost}
+        for row, col, cost in zip(rows.tolist(), cols.tolist(), array[rows, cols].astype(float).tolist())
+    ]
+    
+    result_json = result.to_dict(problem['fields'])
+    if 'steps' in result_json and is_cacheable(options) and options['trace'] != 'full':
+        # Hasil cache selalu bertrace 'full'; turunkan ke level yang diminta
+        result_json['steps'] = summarize_steps(result_json['steps']) if options['trace'] == 'summary' else []
+    if 'original_matrix' in result_json:
+        # Respons JSON memakai matriks asli dari request, bukan view array solver
+        result_json['original_matrix'] = matrix
+    
+    return result, {
+        'success': True,
+        'assignment': formatted_assignment,
+        'total_cost': float(result['total_cost']),
+        'execution_time': float(execution_time),  # Konversi ke Python float
+        'validation': problem['validation'],
+        'calculation_id': calculation_id,  # Request lanjutan cukup mengirim id ini
+        'engine': options['engine'],
+        'cached': cached,
+        'final_matrix': matrix,  # Tambahkan matrix untuk heatmap
+        'result': result_json  # Hanya field yang diminta (default semua)
+    }
+
 @app.route('/api/solve', methods=['POST'])
 def solve_hungarian():
     try:
         data = request.get_json()
-        matrix = data.get('matrix')
-        maximize = data.get('maximize', False)
+        if data.get('edges') is not None:
+            trace = data.get('trace', app.config['HUNGARIAN_API_TRACE'])
+            objective = data.get('objective', 'sum')
+            if objective not in OBJECTIVES:
+                return jsonify({'error': f'Objektif tidak dikenal: {objective}'}), 400
+            if not valid_result_fields(data.get('fields')):
+                return jsonify({'error': f"fields harus berupa daftar dari: {', '.join(AssignmentResult.FIELDS)}"}), 400
+            return solve_sparse_request(data, data.get('maximize', False), trace,
+                                        bool(data.get('certificate', False)), objective,
+                                        data.get('fields'))
         
-        if not matrix:
-            return jsonify({'error': 'Matrix tidak boleh kosong'}), 400
+        problem, error = parse_solve_request(data)
+        if error is not None:
+            return error
         
-        # Validasi matrix
-        processor = DataProcessor()
-        validation = processor.validate_matrix(matrix)
+        try:
+            result, payload = run_solve_request(HungarianMethod(), problem)
+        except ValueError as e:
+            # Input yang ditolak solver (misalnya biaya pecahan dengan dtype integer)
+            return jsonify({'error': str(e)}), 400
         
-        if not validation['is_valid']:
-            return jsonify({'error': validation['errors']}), 400
+        # Heatmap dirender terpisah saat diminta (GET, di-cache dengan ETag)
+        payload['heatmap_url'] = url_for('heatmap', calculation_id=payload['calculation_id'])
         
-        # Solve Hungarian Method
+        return jsonify(payload)
+        
+    except Exception as e:
+        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+
+@app.route('/api/jobs', methods=['POST'])
+def submit_job():
+    """
+    Jadwalkan solve matriks dense di thread pool dan langsung kembalikan id job.
+    
+    Semua validasi parse_solve_request (termasuk kombinasi opsi dan dtype)
+    dijalankan sebelum job diantrekan sehingga request tidak valid mendapat 400.
+    """
+    data = request.get_json() or {}
+    if data.get('edges') is not None:
+        return jsonify({'error': 'Job hanya mendukung input matrix dense; gunakan /api/solve untuk edges'}), 400
+    problem, error = parse_solve_request(data)
+    if error is not None:
+        return error
+    
+    try:
+        job_id = jobs.submit(lambda hungarian: run_solve_request(hungarian, problem)[1], HungarianMethod())
+    except JobQueueFull as e:
+        return jsonify({'error': str(e)}), 429
+    return jsonify({'success': True, 'job_id': job_id, 'status': 'queued'}), 202
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """Status, progress (iterasi / jumlah garis penutup), dan hasil akhir job"""
+    status = jobs.status(job_id)
+    if status is None:
+        return jsonify({'error': 'Job tidak ditemukan'}), 404
+    return jsonify({'success': True, **status})
+
+def solve_sparse_request(data, maximize, trace, certificate=False, objective='sum', fields=None):
+    """Solve input sparse berupa daftar edge [baris, kolom, biaya] dan ukuran opsional"""
+    if trace not in TRACE_LEVELS:
+        return jsonify({'error': f'Level trace tidak dikenal: {trace}'}), 400
+    
+    try:
+        sparse = SparseCostMatrix.from_edges(data['edges'], data.get('shape'))
         start_time = time.time()
-        hungarian = HungarianMethod()
-        result = hungarian.solve(matrix, maximize)
+        result = HungarianMethod().solve(sparse, maximize, trace=trace, certificate=certificate,
+                                         objective=objective,
+                                         workers=app.config['HUNGARIAN_SPARSE_WORKERS'])
         execution_time = time.time() - start_time
+    except (ValueError, TypeError, IndexError) as e:
+        # Termasuk kasus tidak ada perfect matching pada edge yang diizinkan
+        return jsonify({'error': str(e)}), 400
+    
+    rows = np.flatnonzero(result.col4row >= 0)
+    cols = result.col4row[rows]
+    formatted_assignment = [
+        {'worker': row, 'task': col, 'cost': float(cost)}
+        for row, col, cost in zip(rows.tolist(), cols.tolist(), sparse.lookup(rows, cols))
+    ]
+    
+    log_activity('calculation_performed', f'Sparse matrix: {sparse.shape[0]}x{sparse.shape[1]}, {sparse.nnz} edges, Total cost: {result["total_cost"]}')
+    
+    return jsonify({
+        'success': True,
+        'assignment': formatted_assignment,
+        'total_cost': float(result['total_cost']),
+        'execution_time': float(execution_time),
+        'engine': 'sparse',
+        'result': result.to_dict(fields)
+    })
+
+@app.route('/api/verify', methods=['POST'])
+def verify_assignment():
+    """Periksa sertifikat optimalitas (assignment + duals) tanpa solve ulang"""
+    data = request.get_json() or {}
+    assignment = data.get('assignment')
+    duals = data.get('duals')
+    if assignment is None or not duals:
+        return jsonify({'error': 'assignment dan duals wajib diisi'}), 400
         
-        # Generate visualizations
-        visualizer = Visualizer()
-        original_heatmap = visualizer.create_heatmap(
-            np.array(matrix), 
-            "Original Cost Matrix",
-            assignment=result['assignment']
-        )
+    try:
+        if data.get('edges') is not None:
+            matrix = SparseCostMatrix.from_edges(data['edges'], data.get('shape'))
+        else:
+            matrix = data.get('matrix')
+            if not matrix:
+                return jsonify({'error': 'Matrix tidak boleh kosong'}), 400
+        result = verify(matrix, assignment, duals, bool(data.get('maximize', False)))
+    except (ValueError, TypeError, IndexError, KeyError) as e:
+        return jsonify({'error': str(e)}), 400
         
-        # Log calculation (no database storage)
-        log_activity('calculation_performed', f'Matrix size: {len(matrix)}x{len(matrix[0])}, Total cost: {result["total_cost"]}')
-        calculation_id = 1  # Dummy ID for response
+    return jsonify({'success': True, **result})
+
+@app.route('/api/solve_k_best', methods=['POST'])
+def solve_k_best_assignments():
+    """Cari k assignment terbaik (algoritma Murty) terurut dari yang optimal"""
+    data = request.get_json() or {}
+    matrix = data.get('matrix')
+    if not matrix:
+        return jsonify({'error': 'Matrix tidak boleh kosong'}), 400
+    k = data.get('k', 1)
+    if not isinstance(k, int) or not 1 <= k <= app.config['HUNGARIAN_K_BEST_MAX']:
+        return jsonify({'error': f"k harus bilangan bulat antara 1 dan {app.config['HUNGARIAN_K_BEST_MAX']}"}), 400
         
-        # Format assignment untuk frontend
-        formatted_assignment = []
-        for row, col in result['assignment']:
-            cost = matrix[row][col]
-            formatted_assignment.append({
-                'worker': row,
-                'task': col,
-                'cost': float(cost)
-            })
+    # Validasi matrix; array hasil konversi langsung dipakai solver
+    array, validation = DataProcessor.prepare_matrix(matrix)
+    if not validation['is_valid']:
+        return jsonify({'error': validation['errors']}), 400
         
-        return jsonify({
-            'success': True,
-            'assignment': formatted_assignment,
-            'total_cost': float(result['total_cost']),
-            'execution_time': float(execution_time),  # Konversi ke Python float
-            'heatmap': original_heatmap,
-            'validation': validation,
-            'calculation_id': int(calculation_id),  # Use the dummy ID instead of calculation.id
-            'final_matrix': matrix,  # Tambahkan matrix untuk heatmap
-            'result': result  # Tetap sertakan result lengkap untuk keperluan lain
-        })
+    try:
+        start_time = time.time()
+        solutions = solve_k_best(array, k, bool(data.get('maximize', False)))
+        execution_time = time.time() - start_time
+    except (ValueError, TypeError) as e:
+        return jsonify({'error': str(e)}), 400
         
-    except Exception as e:
-        return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
+    return jsonify({
+        'success': True,
+        'solutions': solutions,
+        'execution_time': float(execution_time)
+    })
 
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
@@ -188,8 +457,10 @@ def upload_file():
                 matrix = processor.read_csv_file(file_path)
             elif filename.endswith(('.xlsx', '.xls')):
                 matrix = processor.read_excel_file(file_path)
+            elif filename.endswith('.npy'):
+                matrix = processor.read_npy_file(file_path).tolist()
             else:
-                return jsonify({'error': 'Format file tidak didukung. Gunakan CSV atau Excel.'}), 400
+                return jsonify({'error': 'Format file tidak didukung. Gunakan CSV, Excel, atau NPY.'}), 400
             
             # Clean up uploaded file
             os.remove(file_path)
@@ -286,32 +557,184 @@ def generate_report():
         traceback.print_exc()
         return jsonify({'error': str(e)}), 500
 
+def parse_steps_request(data):
+    """
+    Matriks dan arah optimasi untuk endpoint langkah.
+    
+    Request dapat berisi calculation_id dari /api/solve (tanpa mengirim ulang
+    matriks) atau matrix beserta is_maximization.
+    
+    Returns:
+        Tuple (array, maximize, None) atau (None, None, respons error)
+    """
+    calculation_id = data.get('calculation_id')
+    if calculation_id is not None:
+        record = (calculations.get(calculation_id)
+                  if isinstance(calculation_id, int) and not isinstance(calculation_id, bool) else None)
+        if record is None:
+            return None, None, (jsonify({'error': 'Perhitungan tidak ditemukan'}), 404)
+        return record['matrix'], record['is_maximization'], None
+        
+    matrix = data.get('matrix')
+    if not matrix:
+        return None, None, (jsonify({'error': 'Matrix data is required'}), 400)
+    array, validation = DataProcessor.prepare_matrix(matrix)
+    if not validation['is_valid']:
+        return None, None, (jsonify({'error': validation['errors']}), 400)
+    return array, bool(data.get('is_maximization', False)), None
+
 @app.route('/api/get_steps', methods=['POST'])
 def get_steps():
     try:
-        data = request.get_json()
-        matrix = data.get('matrix')
-        is_maximization = data.get('is_maximization', False)
+        data = request.get_json() or {}
+        array, maximize, error = parse_steps_request(data)
+        if error is not None:
+            return error
         
-        if not matrix:
-            return jsonify({'error': 'Matrix data is required'}), 400
-        
-        # Solve Hungarian algorithm to get steps
-        hungarian = HungarianMethod()
-        result = hungarian.solve(matrix, is_maximization)
+        # Langkah dari hasil yang sama dengan /api/solve jika sudah ada di cache
+        result, cached = solve_cached(HungarianMethod(), array, maximize)
         
         return jsonify({
             'success': True,
-            'steps': result['steps']
+            'steps': result['steps'],
+            'cached': cached
         })
         
     except Exception as e:
         return jsonify({'error': str(e), 'traceback': traceback.format_exc()}), 500
 
+class StreamCancelled(Exception):
+    """Klien stream SSE terputus; solver di thread latar dihentikan"""
+
+def sse_event(event, payload):
+    """Format satu event Server-Sent Events"""
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+def stream_solver_steps(array, maximize):
+    """
+    Jalankan solve di thread latar dan hasilkan setiap langkah sebagai event SSE.
+    
+    Antrian dibatasi HUNGARIAN_STREAM_QUEUE sehingga solver menunggu klien dan
+    trace tidak pernah disimpan utuh; event terakhir 'done' atau 'error'.
+    """
+    events = queue.Queue(maxsize=app.config['HUNGARIAN_STREAM_QUEUE'])
+    cancelled = threading.Event()
+    
+    def publish(event, payload):
+        while not cancelled.is_set():
+            try:
+                events.put((event, payload), timeout=0.5)
+                return
+            except queue.Full:
+                continue
+        raise StreamCancelled()
+    
+    def run():
+        try:
+            result = HungarianMethod().solve(array, maximize, trace='full',
+                                             on_step=lambda step: publish('step', step))
+            publish('done', {'total_cost': result.total_cost, 'assignment': result.assignment})
+        except StreamCancelled:
+            pass
+        except Exception as e:
+            try:
+                publish('error', {'error': str(e)})
+            except StreamCancelled:
+                pass
+    
+    threading.Thread(target=run, daemon=True).start()
+    try:
+        while True:
+            event, payload = events.get()
+            yield sse_event(event, payload)
+            if event != 'step':
+                break
+    finally:
+        cancelled.set()
+
+def cached_step_events(result):
+    """Event SSE untuk langkah dan hasil akhir AssignmentResult yang sudah ada"""
+    for step in result.steps:
+        yield sse_event('step', step)
+    yield sse_event('done', {'total_cost': result.total_cost, 'assignment': result.assignment})
+
+@app.route('/api/get_steps/stream', methods=['POST'])
+def stream_steps():
+    """Kirim setiap langkah solver sebagai event SSE segera setelah dibuat"""
+    data = request.get_json() or {}
+    array, maximize, error = parse_steps_request(data)
+    if error is not None:
+        return error
+    
+    # Hasil yang sudah ada di cache (misalnya dari /api/solve) dikirim tanpa solve ulang
+    cached = results_cache.get(ResultCache.key(array, maximize))
+    events = cached_step_events(cached) if cached is not None else stream_solver_steps(array, maximize)
+    return Response(events,
+                    mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/step_visualization/<int:calculation_id>/<int:step_index>')
 def step_visualization(calculation_id, step_index):
-    """Get step-by-step visualization - simplified without database"""
-    return jsonify({'error': 'Step visualization not available without database'}), 404
+    """Satu langkah perhitungan tersimpan beserta matriksnya (akses acak per indeks)"""
+    record = calculations.get(calculation_id)
+    if record is None:
+        return jsonify({'error': 'Perhitungan tidak ditemukan'}), 404
+    result = record['result']
+    try:
+        step = result.step(step_index)
+    except IndexError:
+        return jsonify({'error': f'Langkah {step_index} tidak ada (jumlah langkah: {result.num_steps})'}), 404
+    return jsonify({
+        'success': True,
+        'calculation_id': calculation_id,
+        'step_index': step_index,
+        'total_steps': result.num_steps,
+        'step': step
+    })
+
+@app.route('/api/heatmap/<int:calculation_id>')
+def heatmap(calculation_id):
+    """
+    Heatmap PNG matriks biaya dan assignment perhitungan tersimpan.
+    
+    Dirender saat pertama diminta lalu di-cache menurut hash matriks dan
+    assignment; ETag yang sama menghasilkan 304 tanpa render ulang.
+    ETag adalah hash yang dihitung sekali saat perhitungan disimpan.
+    """
+    record = calculations.get(calculation_id)
+    if record is None:
+        return jsonify({'error': 'Perhitungan tidak ditemukan'}), 404
+    result = record['result']
+    etag = record['etag']
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        png = heatmap_cache.get(etag)
+        if png is None:
+            png = Visualizer.render_heatmap_png(record['matrix'], "Original Cost Matrix",
+                                                assignment=result.assignment)
+            heatmap_cache.put(etag, png, len(png))
+        response = Response(png, mimetype='image/png')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+@app.route('/api/load_calculation/<int:calculation_id>')
+def load_calculation(calculation_id):
+    """Matriks, arah optimasi, dan hasil perhitungan tersimpan"""
+    record = calculations.get(calculation_id)
+    if record is None:
+        return jsonify({'error': 'Perhitungan tidak ditemukan'}), 404
+    result = record['result']
+    return jsonify({
+        'success': True,
+        'calculation_id': calculation_id,
+        'matrix': record['matrix'].tolist(),
+        'is_maximization': record['is_maximization'],
+        'total_cost': result.total_cost,
+        'assignment': result.assignment,
+        'total_steps': result.num_steps
+    })
 
 @app.route('/history')
 def history():
@@ -407,7 +830,9 @@ def get_system_stats():
             'total_users': 0,
             'total_calculations': 0,
             'system_uptime': get_system_info()['uptime'],
-            'database_size': 'N/A'
+            'database_size': 'N/A',
+            'result_cache': results_cache.stats(),
+            'calculation_store': calculations.stats()
         }
     })
 
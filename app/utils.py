@@ -17,22 +17,44 @@ from reportlab.graphics.shapes import Drawing
 from reportlab.graphics.charts.linecharts import HorizontalLineChart
 import io
 import base64
-from typing import List, Dict, Any, Optional
+import hashlib
+import json
+import shutil
+import tempfile
+import weakref
+import zipfile
+from typing import List, Dict, Any, Optional, Tuple, Callable
 import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    from .hungarian import AssignmentResult, expand_steps, validate_matrix
+except ImportError:
+    # utils diimpor langsung (misalnya oleh tests) tanpa package app
+    from hungarian import AssignmentResult, expand_steps, validate_matrix
+
 class DataProcessor:
     """
     Kelas untuk memproses data input dan output.
     """
     
     @staticmethod
-    def read_csv_file(file_path: str) -> List[List[float]]:
+    def read_csv_file(file_path: str, as_array: bool = False):
         """
         Membaca file CSV dan mengkonversi ke matriks.
+        
+        Dengan as_array=True dikembalikan ndarray float64 C-contiguous yang dapat
+        langsung diberikan ke HungarianMethod.solve tanpa konversi list.
         """
         try:
             df = pd.read_csv(file_path, header=None)
+            if as_array:
+                return np.ascontiguousarray(df.to_numpy(dtype=float))
             return df.values.tolist()
         except Exception as e:
             raise ValueError(f"Error membaca file CSV: {str(e)}")
@@ -48,11 +70,45 @@ class DataProcessor:
         except Exception as e:
             raise ValueError(f"Error membaca file Excel: {str(e)}")
             
+    @staticmethod
+    def read_npy_file(file_path: str) -> np.ndarray:
+        """
+        Membuka file .npy sebagai memmap read-only tanpa memuatnya ke RAM.
+        """
+        try:
+            matrix = np.load(file_path, mmap_mode='r', allow_pickle=False)
+        except Exception as e:
+            raise ValueError(f"Error membaca file NPY: {str(e)}")
+        if matrix.ndim != 2:
+            raise ValueError(f"File NPY harus berisi matriks 2 dimensi, bukan {matrix.ndim} dimensi")
+        return matrix
+        
+    @staticmethod
+    def read_binary_file(file_path: str, shape: Tuple[int, int], dtype: str = 'float64') -> np.ndarray:
+        """
+        Membuka file biner mentah (row-major) sebagai np.memmap read-only.
+        """
+        try:
+            return np.memmap(file_path, dtype=dtype, mode='r', shape=tuple(shape))
+        except Exception as e:
+            raise ValueError(f"Error membaca file biner: {str(e)}")
+            
     @staticmethod
     def validate_matrix(matrix: List[List[float]]) -> Dict[str, Any]:
         """
         Validasi matriks input.
         """
+        return DataProcessor.prepare_matrix(matrix)[1]
+        
+    @staticmethod
+    def prepare_matrix(matrix) -> Tuple[Optional[np.ndarray], Dict[str, Any]]:
+        """
+        Validasi matriks input dan kembalikan array hasil konversi.
+        
+        Memakai validasi yang sama dengan HungarianMethod.solve: list dikonversi
+        sekali, pesan error dibatasi dan diringkas. Array yang dikembalikan
+        dapat langsung diberikan ke solver (None jika tidak valid).
+        """
         result = {
             'is_valid': True,
             'errors': [],
@@ -60,29 +116,14 @@ class DataProcessor:
             'info': {}
         }
         
-        if not matrix or not matrix[0]:
+        array, errors = validate_matrix(matrix)
+        if errors:
             result['is_valid'] = False
-            result['errors'].append("Matriks kosong")
-            return result
+            result['errors'] = errors
+            return None, result
             
-        rows = len(matrix)
-        cols = len(matrix[0])
+        rows, cols = array.shape
         
-        # Cek konsistensi kolom
-        for i, row in enumerate(matrix):
-            if len(row) != cols:
-                result['is_valid'] = False
-                result['errors'].append(f"Baris {i+1} memiliki {len(row)} kolom, seharusnya {cols}")
-                
-        # Cek tipe data
-        for i, row in enumerate(matrix):
-            for j, val in enumerate(row):
-                try:
-                    float(val)
-                except (ValueError, TypeError):
-                    result['is_valid'] = False
-                    result['errors'].append(f"Nilai di baris {i+1}, kolom {j+1} bukan angka: {val}")
-                    
         # Info tambahan
         result['info'] = {
             'rows': rows,
@@ -93,9 +134,9 @@ class DataProcessor:
         
         # Warning untuk matriks tidak seimbang
         if rows != cols:
-            result['warnings'].append(f"Matriks tidak seimbang ({rows}x{cols}). Akan ditambahkan dummy rows/columns.")
+            result['warnings'].append(f"Matriks tidak seimbang ({rows}x{cols}). Engine classic akan menambahkan dummy rows/columns.")
             
-        return result
+        return array, result
         
     @staticmethod
     def matrix_to_dataframe(matrix: List[List[float]], 
@@ -123,45 +164,92 @@ class Visualizer:
     Kelas untuk membuat visualisasi.
     """
     
+    # Di atas ukuran ini nilai sel tidak dituliskan pada heatmap
+    HEATMAP_ANNOTATE_MAX_SIZE = 30
+    # Di atas ukuran ini assignment ditandai titik, bukan kotak per sel
+    HEATMAP_OUTLINE_MAX_SIZE = 100
+    
     @staticmethod
-    def create_heatmap(matrix: np.ndarray, 
-                      title: str = "Cost Matrix",
-                      row_labels: List[str] = None,
-                      col_labels: List[str] = None,
-                      assignment: List[tuple] = None) -> str:
+    def heatmap_style(shape: Tuple[int, int]) -> Dict[str, Any]:
+        """
+        Resolusi, ukuran figure, dan kepadatan anotasi sesuai ukuran matriks.
+        """
+        size = max(shape)
+        annotate = size <= Visualizer.HEATMAP_ANNOTATE_MAX_SIZE
+        if size <= 10:
+            dpi, fmt = 150, '.2f'
+        elif annotate:
+            dpi, fmt = 120, '.0f'
+        else:
+            dpi, fmt = 100, None
+        # Sel tetap terbaca untuk matriks sedang tanpa membuat gambar raksasa
+        figsize = (min(16, 6 + 0.3 * shape[1]), min(14, 5 + 0.3 * shape[0]))
+        return {
+            'dpi': dpi,
+            'annot': annotate,
+            'fmt': fmt,
+            'figsize': figsize,
+            'ticklabels': annotate
+        }
+        
+    @staticmethod
+    def render_heatmap_png(matrix: np.ndarray,
+                           title: str = "Cost Matrix",
+                           row_labels: List[str] = None,
+                           col_labels: List[str] = None,
+                           assignment: List[tuple] = None) -> bytes:
         """
-        Membuat heatmap dari matriks biaya menggunakan matplotlib dan seaborn.
+        Render heatmap matriks biaya sebagai PNG (lihat heatmap_style).
         """
+        matrix = np.asarray(matrix)
+        style = Visualizer.heatmap_style(matrix.shape)
+        fig = plt.figure(figsize=style['figsize'])
         try:
-            plt.figure(figsize=(10, 8))
-            
-            # Create heatmap
-            ax = sns.heatmap(matrix, 
-                           annot=True, 
-                           fmt='.2f', 
-                           cmap='YlOrRd',
-                           xticklabels=col_labels if col_labels else [f'Task {i+1}' for i in range(matrix.shape[1])],
-                           yticklabels=row_labels if row_labels else [f'Worker {i+1}' for i in range(matrix.shape[0])],
-                           cbar_kws={'label': 'Cost'})
+            if style['ticklabels']:
+                xticklabels = col_labels if col_labels else [f'Task {i+1}' for i in range(matrix.shape[1])]
+                yticklabels = row_labels if row_labels else [f'Worker {i+1}' for i in range(matrix.shape[0])]
+            else:
+                xticklabels = yticklabels = 'auto'
+            ax = sns.heatmap(matrix,
+                             annot=style['annot'],
+                             fmt=style['fmt'] or '',
+                             cmap='YlOrRd',
+                             xticklabels=xticklabels,
+                             yticklabels=yticklabels,
+                             cbar_kws={'label': 'Cost'})
             
             # Highlight assignment if provided
             if assignment:
-                for row, col in assignment:
-                    ax.add_patch(plt.Rectangle((col, row), 1, 1, fill=False, edgecolor='blue', lw=3))
+                if max(matrix.shape) <= Visualizer.HEATMAP_OUTLINE_MAX_SIZE:
+                    for row, col in assignment:
+                        ax.add_patch(plt.Rectangle((col, row), 1, 1, fill=False, edgecolor='blue', lw=3))
+                else:
+                    rows, cols = np.asarray(assignment).T
+                    ax.scatter(cols + 0.5, rows + 0.5, s=4, c='blue', marker='s')
             
             plt.title(title, fontsize=16, fontweight='bold')
             plt.xlabel('Tasks', fontsize=12)
             plt.ylabel('Workers', fontsize=12)
             plt.tight_layout()
             
-            # Save to base64 string
             buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
+            fig.savefig(buffer, format='png', dpi=style['dpi'], bbox_inches='tight')
+            return buffer.getvalue()
+        finally:
+            plt.close(fig)
             
-            return f"data:image/png;base64,{image_base64}"
+    @staticmethod
+    def create_heatmap(matrix: np.ndarray, 
+                      title: str = "Cost Matrix",
+                      row_labels: List[str] = None,
+                      col_labels: List[str] = None,
+                      assignment: List[tuple] = None) -> str:
+        """
+        Membuat heatmap dari matriks biaya sebagai data URI base64.
+        """
+        try:
+            png = Visualizer.render_heatmap_png(matrix, title, row_labels, col_labels, assignment)
+            return f"data:image/png;base64,{base64.b64encode(png).decode()}"
             
         except Exception as e:
             print(f"Error creating heatmap: {e}")
@@ -175,8 +263,10 @@ class Visualizer:
         if step_index >= len(steps):
             return None
             
-        step = steps[step_index]
-        matrix = step['matrix']
+        step = expand_steps(steps[:step_index + 1])[step_index]
+        if 'matrix' not in step:
+            return None
+        matrix = np.array(step['matrix'])
         title = f"Step {step_index + 1}: {step['description']}"
         
         return Visualizer.create_heatmap(matrix, title)
@@ -441,11 +531,315 @@ class FileManager:
             elif key == 'steps':
                 json_result[key] = []
                 for step in value:
-                    step_copy = step.copy()
-                    step_copy['matrix'] = step_copy['matrix'].tolist()
+                    step_copy = {k: v.tolist() if isinstance(v, np.ndarray) else v
+                                 for k, v in step.items()}
                     json_result[key].append(step_copy)
             else:
                 json_result[key] = value
                 
         with open(file_path, 'w') as f:
-            json.dump(json_result, f, indent=2)
\ No newline at end of file
+            json.dump(json_result, f, indent=2)
+
+
+class JobQueueFull(Exception):
+    """Jumlah job yang belum selesai sudah mencapai batas JobManager"""
+
+
+class JobManager:
+    """
+    Antrian solve asinkron pada thread pool di dalam proses.
+    
+    Setiap job menyimpan status ('queued', 'running', 'done', 'error'), objek
+    solver yang progress-nya dibaca saat status diminta, dan hasil akhir.
+    Hanya max_jobs job terakhir yang disimpan; job selesai tertua dibuang lebih
+    dulu, dan job baru ditolak (JobQueueFull) selama max_jobs job belum selesai.
+    """
+    
+    def __init__(self, workers: int = 2, max_jobs: int = 100):
+        self.max_jobs = max_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers),
+                                            thread_name_prefix='hungarian-job')
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def submit(self, func: Callable[..., Dict[str, Any]], solver, *args) -> str:
+        """
+        Jadwalkan func(solver, *args) dan kembalikan id job.
+        
+        solver harus memiliki atribut progress (dictionary) yang diperbarui
+        selama func berjalan, misalnya HungarianMethod.
+        
+        Raises:
+            JobQueueFull: Jika max_jobs job masih menunggu atau berjalan
+        """
+        job_id = uuid.uuid4().hex
+        job = {'status': 'queued', 'solver': solver, 'result': None, 'error': None,
+               'created_at': time.time(), 'started_at': None, 'finished_at': None}
+        with self._lock:
+            pending = sum(1 for other in self._jobs.values()
+                          if other['status'] in ('queued', 'running'))
+            if pending >= self.max_jobs:
+                raise JobQueueFull(f"Terlalu banyak job yang belum selesai ({pending})")
+            self._jobs[job_id] = job
+            self._evict()
+        self._executor.submit(self._run, job, func, solver, *args)
+        return job_id
+        
+    def _run(self, job: Dict[str, Any], func: Callable[..., Dict[str, Any]], solver, *args):
+        job['started_at'] = time.time()
+        job['status'] = 'running'
+        try:
+            job['result'] = func(solver, *args)
+            job['status'] = 'done'
+        except Exception as e:
+            job['error'] = str(e)
+            job['status'] = 'error'
+        finally:
+            job['finished_at'] = time.time()
+            # Solver tidak lagi dibutuhkan; progress terakhir disimpan sebagai salinan
+            job['progress'] = dict(solver.progress)
+            job['solver'] = None
+            
+    def _evict(self):
+        """
+        Buang job selesai tertua jika jumlah job melebihi max_jobs.
+        """
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        finished = [job_id for job_id, job in self._jobs.items()
+                    if job['status'] in ('done', 'error')][:excess]
+        for job_id in finished:
+            del self._jobs[job_id]
+            
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Status, progress, dan hasil (jika selesai) sebuah job; None jika tidak ada.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+            
+        solver = job['solver']
+        finished_at = job['finished_at']
+        started_at = job['started_at']
+        status = {
+            'job_id': job_id,
+            'status': job['status'],
+            'progress': dict(solver.progress) if solver is not None else job.get('progress'),
+            'elapsed': None if started_at is None else (finished_at or time.time()) - started_at
+        }
+        if job['status'] == 'done':
+            status['result'] = job['result']
+        elif job['status'] == 'error':
+            status['error'] = job['error']
+        return status
+
+
+class ResultCache:
+    """
+    Cache LRU hasil solve di dalam proses, dialamati oleh isi matriks.
+    
+    Kunci dibentuk dari hash byte array (beserta shape dan dtype) dan flag
+    maximize, sehingga matriks yang sama dari endpoint mana pun memakai satu
+    hasil. Ukuran dibatasi total byte (entri terlama dipakai dibuang lebih
+    dulu) dan entri kedaluwarsa setelah ttl detik.
+    """
+    
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: Optional[float] = 600):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        
+    @staticmethod
+    def key(array: np.ndarray, maximize: bool = False) -> str:
+        """
+        Kunci cache untuk matriks biaya dan arah optimasi.
+        """
+        array = np.ascontiguousarray(array)
+        digest = hashlib.sha256()
+        digest.update(f'{array.shape}|{array.dtype.str}|{bool(maximize)}'.encode())
+        digest.update(array.data)
+        return digest.hexdigest()
+        
+    def get(self, key: str):
+        """
+        Hasil yang tersimpan untuk key, atau None jika tidak ada/kedaluwarsa.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.time() - entry[2] > self.ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+            
+    def put(self, key: str, value, nbytes: int):
+        """
+        Simpan value sebesar nbytes; value yang lebih besar dari max_bytes tidak disimpan.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = (value, nbytes, time.time())
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                
+    def _remove(self, key: str):
+        _, nbytes, _ = self._entries.pop(key)
+        self._bytes -= nbytes
+        
+    def stats(self) -> Dict[str, Any]:
+        """
+        Jumlah entri, pemakaian byte, serta hit/miss sejak cache dibuat.
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+class CalculationStore:
+    """
+    Penyimpanan hasil perhitungan di dalam proses di balik calculation_id.
+    
+    Setiap entri menyimpan matriks biaya, arah optimasi, dan AssignmentResult.
+    Entri terbaru berada di memori sampai max_bytes; entri yang lebih lama
+    ditulis sebagai .npz (data biasa, tanpa pickle) ke direktori privat milik
+    proses ini (mkdtemp, mode 0700, di dalam spill_dir atau direktori temp
+    sistem) dan dimuat kembali saat diminta. Hanya max_spilled entri terakhir
+    yang dipertahankan di disk. Jika spill=False atau disk tidak dapat ditulis
+    (misalnya serverless read-only), entri lama dibuang.
+    """
+    
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, spill_dir: Optional[str] = None,
+                 max_spilled: int = 1000, spill: bool = True):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_spilled = max_spilled if spill else 0
+        self._private_dir = None
+        self._memory = OrderedDict()
+        self._spilled = OrderedDict()
+        self._bytes = 0
+        self._next_id = 1
+        self._lock = threading.Lock()
+        
+    def add(self, matrix: np.ndarray, is_maximization: bool, result) -> int:
+        """
+        Simpan hasil perhitungan dan kembalikan calculation_id-nya.
+        
+        Hash isi matriks, arah optimasi, dan assignment dihitung sekali di sini
+        ('etag'), misalnya untuk ETag heatmap tanpa hashing ulang per request.
+        """
+        etag = hashlib.sha256((ResultCache.key(matrix, is_maximization)
+                               + result.col4row.tobytes().hex()).encode()).hexdigest()
+        record = {'matrix': matrix, 'is_maximization': bool(is_maximization), 'result': result,
+                  'etag': etag, 'created_at': time.time()}
+        with self._lock:
+            calculation_id = self._next_id
+            self._next_id += 1
+            self._insert(calculation_id, record)
+        return calculation_id
+        
+    def get(self, calculation_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Entri untuk calculation_id (dari memori atau disk), atau None jika tidak ada.
+        """
+        with self._lock:
+            if calculation_id in self._memory:
+                self._memory.move_to_end(calculation_id)
+                return self._memory[calculation_id][0]
+            path = self._spilled.pop(calculation_id, None)
+            if path is None:
+                return None
+            try:
+                record = self._load(path)
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                return None
+            finally:
+                self._remove_file(path)
+            # Entri yang diminta kembali dianggap terbaru
+            self._insert(calculation_id, record)
+            return record
+            
+    def _insert(self, calculation_id: int, record: Dict[str, Any]):
+        result = record['result']
+        nbytes = result.nbytes
+        # Matriks asli hasil biasanya view dari matriks entri; hitung sekali saja
+        original = result.original_matrix
+        if not (isinstance(original, np.ndarray) and np.may_share_memory(original, record['matrix'])):
+            nbytes += record['matrix'].nbytes
+        self._memory[calculation_id] = (record, nbytes)
+        self._bytes += nbytes
+        # Entri terbaru selalu tetap di memori meskipun melebihi batas
+        while self._bytes > self.max_bytes and len(self._memory) > 1:
+            old_id, (old_record, old_bytes) = self._memory.popitem(last=False)
+            self._bytes -= old_bytes
+            self._spill(old_id, old_record)
+            
+    def _spill(self, calculation_id: int, record: Dict[str, Any]):
+        if self.max_spilled <= 0:
+            return
+        try:
+            if self._private_dir is None:
+                if self.spill_dir is not None:
+                    os.makedirs(self.spill_dir, exist_ok=True)
+                # mkdtemp membuat direktori unik dengan mode 0700
+                self._private_dir = tempfile.mkdtemp(prefix=f'hungarian_{os.getpid()}_',
+                                                     dir=self.spill_dir)
+                weakref.finalize(self, shutil.rmtree, self._private_dir, True)
+            path = os.path.join(self._private_dir, f'{uuid.uuid4().hex}.npz')
+            meta = {key: value for key, value in record.items() if key not in ('matrix', 'result')}
+            with open(path, 'wb') as f:
+                np.savez(f, matrix=record['matrix'], record=np.array(json.dumps(meta)),
+                         **record['result'].to_arrays())
+        except OSError:
+            return
+        self._spilled[calculation_id] = path
+        while len(self._spilled) > self.max_spilled:
+            _, old_path = self._spilled.popitem(last=False)
+            self._remove_file(old_path)
+            
+    @staticmethod
+    def _load(path: str) -> Dict[str, Any]:
+        with np.load(path, allow_pickle=False) as data:
+            matrix = data['matrix']
+            record = json.loads(str(data['record']))
+            record['matrix'] = matrix
+            record['result'] = AssignmentResult.from_arrays(data, original=matrix)
+        return record
+        
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+            
+    def stats(self) -> Dict[str, Any]:
+        """
+        Jumlah entri di memori dan disk serta pemakaian byte memori.
+        """
+        with self._lock:
+            return {
+                'in_memory': len(self._memory),
+                'spilled': len(self._spilled),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes
+            }
@@ -1,12 +1,18 @@
 import unittest
+import itertools
 import numpy as np
 import sys
 import os
+import shutil
+import tempfile
+import threading
+import time
 
 # Add the app directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
 
-from hungarian import HungarianMethod
+from hungarian import HungarianMethod, SparseCostMatrix, AssignmentResult, expand_steps, check_solve_options, resolve_dtype, solve_batch, solve_k_best, summarize_steps, validate_matrix, verify
+from utils import CalculationStore, DataProcessor, JobManager, JobQueueFull, ResultCache, Visualizer
 
 class TestHungarianMethod(unittest.TestCase):
     """Unit tests untuk Hungarian Method (White Box Testing)"""
@@ -432,6 +438,895 @@ class TestHungarianMethodIntegration(unittest.TestCase):
         assigned_tasks = [task for task in result['assignment'] if task != -1]
         self.assertEqual(len(assigned_tasks), 3)
 
+class TestShortestPathEngine(unittest.TestCase):
+    """Unit tests untuk engine shortest augmenting path (jv)"""
+    
+    def brute_force(self, matrix, maximize=False):
+        """Hitung biaya optimal dengan mencoba semua permutasi"""
+        array = np.array(matrix, dtype=float)
+        if array.shape[0] > array.shape[1]:
+            array = array.T
+        rows, cols = array.shape
+        costs = [sum(array[i, p[i]] for i in range(rows))
+                 for p in itertools.permutations(range(cols), rows)]
+        return max(costs) if maximize else min(costs)
+    
+    def test_jv_matches_brute_force(self):
+        """Test engine jv menghasilkan biaya optimal"""
+        rng = np.random.default_rng(42)
+        for _ in range(50):
+            rows, cols = rng.integers(1, 6, size=2)
+            matrix = rng.integers(0, 20, size=(rows, cols)).tolist()
+            for maximize in (False, True):
+                result = HungarianMethod().solve(matrix, maximize, engine='jv')
+                self.assertAlmostEqual(result['total_cost'], self.brute_force(matrix, maximize))
+                self.assertEqual(len(result['assignment']), min(rows, cols))
+    
+    def test_jv_matches_classic(self):
+        """Test engine jv dan classic memberi total biaya yang sama"""
+        matrix = [[9, 2, 7, 8], [6, 4, 3, 7], [5, 8, 1, 8], [7, 6, 9, 4]]
+        classic = HungarianMethod().solve(matrix)
+        jv = HungarianMethod().solve(matrix, engine='jv')
+        self.assertEqual(jv['total_cost'], classic['total_cost'])
+        self.assertEqual(jv['total_cost'], 13)
+    
+    def test_jv_rectangular_without_padding(self):
+        """Test matriks tidak seimbang diselesaikan tanpa dummy rows/columns"""
+        matrix = [[4, 1, 3, 2, 9], [2, 0, 5, 3, 1]]
+        for shaped in (matrix, np.array(matrix).T.tolist()):
+            hungarian = HungarianMethod()
+            result = hungarian.solve(shaped, engine='jv')
+            self.assertEqual(result['total_cost'], 2)
+            self.assertEqual(hungarian.dummy_rows + hungarian.dummy_cols, 0)
+            self.assertEqual(hungarian.cost_matrix.shape, np.array(shaped).shape)
+            self.assertEqual(len(result['assignment']), 2)
+    
+    def test_unknown_engine(self):
+        """Test engine yang tidak dikenal ditolak"""
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve([[1, 2], [3, 4]], engine='unknown')
+
+class TestVectorizedClassic(unittest.TestCase):
+    """Unit tests untuk loop covering-lines yang divektorisasi"""
+    
+    def test_lines_are_boolean_masks(self):
+        """Test garis penutup dikembalikan sebagai mask baris/kolom"""
+        hungarian = HungarianMethod()
+        hungarian.cost_matrix = np.array([[0., 1., 2.], [0., 3., 4.], [5., 0., 6.]])
+        assignment = hungarian._find_assignment()
+        self.assertEqual(len(assignment), 2)
+        lines = hungarian._find_minimum_lines(assignment)
+        self.assertEqual(lines['rows'].dtype, bool)
+        self.assertEqual(int(lines['rows'].sum() + lines['cols'].sum()), 2)
+        
+        # Semua nol harus tertutup garis
+        zeros = hungarian.cost_matrix == 0
+        covered = lines['rows'][:, None] | lines['cols'][None, :]
+        self.assertTrue(np.all(covered[zeros]))
+    
+    def test_update_matrix_broadcast(self):
+        """Test update matriks: kurangi uncovered, tambah intersection"""
+        hungarian = HungarianMethod()
+        hungarian.cost_matrix = np.array([[1., 2., 3.], [4., 5., 6.], [7., 8., 9.]])
+        lines = {'rows': np.array([True, False, False]), 'cols': np.array([False, True, False])}
+        self.assertTrue(hungarian._update_matrix(lines))
+        expected = [[1, 6, 3], [0, 5, 2], [3, 8, 5]]
+        np.testing.assert_array_equal(hungarian.cost_matrix, expected)
+        self.assertEqual(hungarian.steps[-1]['description'], 'Update Matrix (min uncovered: 4.0)')
+    
+    def test_non_maximum_greedy_assignment_terminates(self):
+        """Test matriks yang membuat assignment greedy tidak maksimum tetap selesai"""
+        matrix = [[2, 0, 0], [0, 1, 2], [1, 2, 4]]
+        result = HungarianMethod().solve(matrix)
+        self.assertEqual(result['total_cost'], 2)
+        self.assertEqual(len(result['assignment']), 3)
+
+class TestTraceLevels(unittest.TestCase):
+    """Unit tests untuk level trace langkah-langkah"""
+    
+    matrix = [[9, 2, 7, 8], [6, 4, 3, 7], [5, 8, 1, 8], [7, 6, 9, 4]]
+    
+    def test_trace_none(self):
+        """Test trace 'none' tidak menyimpan langkah"""
+        result = HungarianMethod().solve(self.matrix, trace='none')
+        self.assertEqual(result['steps'], [])
+        self.assertEqual(result['total_cost'], 13)
+    
+    def test_trace_summary(self):
+        """Test trace 'summary' menyimpan deskripsi tanpa matriks"""
+        full = HungarianMethod().solve(self.matrix, trace='full')
+        summary = HungarianMethod().solve(self.matrix, trace='summary')
+        self.assertEqual([step['description'] for step in summary['steps']],
+                         [step['description'] for step in full['steps']])
+        for step in summary['steps']:
+            self.assertNotIn('matrix', step)
+        updates = [step for step in summary['steps'] if 'min_uncovered' in step]
+        for step in updates:
+            self.assertIn('covered_rows', step)
+            self.assertIn('covered_cols', step)
+    
+    def test_trace_invalid(self):
+        """Test level trace yang tidak dikenal ditolak"""
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve(self.matrix, trace='verbose')
+
+class TestDeltaTrace(unittest.TestCase):
+    """Unit tests untuk trace langkah yang disimpan sebagai delta"""
+    
+    def test_expand_steps_rebuilds_matrices(self):
+        """Test matriks setiap langkah dapat dibangun ulang dari delta"""
+        matrix = [[9, 2, 7], [6, 4, 3], [5, 8, 1], [7, 6, 9]]
+        hungarian = HungarianMethod()
+        result = hungarian.solve(matrix, maximize=True)
+        steps = expand_steps(result['steps'])
+        
+        self.assertEqual(steps[0]['matrix'], [[9, 2, 7], [6, 4, 3], [5, 8, 1], [7, 6, 9]])
+        self.assertEqual(steps[1]['matrix'][0], [0, 7, 2])
+        self.assertEqual(len(steps[2]['matrix'][0]), 4)
+        for index, step in enumerate(steps):
+            np.testing.assert_array_equal(hungarian.get_step_matrix(index), step['matrix'])
+        
+        # Matriks terakhir memiliki nol di setiap sel assignment
+        final = np.array(steps[-1]['matrix'])
+        for row, col in result['assignment']:
+            self.assertEqual(final[row, col], 0)
+    
+    def test_delta_steps_are_compact(self):
+        """Test hanya langkah input yang menyimpan matriks penuh"""
+        matrix = np.random.default_rng(0).integers(0, 50, size=(30, 30)).tolist()
+        result = HungarianMethod().solve(matrix)
+        snapshots = [step for step in result['steps'] if 'matrix' in step]
+        self.assertEqual(len(snapshots), 1)
+        for step in result['steps']:
+            if step['op'] == 'update':
+                self.assertIsInstance(step['row_cover'], list)
+                self.assertIn('min_uncovered', step)
+
+class TestSolveBatch(unittest.TestCase):
+    """Unit tests untuk solver batch matriks kecil"""
+    
+    def test_batch_matches_single_solve(self):
+        """Test setiap matriks dalam batch mendapat biaya optimal"""
+        costs = np.random.default_rng(1).integers(0, 30, size=(40, 6, 6))
+        for maximize in (False, True):
+            assignments, totals = solve_batch(costs, maximize=maximize)
+            self.assertEqual(assignments.shape, (40, 6))
+            self.assertEqual(totals.shape, (40,))
+            for b in range(len(costs)):
+                self.assertEqual(sorted(assignments[b]), list(range(6)))
+                expected = HungarianMethod().solve(costs[b].tolist(), maximize, engine='jv')
+                self.assertAlmostEqual(totals[b], expected['total_cost'])
+    
+    def test_batch_invalid_shape(self):
+        """Test batch dengan bentuk tidak persegi ditolak"""
+        with self.assertRaises(ValueError):
+            solve_batch(np.zeros((3, 2, 4)))
+
+class TestSparseInput(unittest.TestCase):
+    """Unit tests untuk input sparse dengan pasangan terlarang"""
+    
+    def test_lookup_matches_dense(self):
+        """Test lookup vektor sama dengan matriks dense (inf untuk pasangan terlarang)"""
+        rng = np.random.default_rng(24)
+        dense = np.where(rng.random((40, 30)) < 0.3, rng.integers(0, 50, size=(40, 30)), np.inf)
+        edges = [(i, j, dense[i, j]) for i, j in zip(*np.nonzero(np.isfinite(dense)))]
+        sparse = SparseCostMatrix.from_edges(edges, dense.shape)
+        rows, cols = rng.integers(0, 40, size=500), rng.integers(0, 30, size=500)
+        np.testing.assert_array_equal(sparse.lookup(rows, cols), dense[rows, cols])
+        self.assertEqual(len(sparse.lookup([], [])), 0)
+        
+    def test_sparse_uses_only_allowed_edges(self):
+        """Test solusi sparse hanya memakai edge yang diizinkan"""
+        edges = [(0, 0, 1), (0, 1, 4), (1, 0, 2), (1, 2, 6), (2, 1, 3), (2, 2, 5)]
+        sparse = SparseCostMatrix.from_edges(edges, (3, 3))
+        result = HungarianMethod().solve(sparse)
+        self.assertEqual(result['total_cost'], 10)
+        allowed = {(row, col) for row, col, _ in edges}
+        for pair in result['assignment']:
+            self.assertIn(pair, allowed)
+        
+        maximized = HungarianMethod().solve(sparse, maximize=True)
+        self.assertEqual(maximized['total_cost'], 11)
+    
+    def test_sparse_matches_dense(self):
+        """Test sparse penuh memberi hasil yang sama dengan dense"""
+        matrix = np.random.default_rng(3).integers(0, 40, size=(6, 4))
+        cols = np.tile(np.arange(4), 6)
+        sparse = SparseCostMatrix.from_csr(np.arange(0, 25, 4), cols, matrix.ravel(), (6, 4))
+        self.assertEqual(HungarianMethod().solve(sparse)['total_cost'],
+                         HungarianMethod().solve(matrix.tolist(), engine='jv')['total_cost'])
+    
+    def test_sparse_infeasible(self):
+        """Test infeasibility dilaporkan jika tidak ada perfect matching"""
+        edges = [(0, 0, 1), (1, 0, 2), (2, 1, 3), (2, 2, 1)]
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve(SparseCostMatrix.from_edges(edges, (3, 3)))
+
+class TestAuctionEngine(unittest.TestCase):
+    """Unit tests untuk engine auction dengan epsilon-scaling"""
+    
+    def test_auction_matches_jv_on_integer_costs(self):
+        """Test engine auction optimal untuk biaya integer (juga tidak seimbang)"""
+        rng = np.random.default_rng(8)
+        for _ in range(40):
+            rows, cols = rng.integers(1, 8, size=2)
+            matrix = rng.integers(0, 30, size=(rows, cols)).tolist()
+            for maximize in (False, True):
+                auction = HungarianMethod().solve(matrix, maximize, engine='auction')
+                jv = HungarianMethod().solve(matrix, maximize, engine='jv')
+                self.assertEqual(auction['total_cost'], jv['total_cost'])
+                
+    def test_auction_parallel_bidding(self):
+        """Test bidding multi-proses memberikan biaya optimal yang sama"""
+        matrix = np.random.default_rng(9).integers(0, 1000, size=(600, 600)).tolist()
+        parallel = HungarianMethod().solve(matrix, engine='auction', trace='none', workers=2)
+        jv = HungarianMethod().solve(matrix, engine='jv', trace='none')
+        self.assertEqual(parallel['total_cost'], jv['total_cost'])
+        self.assertEqual(len({j for _, j in parallel['assignment']}), 600)
+
+
+class TestWarmStart(unittest.TestCase):
+    """Unit tests untuk warm start dari dual dan assignment sebelumnya"""
+    
+    def test_result_exposes_duals(self):
+        """Test dual jv feasible dan tight pada assignment"""
+        matrix = np.random.default_rng(10).integers(0, 50, size=(6, 9))
+        result = HungarianMethod().solve(matrix.tolist(), engine='jv')
+        u = np.array(result['duals']['u'])
+        v = np.array(result['duals']['v'])
+        reduced = matrix - u[:, None] - v[None, :]
+        self.assertGreaterEqual(reduced.min(), -1e-9)
+        for row, col in result['assignment']:
+            self.assertAlmostEqual(reduced[row, col], 0.0)
+            
+    def test_warm_start_after_changed_rows(self):
+        """Test re-solve dengan warm start sama dengan solve dari awal"""
+        rng = np.random.default_rng(11)
+        for shape in [(8, 8), (5, 9), (9, 5)]:
+            for maximize in (False, True):
+                matrix = rng.integers(0, 40, size=shape)
+                previous = HungarianMethod().solve(matrix.tolist(), maximize, engine='jv')
+                matrix[rng.choice(shape[0], 2, replace=False)] = rng.integers(0, 40, size=(2, shape[1]))
+                warm = HungarianMethod().solve(matrix.tolist(), maximize, warm_start=previous)
+                cold = HungarianMethod().solve(matrix.tolist(), maximize, engine='jv')
+                self.assertEqual(warm['total_cost'], cold['total_cost'])
+                
+    def test_warm_start_shape_mismatch(self):
+        """Test warm start dengan ukuran dual berbeda ditolak"""
+        previous = HungarianMethod().solve([[1, 2], [3, 4]], engine='jv')
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve([[1, 2, 3], [4, 5, 6], [7, 8, 9]], warm_start=previous)
+
+
+class TestCertificate(unittest.TestCase):
+    """Unit tests untuk sertifikat dual dan verify()"""
+    
+    def test_certificate_from_every_engine(self):
+        """Test dual dari setiap engine lolos verify (termasuk tidak seimbang)"""
+        rng = np.random.default_rng(12)
+        for shape in [(5, 5), (4, 7), (7, 4)]:
+            matrix = rng.integers(0, 30, size=shape).tolist()
+            for engine in ('classic', 'jv', 'auction'):
+                for maximize in (False, True):
+                    result = HungarianMethod().solve(matrix, maximize, engine=engine, certificate=True)
+                    check = verify(matrix, result['assignment'], result['duals'], maximize)
+                    self.assertTrue(check['is_optimal'], (engine, shape, check['errors']))
+                    self.assertAlmostEqual(check['dual_bound'], result['total_cost'])
+                    
+    def test_certificate_negative_costs(self):
+        """Test sertifikat untuk biaya yang semuanya negatif (juga maksimisasi)"""
+        rng = np.random.default_rng(14)
+        for shape in [(5, 5), (4, 6), (6, 4)]:
+            matrix = (-rng.integers(1, 30, size=shape)).tolist()
+            expected = {maximize: HungarianMethod().solve(matrix, maximize, engine='jv')['total_cost']
+                        for maximize in (False, True)}
+            for engine in ('classic', 'jv'):
+                for maximize in (False, True):
+                    result = HungarianMethod().solve(matrix, maximize, engine=engine, certificate=True)
+                    self.assertEqual(result['total_cost'], expected[maximize], (engine, shape, maximize))
+                    check = verify(matrix, result['assignment'], result['duals'], maximize)
+                    self.assertTrue(check['is_optimal'], (engine, shape, maximize, check['errors']))
+                    self.assertAlmostEqual(check['dual_bound'], result['total_cost'])
+                    
+    def test_certificate_sparse(self):
+        """Test sertifikat input sparse diperiksa hanya pada edge"""
+        sparse = SparseCostMatrix.from_edges([(0, 0, 4), (0, 1, 1), (1, 0, 2), (1, 2, 6), (2, 1, 3), (2, 2, 5)])
+        result = HungarianMethod().solve(sparse, certificate=True)
+        self.assertTrue(verify(sparse, result['assignment'], result['duals'])['is_optimal'])
+        
+    def test_verify_rejects_suboptimal_assignment(self):
+        """Test assignment yang tidak optimal ditolak"""
+        matrix = [[4, 1, 3], [2, 0, 5], [3, 2, 2]]
+        result = HungarianMethod().solve(matrix, engine='jv')
+        check = verify(matrix, [(0, 0), (1, 1), (2, 2)], result['duals'])
+        self.assertFalse(check['is_optimal'])
+        self.assertEqual(check['total_cost'], 6.0)
+        self.assertFalse(verify(matrix, [(0, 1), (1, 1), (2, 2)], result['duals'])['is_optimal'])
+
+
+class TestDtypeModes(unittest.TestCase):
+    """Unit tests untuk mode dtype integer dan float32"""
+    
+    def test_dtype_modes_match_float64(self):
+        """Test semua dtype memberikan biaya optimal yang sama"""
+        matrix = np.random.default_rng(13).integers(0, 100, size=(7, 5)).tolist()
+        expected = HungarianMethod().solve(matrix, engine='jv')['total_cost']
+        for engine in ('classic', 'jv'):
+            for dtype in ('auto', 'int32', 'int64', 'float32'):
+                result = HungarianMethod().solve(matrix, engine=engine, dtype=dtype)
+                self.assertEqual(result['total_cost'], expected, (engine, dtype))
+                
+    def test_integer_working_matrix(self):
+        """Test matriks kerja tetap integer dan auto memilih int32"""
+        hungarian = HungarianMethod()
+        hungarian.solve([[4, 1, 3], [2, 0, 5], [3, 2, 2]], dtype='auto')
+        self.assertEqual(hungarian.cost_matrix.dtype, np.int32)
+        hungarian.solve([[4.5, 1, 3], [2, 0, 5], [3, 2, 2]], dtype='auto')
+        self.assertEqual(hungarian.cost_matrix.dtype, np.float64)
+        
+    def test_integer_dtype_rejects_invalid_values(self):
+        """Test nilai pecahan atau terlalu besar ditolak untuk dtype integer"""
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve([[1.5, 2], [3, 4]], dtype='int32')
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve([[2 ** 31, 2], [3, 4]], dtype='int32')
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve([[1, 2], [3, 4]], dtype='int8')
+
+
+class TestMemmapInput(unittest.TestCase):
+    """Unit tests untuk input ndarray / memmap (.npy dan biner mentah)"""
+    
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.matrix = np.random.default_rng(14).integers(0, 100, size=(6, 8)).astype(float)
+        self.expected = HungarianMethod().solve(self.matrix.tolist(), engine='jv')['total_cost']
+        
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+        
+    def test_solve_npy_memmap_without_copy(self):
+        """Test .npy read-only memmap diselesaikan tanpa menyalin input"""
+        path = os.path.join(self.tmpdir, 'matrix.npy')
+        np.save(path, self.matrix)
+        matrix = DataProcessor.read_npy_file(path)
+        self.assertIsInstance(matrix, np.memmap)
+        self.assertTrue(DataProcessor.validate_matrix(matrix)['is_valid'])
+        for engine in ('classic', 'jv'):
+            result = HungarianMethod().solve(matrix, engine=engine)
+            self.assertEqual(result['total_cost'], self.expected)
+            self.assertTrue(np.shares_memory(result['original_matrix'], matrix))
+            self.assertFalse(result['original_matrix'].flags.writeable)
+            
+    def test_solve_raw_binary_memmap(self):
+        """Test file biner mentah dibuka dengan shape dan dtype"""
+        path = os.path.join(self.tmpdir, 'matrix.bin')
+        self.matrix.astype(np.float32).tofile(path)
+        matrix = DataProcessor.read_binary_file(path, self.matrix.shape, 'float32')
+        result = HungarianMethod().solve(matrix, engine='jv', dtype='auto')
+        self.assertEqual(result['total_cost'], self.expected)
+        
+    def test_read_npy_rejects_non_matrix(self):
+        """Test file .npy yang bukan matriks 2 dimensi ditolak"""
+        path = os.path.join(self.tmpdir, 'vector.npy')
+        np.save(path, np.arange(5))
+        with self.assertRaises(ValueError):
+            DataProcessor.read_npy_file(path)
+
+
+class TestNdarrayInput(unittest.TestCase):
+    """Unit tests untuk jalur input ndarray tanpa salinan"""
+    
+    def test_ndarray_input_is_not_modified(self):
+        """Test input ndarray hanya dibaca lewat view read-only"""
+        matrix = np.random.default_rng(17).integers(0, 50, size=(6, 6)).astype(float)
+        before = matrix.copy()
+        for engine in ('classic', 'jv', 'auction'):
+            result = HungarianMethod().solve(matrix, True, engine=engine)
+            np.testing.assert_array_equal(matrix, before)
+            self.assertTrue(np.shares_memory(result['original_matrix'], matrix))
+            self.assertFalse(result['original_matrix'].flags.writeable)
+            self.assertEqual(result['total_cost'],
+                             HungarianMethod().solve(before.tolist(), True, engine='jv')['total_cost'])
+            
+    def test_overwrite_input(self):
+        """Test overwrite_input memakai input sebagai matriks kerja dengan biaya yang sama"""
+        rng = np.random.default_rng(18)
+        for shape in [(6, 6), (4, 7), (7, 4)]:
+            for engine in ('classic', 'jv', 'auction'):
+                for maximize in (False, True):
+                    matrix = rng.integers(0, 50, size=shape).astype(float)
+                    expected = HungarianMethod().solve(matrix.tolist(), maximize, engine='jv')['total_cost']
+                    result = HungarianMethod().solve(matrix, maximize, engine=engine, overwrite_input=True)
+                    self.assertEqual(result['total_cost'], expected, (shape, engine, maximize))
+                    self.assertIsNone(result['original_matrix'])
+                    
+    def test_overwrite_input_requires_matching_dtype(self):
+        """Test input dengan dtype berbeda tetap disalin meskipun overwrite_input"""
+        matrix = np.array([[4, 1], [2, 3]])
+        result = HungarianMethod().solve(matrix, overwrite_input=True)
+        np.testing.assert_array_equal(matrix, [[4, 1], [2, 3]])
+        self.assertEqual(result['total_cost'], 3)
+
+
+class TestKBest(unittest.TestCase):
+    """Unit tests untuk k assignment terbaik (algoritma Murty)"""
+    
+    def test_k_best_matches_brute_force(self):
+        """Test k solusi terbaik sama dengan enumerasi semua assignment"""
+        rng = np.random.default_rng(15)
+        for shape in [(4, 4), (3, 5), (5, 3)]:
+            matrix = rng.integers(0, 20, size=shape)
+            rows, cols = shape
+            if rows <= cols:
+                costs = [matrix[range(rows), perm].sum() for perm in itertools.permutations(range(cols), rows)]
+            else:
+                costs = [matrix[perm, range(cols)].sum() for perm in itertools.permutations(range(rows), cols)]
+            for maximize in (False, True):
+                solutions = solve_k_best(matrix.tolist(), 8, maximize)
+                expected = sorted(costs, reverse=maximize)[:8]
+                self.assertEqual([s['total_cost'] for s in solutions], expected)
+                self.assertEqual([s['rank'] for s in solutions], list(range(1, 9)))
+                self.assertEqual(len({tuple(s['assignment']) for s in solutions}), 8)
+                
+    def test_k_larger_than_number_of_assignments(self):
+        """Test k melebihi jumlah assignment yang ada"""
+        solutions = solve_k_best([[1, 2], [3, 4]], 5)
+        self.assertEqual([s['assignment'] for s in solutions], [[(0, 0), (1, 1)], [(0, 1), (1, 0)]])
+        with self.assertRaises(ValueError):
+            solve_k_best([[1, 2], [3, 4]], 0)
+
+
+class TestBottleneck(unittest.TestCase):
+    """Unit tests untuk objektif bottleneck (min-max)"""
+    
+    def test_bottleneck_matches_brute_force(self):
+        """Test biaya terburuk minimum sama dengan enumerasi (juga tidak seimbang dan sparse)"""
+        rng = np.random.default_rng(16)
+        for shape in [(5, 5), (3, 6), (6, 3)]:
+            matrix = rng.integers(0, 30, size=shape)
+            rows, cols = shape
+            if rows <= cols:
+                chosen = [matrix[range(rows), perm] for perm in itertools.permutations(range(cols), rows)]
+            else:
+                chosen = [matrix[perm, range(cols)] for perm in itertools.permutations(range(rows), cols)]
+            edges = [(i, j, matrix[i, j]) for i in range(rows) for j in range(cols)]
+            for maximize in (False, True):
+                expected = max(c.min() for c in chosen) if maximize else min(c.max() for c in chosen)
+                for source in (matrix.tolist(), SparseCostMatrix.from_edges(edges, shape)):
+                    result = HungarianMethod().solve(source, maximize, objective='bottleneck')
+                    self.assertEqual(result['bottleneck_value'], expected)
+                    self.assertEqual(len({j for _, j in result['assignment']}), min(shape))
+                    costs = [matrix[i, j] for i, j in result['assignment']]
+                    self.assertEqual(min(costs) if maximize else max(costs), expected)
+                    self.assertEqual(result['total_cost'], sum(costs))
+                    
+    def test_bottleneck_options(self):
+        """Test objektif tidak dikenal dan kombinasi yang tidak didukung ditolak"""
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve([[1, 2], [3, 4]], objective='median')
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve([[1, 2], [3, 4]], objective='bottleneck', certificate=True)
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve(SparseCostMatrix.from_edges([(0, 0, 1), (1, 0, 2)], (2, 2)),
+                                    objective='bottleneck')
+
+
+class TestSharedValidation(unittest.TestCase):
+    """Unit tests untuk validasi satu pass yang dipakai API dan solver"""
+    
+    def test_valid_list_converted_once(self):
+        """Test list valid dikonversi ke array dan info ukuran diisi"""
+        array, validation = DataProcessor.prepare_matrix([[1, '2'], [3.5, 4], [5, 6]])
+        self.assertTrue(validation['is_valid'])
+        self.assertEqual(validation['info']['rows'], 3)
+        np.testing.assert_array_equal(array, [[1, 2], [3.5, 4], [5, 6]])
+        result = HungarianMethod().solve(array, engine='jv')
+        self.assertEqual(result['total_cost'], 5)
+        
+    def test_errors_are_capped(self):
+        """Test ribuan sel non-numerik hanya menghasilkan pesan terbatas"""
+        matrix = [['x'] * 100 for _ in range(100)]
+        array, errors = validate_matrix(matrix, max_errors=5)
+        self.assertIsNone(array)
+        self.assertEqual(len(errors), 6)
+        self.assertIn('baris 1, kolom 1', errors[0])
+        self.assertIn('10000 total', errors[-1])
+        
+    def test_ragged_and_non_finite(self):
+        """Test baris ragged, None, dan NaN ditolak dengan pesan per sel"""
+        self.assertIn('Baris 2 memiliki 3 kolom', validate_matrix([[1, 2], [3, 4, 5]])[1][0])
+        self.assertIn('kolom 2', validate_matrix([[1, None], [3, 4]])[1][0])
+        self.assertIn('baris 2', validate_matrix([[1, 2], [float('nan'), 4]])[1][0])
+        self.assertIn('kolom 1', validate_matrix([[[1], 2], [3, 4]])[1][0])
+        self.assertEqual(validate_matrix([])[1], ["Matriks kosong"])
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve(np.array([[1.0, np.inf], [2.0, 3.0]]))
+
+
+class TestAnytimeSolve(unittest.TestCase):
+    """Unit tests untuk solve dengan time_budget_ms dan batas dual"""
+    
+    def setUp(self):
+        self.matrix = np.random.default_rng(19).integers(0, 100, size=(40, 40)).astype(float)
+        
+    def test_exhausted_budget_returns_feasible_assignment(self):
+        """Test budget yang habis tetap memberi assignment lengkap dengan batas valid"""
+        for shape in [(40, 40), (30, 40), (40, 30)]:
+            matrix = self.matrix[:shape[0], :shape[1]]
+            for maximize in (False, True):
+                optimum = HungarianMethod().solve(matrix, maximize, engine='jv')['total_cost']
+                for engine in ('classic', 'jv'):
+                    result = HungarianMethod().solve(matrix, maximize, engine=engine, trace='none',
+                                                     time_budget_ms=1e-6)
+                    pairs = np.array(result['assignment'])
+                    self.assertEqual(len(pairs), min(shape))
+                    self.assertEqual(len(set(pairs[:, 0])), len(pairs))
+                    self.assertEqual(len(set(pairs[:, 1])), len(pairs))
+                    cost, bound = result['total_cost'], result['dual_bound']
+                    if maximize:
+                        self.assertLessEqual(cost, optimum + 1e-9)
+                        self.assertGreaterEqual(bound, optimum - 1e-9)
+                    else:
+                        self.assertGreaterEqual(cost, optimum - 1e-9)
+                        self.assertLessEqual(bound, optimum + 1e-9)
+                    self.assertAlmostEqual(result['optimality_gap'], abs(cost - bound))
+                    
+    def test_generous_budget_is_optimal(self):
+        """Test budget yang cukup memberi solusi optimal dengan gap nol"""
+        optimum = HungarianMethod().solve(self.matrix, engine='jv')['total_cost']
+        for engine in ('classic', 'jv'):
+            result = HungarianMethod().solve(self.matrix, engine=engine, time_budget_ms=60000)
+            self.assertFalse(result['timed_out'])
+            self.assertEqual(result['total_cost'], optimum)
+            self.assertAlmostEqual(result['optimality_gap'], 0)
+        self.assertIsNone(HungarianMethod().solve(self.matrix, engine='jv')['dual_bound'])
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve(self.matrix, engine='auction', time_budget_ms=10)
+
+
+class TestApproximate(unittest.TestCase):
+    """Unit tests untuk mode approximate dengan batas bawah reduksi"""
+    
+    def test_bound_brackets_optimum(self):
+        """Test lower bound <= optimum <= biaya aproksimasi untuk berbagai bentuk"""
+        rng = np.random.default_rng(20)
+        for shape in [(30, 30), (20, 35), (35, 20), (1, 4)]:
+            matrix = rng.integers(0, 50, size=shape).astype(float)
+            for maximize in (False, True):
+                optimum = HungarianMethod().solve(matrix, maximize, engine='jv')['total_cost']
+                result = HungarianMethod().solve(matrix, maximize, approximate=True, trace='none')
+                pairs = np.array(result['assignment'])
+                self.assertEqual(len(pairs), min(shape))
+                self.assertEqual(len(set(pairs[:, 1])), len(pairs))
+                self.assertEqual(result['total_cost'], float(np.sum(matrix[pairs[:, 0], pairs[:, 1]])))
+                sign = -1 if maximize else 1
+                self.assertLessEqual(sign * result['dual_bound'], sign * optimum + 1e-9)
+                self.assertLessEqual(sign * optimum, sign * result['total_cost'] + 1e-9)
+                self.assertAlmostEqual(result['optimality_gap'],
+                                       abs(result['total_cost'] - result['dual_bound']))
+                
+    def test_two_opt_fixes_greedy_trap(self):
+        """Test perbaikan 2-opt menemukan optimum ketika greedy terjebak"""
+        # Greedy regret memberi baris 2 kolom 3 (biaya 101); satu tukar 2-opt memberi 10
+        matrix = [[0, 1, 10], [0, 5, 10], [0, 0, 100]]
+        result = HungarianMethod().solve(matrix, approximate=True)
+        self.assertEqual(result['total_cost'], 10)
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve(matrix, approximate=True, certificate=True)
+
+
+class TestComponentDecomposition(unittest.TestCase):
+    """Unit tests untuk dekomposisi komponen terhubung pada input sparse"""
+    
+    def block_edges(self, blocks, extra_cols=0):
+        """Edge blok diagonal dengan biaya acak, ditambah kolom tanpa edge"""
+        rng = np.random.default_rng(21)
+        edges, dense = [], []
+        offset_row = offset_col = 0
+        for rows, cols in blocks:
+            costs = rng.integers(1, 30, size=(rows, cols))
+            dense.append((offset_row, offset_col, costs))
+            edges += [(offset_row + i, offset_col + j, costs[i, j])
+                      for i in range(rows) for j in range(cols)]
+            offset_row += rows
+            offset_col += cols
+        shape = (offset_row, offset_col + extra_cols)
+        matrix = np.full(shape, 1e6)
+        for row, col, costs in dense:
+            matrix[row:row + costs.shape[0], col:col + costs.shape[1]] = costs
+        return SparseCostMatrix.from_edges(edges, shape), matrix
+        
+    def test_components_match_dense_solution(self):
+        """Test gabungan solusi komponen sama dengan solve dense dan sertifikatnya valid"""
+        for blocks, extra in [([(3, 3), (4, 4), (2, 2)], 0), ([(3, 4), (2, 2), (1, 3)], 2)]:
+            sparse, matrix = self.block_edges(blocks, extra)
+            expected = HungarianMethod().solve(matrix, engine='jv')['total_cost']
+            result = HungarianMethod().solve(sparse, certificate=True)
+            self.assertEqual(result['total_cost'], expected)
+            self.assertTrue(any('komponen' in step['description'] for step in result['steps']))
+            check = verify(sparse, result['assignment'], result['duals'])
+            self.assertTrue(check['is_optimal'], check['errors'])
+            
+    def test_component_without_enough_columns(self):
+        """Test komponen dengan baris lebih banyak dari kolom dilaporkan infeasible"""
+        edges = [(0, 0, 1), (1, 0, 2), (2, 1, 3), (2, 2, 1)]
+        with self.assertRaises(ValueError):
+            HungarianMethod().solve(SparseCostMatrix.from_edges(edges, (3, 3)))
+
+
+class TestAssignmentResult(unittest.TestCase):
+    """Unit tests untuk objek hasil ringkas dengan konversi JSON malas"""
+    
+    def test_permutation_and_mapping_access(self):
+        """Test assignment disimpan sebagai permutasi dan tetap dapat diakses seperti dict"""
+        matrix = [[4, 1, 3], [2, 0, 5], [3, 2, 2], [1, 6, 7]]
+        result = HungarianMethod().solve(matrix, engine='jv')
+        self.assertIsInstance(result, AssignmentResult)
+        self.assertEqual(result.col4row.dtype, np.intp)
+        self.assertEqual(len(result.col4row), 4)
+        self.assertEqual(int(np.sum(result.col4row < 0)), 1)
+        self.assertEqual(result['assignment'], [(row, int(col)) for row, col in
+                                                enumerate(result.col4row) if col >= 0])
+        self.assertEqual(result['total_cost'], result.total_cost)
+        self.assertIn('steps', result)
+        self.assertEqual(set(result.keys()), set(AssignmentResult.FIELDS))
+        with self.assertRaises(KeyError):
+            result['matrix']
+            
+    def test_to_dict_converts_requested_fields_only(self):
+        """Test to_dict hanya berisi field yang diminta"""
+        result = HungarianMethod().solve([[4, 1], [2, 3]], certificate=True)
+        self.assertEqual(result.to_dict(['total_cost']), {'total_cost': 3.0})
+        full = result.to_dict()
+        self.assertEqual(full['duals'], result['duals'])
+        self.assertIsInstance(full['steps'][0], dict)
+        with self.assertRaises(ValueError):
+            result.to_dict(['total_cost', 'matrix'])
+            
+    def test_result_usable_as_warm_start(self):
+        """Test objek hasil dapat langsung dipakai sebagai warm_start"""
+        matrix = np.random.default_rng(22).integers(0, 50, size=(8, 8)).astype(float)
+        first = HungarianMethod().solve(matrix, engine='jv')
+        matrix[2] += 5
+        expected = HungarianMethod().solve(matrix, engine='jv')['total_cost']
+        self.assertEqual(HungarianMethod().solve(matrix, warm_start=first)['total_cost'], expected)
+
+
+class TestSolveJobs(unittest.TestCase):
+    """Unit tests untuk JobManager dan progress solve"""
+    
+    def wait(self, jobs, job_id):
+        for _ in range(500):
+            status = jobs.status(job_id)
+            if status['status'] in ('done', 'error'):
+                return status
+            time.sleep(0.01)
+        self.fail('Job tidak selesai')
+        
+    def test_job_reports_result_and_progress(self):
+        """Test job selesai dengan hasil dan progress jumlah iterasi"""
+        matrix = np.random.default_rng(23).integers(0, 100, size=(30, 30)).astype(float)
+        expected = HungarianMethod().solve(matrix, engine='jv')['total_cost']
+        jobs = JobManager(workers=2)
+        ids = {engine: jobs.submit(lambda solver, e=engine: {'total_cost': solver.solve(matrix, engine=e)['total_cost']},
+                                   HungarianMethod())
+               for engine in ('classic', 'jv')}
+        for engine, job_id in ids.items():
+            status = self.wait(jobs, job_id)
+            self.assertEqual(status['status'], 'done')
+            self.assertEqual(status['result']['total_cost'], expected)
+            self.assertGreaterEqual(status['progress']['iterations'], 0)
+            
+        # Matriks rank satu selalu memerlukan iterasi garis penutup
+        solver = HungarianMethod()
+        solver.solve([[1, 2, 3], [2, 4, 6], [3, 6, 9]])
+        self.assertGreater(solver.progress['iterations'], 0)
+        self.assertIsNotNone(solver.progress['covered_lines'])
+        
+    def test_job_error_and_eviction(self):
+        """Test error dilaporkan dan job selesai tertua dibuang"""
+        jobs = JobManager(workers=1, max_jobs=2)
+        failed = jobs.submit(lambda solver: solver.solve([[1, 'x']]), HungarianMethod())
+        status = self.wait(jobs, failed)
+        self.assertEqual(status['status'], 'error')
+        self.assertIn('tidak valid', status['error'])
+        for _ in range(2):
+            self.wait(jobs, jobs.submit(lambda solver: {}, HungarianMethod()))
+        self.assertIsNone(jobs.status(failed))
+        
+    def test_pending_jobs_are_limited(self):
+        """Test job baru ditolak selama max_jobs job belum selesai"""
+        release = threading.Event()
+        jobs = JobManager(workers=1, max_jobs=2)
+        pending = [jobs.submit(lambda solver: {'released': release.wait(5)}, HungarianMethod())
+                   for _ in range(2)]
+        with self.assertRaises(JobQueueFull):
+            jobs.submit(lambda solver: {}, HungarianMethod())
+        release.set()
+        for job_id in pending:
+            self.assertEqual(self.wait(jobs, job_id)['status'], 'done')
+        self.wait(jobs, jobs.submit(lambda solver: {}, HungarianMethod()))
+
+
+class TestStepStream(unittest.TestCase):
+    """Unit tests untuk streaming langkah lewat on_step"""
+    
+    def test_streamed_steps_match_trace(self):
+        """Test langkah yang di-stream sama dengan trace biasa dan tidak disimpan"""
+        matrix = [[1, 2, 3], [2, 4, 6], [3, 6, 9]]
+        expected = HungarianMethod().solve(matrix, trace='full')
+        streamed = []
+        result = HungarianMethod().solve(matrix, trace='full', on_step=streamed.append)
+        self.assertEqual(streamed, expected['steps'])
+        self.assertEqual(result['steps'], [])
+        self.assertEqual(result['total_cost'], expected['total_cost'])
+        self.assertEqual(expand_steps(streamed)[-1]['matrix'], expand_steps(expected['steps'])[-1]['matrix'])
+
+
+class TestResultCache(unittest.TestCase):
+    """Unit tests untuk ResultCache dan summarize_steps"""
+    
+    def test_key_depends_on_content_and_direction(self):
+        """Test kunci sama untuk isi sama dan berbeda untuk maximize/dtype"""
+        matrix = np.arange(9, dtype=float).reshape(3, 3)
+        self.assertEqual(ResultCache.key(matrix), ResultCache.key(matrix.copy()))
+        self.assertEqual(ResultCache.key(matrix.T.T), ResultCache.key(np.asfortranarray(matrix)))
+        self.assertNotEqual(ResultCache.key(matrix), ResultCache.key(matrix, True))
+        self.assertNotEqual(ResultCache.key(matrix), ResultCache.key(matrix.astype(int)))
+        
+    def test_lru_by_bytes_ttl_and_counters(self):
+        """Test eviksi berdasarkan byte, kedaluwarsa, dan hit/miss"""
+        cache = ResultCache(max_bytes=100, ttl=None)
+        cache.put('a', 'A', 40)
+        cache.put('b', 'B', 40)
+        self.assertEqual(cache.get('a'), 'A')
+        cache.put('c', 'C', 40)
+        # 'b' paling lama tidak dipakai sehingga dibuang
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 'C')
+        cache.put('d', 'D', 200)
+        self.assertIsNone(cache.get('d'))
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries'], stats['bytes']), (2, 2, 2, 80))
+        
+        cache = ResultCache(ttl=0.01)
+        cache.put('a', 'A', 1)
+        time.sleep(0.02)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['entries'], 0)
+        
+    def test_summarize_full_trace(self):
+        """Test trace full yang diturunkan sama dengan trace summary"""
+        matrix = [[1, 2, 3], [2, 4, 6], [3, 6, 9]]
+        full = HungarianMethod().solve(matrix, trace='full')
+        summary = HungarianMethod().solve(matrix, trace='summary')
+        self.assertEqual(summarize_steps(full['steps']), summary['steps'])
+        self.assertGreater(full.nbytes, 0)
+
+
+class TestCalculationStore(unittest.TestCase):
+    """Unit tests untuk CalculationStore dan akses langkah per indeks"""
+    
+    def setUp(self):
+        self.spill_dir = tempfile.mkdtemp()
+        
+    def tearDown(self):
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+        
+    def test_step_random_access(self):
+        """Test satu langkah sama dengan hasil expand_steps"""
+        result = HungarianMethod().solve([[1, 2, 3], [2, 4, 6], [3, 6, 9]], trace='full')
+        expanded = expand_steps(result['steps'])
+        for index in (0, result.num_steps // 2, result.num_steps - 1):
+            self.assertEqual(result.step(index), expanded[index])
+        with self.assertRaises(IndexError):
+            result.step(result.num_steps)
+            
+    def test_spill_to_disk_and_reload(self):
+        """Test entri lama dipindah ke disk lalu dimuat kembali utuh"""
+        matrices = [np.random.default_rng(seed).integers(0, 50, size=(6, 6)).astype(float)
+                    for seed in range(3)]
+        results = [HungarianMethod().solve(matrix, trace='full') for matrix in matrices]
+        # Matriks asli hasil adalah view matriks entri sehingga hanya dihitung sekali
+        budget = results[0].nbytes
+        store = CalculationStore(max_bytes=budget, spill_dir=self.spill_dir)
+        ids = [store.add(matrix, False, result) for matrix, result in zip(matrices, results)]
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(store.stats()['spilled'], 2)
+        
+        # Direktori spill privat (0700) dan berisi .npz, bukan pickle
+        private_dirs = os.listdir(self.spill_dir)
+        self.assertEqual(len(private_dirs), 1)
+        private_dir = os.path.join(self.spill_dir, private_dirs[0])
+        self.assertEqual(os.stat(private_dir).st_mode & 0o777, 0o700)
+        self.assertTrue(all(name.endswith('.npz') for name in os.listdir(private_dir)))
+        
+        record = store.get(ids[0])
+        np.testing.assert_array_equal(record['matrix'], matrices[0])
+        self.assertEqual(record['result'].total_cost, results[0].total_cost)
+        self.assertEqual(record['result'].assignment, results[0].assignment)
+        self.assertEqual(record['result'].step(1), results[0].step(1))
+        # ETag dihitung sekali saat disimpan dan ikut dipindah ke disk
+        fresh = CalculationStore(spill=False)
+        self.assertEqual(record['etag'], fresh.get(fresh.add(matrices[0], False, results[0]))['etag'])
+        self.assertNotEqual(record['etag'], store.get(ids[2])['etag'])
+        self.assertIsNone(store.get(12345))
+        
+    def test_without_spill_drops_old_entries(self):
+        """Test tanpa spill entri lama dibuang"""
+        store = CalculationStore(max_bytes=1, spill=False)
+        first = store.add(np.zeros((2, 2)), False, HungarianMethod().solve([[1, 2], [3, 4]]))
+        second = store.add(np.ones((2, 2)), True, HungarianMethod().solve([[1, 2], [3, 4]], True))
+        self.assertIsNone(store.get(first))
+        self.assertTrue(store.get(second)['is_maximization'])
+
+
+class TestHeatmapRendering(unittest.TestCase):
+    """Unit tests untuk heatmap PNG sesuai ukuran matriks"""
+    
+    def test_style_scales_with_size(self):
+        """Test resolusi turun dan anotasi hilang di atas 30x30"""
+        small = Visualizer.heatmap_style((5, 5))
+        medium = Visualizer.heatmap_style((30, 20))
+        large = Visualizer.heatmap_style((31, 31))
+        self.assertTrue(small['annot'] and medium['annot'])
+        self.assertFalse(large['annot'])
+        self.assertGreater(small['dpi'], medium['dpi'])
+        self.assertGreater(medium['dpi'], large['dpi'])
+        
+    def test_render_png(self):
+        """Test heatmap dirender sebagai PNG dengan assignment"""
+        png = Visualizer.render_heatmap_png(np.arange(9).reshape(3, 3), assignment=[(0, 2), (1, 1), (2, 0)])
+        self.assertTrue(png.startswith(b'\x89PNG'))
+
+
+class TestSolveOptions(unittest.TestCase):
+    """Unit tests untuk check_solve_options yang dipakai solve() dan API"""
+    
+    def test_time_budget_conflicts(self):
+        """Test time_budget_ms ditolak untuk auction dan bottleneck"""
+        check_solve_options('jv', 'sum', time_budget_ms=10)
+        for engine, objective, budget in [('auction', 'sum', 10), ('classic', 'bottleneck', 10),
+                                          ('jv', 'sum', 0)]:
+            with self.assertRaises(ValueError):
+                check_solve_options(engine, objective, time_budget_ms=budget)
+                
+    def test_bottleneck_conflicts(self):
+        """Test objektif bottleneck ditolak bersama certificate atau warm_start"""
+        with self.assertRaises(ValueError):
+            check_solve_options('classic', 'bottleneck', certificate=True)
+        with self.assertRaises(ValueError):
+            check_solve_options('classic', 'bottleneck', warm_start={'duals': {'u': [0], 'v': [0]}})
+            
+    def test_approximate_and_sparse_conflicts(self):
+        """Test approximate dan input sparse menolak opsi yang tidak didukung"""
+        check_solve_options('classic', 'sum', approximate=True)
+        for options in [{'certificate': True}, {'time_budget_ms': 10},
+                        {'warm_start': {'duals': {'u': [0], 'v': [0]}}}]:
+            with self.assertRaises(ValueError):
+                check_solve_options('classic', 'sum', approximate=True, **options)
+        with self.assertRaises(ValueError):
+            check_solve_options('classic', 'sum', time_budget_ms=10, sparse=True)
+            
+    def test_warm_start_conflicts(self):
+        """Test warm_start ditolak untuk auction, bentuk salah, dan ukuran dual tidak sesuai"""
+        warm_start = HungarianMethod().solve([[4, 1], [2, 3]], engine='jv')
+        check_solve_options('jv', 'sum', warm_start=warm_start, shape=(2, 2))
+        for engine, start, shape in [('auction', warm_start, (2, 2)), ('jv', [1, 2], None),
+                                     ('jv', warm_start, (3, 3)), ('jv', {'duals': [0, 0]}, (2, 2))]:
+            with self.assertRaises(ValueError):
+                check_solve_options(engine, 'sum', warm_start=start, shape=shape)
+                
+    def test_resolve_dtype(self):
+        """Test dtype integer ditolak untuk biaya pecahan atau terlalu besar"""
+        self.assertEqual(resolve_dtype(np.array([[1.0, 2.0], [3.0, 4.0]]), 'auto'), 'int32')
+        self.assertEqual(resolve_dtype(np.array([[1.5, 2.0], [3.0, 4.0]]), 'auto'), 'float64')
+        with self.assertRaises(ValueError):
+            resolve_dtype(np.array([[1.5, 2.0], [3.0, 4.0]]), 'int32')
+        with self.assertRaises(ValueError):
+            resolve_dtype(np.array([[2.0 ** 31, 0.0], [0.0, 1.0]]), 'int32')
+
 if __name__ == '__main__':
     # Setup test suite
     unittest.main(verbosity=2)
\ No newline at end of file